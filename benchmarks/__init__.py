@@ -0,0 +1 @@
+"""Performance benchmarks of loading, saving, filtering and sorting a synthetic fleet."""
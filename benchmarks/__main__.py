@@ -0,0 +1,95 @@
+"""Entrance point of the benchmark suite.
+
+    python -m benchmarks run [--scales small,medium] [--cases ...] [--repeat 5] [--output results.json]
+    python -m benchmarks compare BASELINE RESULTS [--threshold 0.25]
+    python -m benchmarks generate PATH [--cars 10] [--collections 4] [--depth 2] [--components 4] [--entries 25]
+    python -m benchmarks codecs [--scale medium] [--repeat 5] [--output codecs.json]
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+
+from benchmarks.codec_comparison import compare_codecs
+from benchmarks.fleet_generator import FleetSpec, SCALES, DEFAULT_SCALES, generate_fleet
+from benchmarks.runner import run_benchmarks, save_results, load_timings, compare_results
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Measure how loading, saving, filtering and sorting scale.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Time all cases and write results to a JSON file.")
+    run_parser.add_argument('--scales', default=','.join(DEFAULT_SCALES),
+                            help=f"Comma separated scales: {', '.join(SCALES)}")
+    run_parser.add_argument('--cases', nargs='*', help="Only run cases of these names.")
+    run_parser.add_argument('--repeat', type=int, default=5, help="Timed runs of each case.")
+    run_parser.add_argument('--output', default='benchmark_results.json', help="Path of the results file.")
+
+    compare_parser = subparsers.add_parser('compare', help="Flag cases that got slower than in a baseline run.")
+    compare_parser.add_argument('baseline', help="Results file of the baseline run.")
+    compare_parser.add_argument('results', help="Results file of the run to check.")
+    compare_parser.add_argument('--threshold', type=float, default=0.25,
+                                help="Allowed slowdown of median time, 0.25 = 25%%.")
+
+    generate_parser = subparsers.add_parser('generate', help="Write a synthetic save directory.")
+    generate_parser.add_argument('path', help="Directory to write car directories to.")
+    generate_parser.add_argument('--cars', type=int, default=FleetSpec.cars)
+    generate_parser.add_argument('--collections', type=int, default=FleetSpec.collections)
+    generate_parser.add_argument('--depth', type=int, default=FleetSpec.collection_depth,
+                                 help="Length of nested collection chain under each top-level collection.")
+    generate_parser.add_argument('--components', type=int, default=FleetSpec.components,
+                                 help="Components per collection.")
+    generate_parser.add_argument('--entries', type=int, default=FleetSpec.entries, help="Entries per component.")
+    generate_parser.add_argument('--seed', type=int, default=FleetSpec.seed)
+
+    codecs_parser = subparsers.add_parser('codecs', help="Compare disk size, load and save time of save file "
+                                                          "codecs.")
+    codecs_parser.add_argument('--scale', default='medium', choices=list(SCALES))
+    codecs_parser.add_argument('--repeat', type=int, default=5, help="Timed runs of loading and saving.")
+    codecs_parser.add_argument('--output', help="Also write results to this JSON file.")
+
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    args = create_parser().parse_args(argv)
+
+    match args.command:
+        case 'run':
+            scales = {scale: SCALES[scale] for scale in args.scales.split(',')}
+            results = run_benchmarks(scales, args.cases, args.repeat,
+                                     progress=lambda timing: print(timing.get_formatted_info()))
+            save_results(results, pathlib.Path(args.output))
+            print(f"Results saved to {args.output}")
+        case 'compare':
+            regressions = compare_results(load_timings(args.baseline), load_timings(args.results), args.threshold)
+
+            for regression in regressions:
+                print(regression.get_formatted_info())
+
+            if regressions:
+                return 1
+
+            print("No regressions")
+        case 'generate':
+            spec = FleetSpec(args.cars, args.collections, args.depth, args.components, args.entries, seed=args.seed)
+            cars = generate_fleet(spec, pathlib.Path(args.path))
+            print(f"Generated {len(cars)} cars with {spec.get_entry_count()} entries in {args.path}")
+        case 'codecs':
+            results = compare_codecs(SCALES[args.scale], args.repeat)
+
+            for result in results:
+                print(result.get_formatted_info())
+
+            if args.output:
+                with open(args.output, 'w') as file:
+                    json.dump([result.to_json() for result in results], file, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
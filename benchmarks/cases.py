@@ -0,0 +1,128 @@
+"""Benchmarked operations, each case prepares its input once and returns the function to be timed."""
+
+import contextlib
+import os
+import pathlib
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from carlogger.cli.arg_parser import ArgParser
+from carlogger.directory_manager import DirectoryManager
+from carlogger.filedata_manager import JSONFiledataManager
+from carlogger.items.car import Car
+from carlogger.items.item_filter import ItemFilter
+from carlogger.items.item_sorter import ItemSorter
+from carlogger.session import AppSession
+
+from benchmarks.fleet_generator import FleetSpec
+
+
+@dataclass
+class BenchmarkContext:
+    spec: FleetSpec
+    save_dir: pathlib.Path
+    directory_manager: DirectoryManager
+    cars: list[Car]
+
+    @classmethod
+    def load(cls, spec: FleetSpec, save_dir: pathlib.Path):
+        directory_manager = DirectoryManager(JSONFiledataManager(), save_dir)
+        return cls(spec, save_dir, directory_manager, directory_manager.load_all_car_dir())
+
+    def get_all_entries(self) -> list:
+        return [entry for car in self.cars for entry in car.get_all_entry_logs()]
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    setup: Callable[[BenchmarkContext], Callable[[], Any]]
+
+
+def run_read_command(context: BenchmarkContext, args: list[str]) -> Callable[[], Any]:
+    """Run 'carlogger read ...' against the synthetic save directory with console output discarded."""
+    parser = ArgParser()
+    parser.setup_args()
+    raw_args = ['carlogger', *args]
+    parsed_args = parser.parse_args(args)
+    subparser_type = parser.get_subparser_type(raw_args)
+
+    def run():
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            AppSession(DirectoryManager(JSONFiledataManager(), context.save_dir)) \
+                .execute_console_args(subparser_type, parsed_args, raw_args)
+
+    return run
+
+
+def read_case(name: str, *args: str) -> BenchmarkCase:
+    def setup(context: BenchmarkContext):
+        car_name = context.cars[0].car_info.name
+        return run_read_command(context, [arg.format(car=car_name) for arg in args])
+
+    return BenchmarkCase(name, setup)
+
+
+def setup_load(context: BenchmarkContext):
+    return context.directory_manager.load_all_car_dir
+
+
+def setup_save(context: BenchmarkContext):
+    def save():
+        for car in context.cars:
+            context.directory_manager.update_car_directory(car)
+
+    return save
+
+
+def setup_get_all_entry_logs(context: BenchmarkContext):
+    return lambda: [car.get_all_entry_logs() for car in context.cars]
+
+
+def setup_filter(filters: list[str]):
+    def setup(context: BenchmarkContext):
+        entries = context.get_all_entries()
+        return lambda: ItemFilter().filter_items(entries, filters)
+
+    return setup
+
+
+def setup_sort(sort_method: str, scheduled=False):
+    def setup(context: BenchmarkContext):
+        if scheduled:
+            items = [entry for car in context.cars for entry in car.get_all_scheduled_entry_logs()]
+        else:
+            items = context.get_all_entries()
+
+        return lambda: ItemSorter(items, sort_method).get_sorted_list()
+
+    return setup
+
+
+def setup_sort_cars(context: BenchmarkContext):
+    return lambda: ItemSorter(context.cars, 'latest').get_sorted_list()
+
+
+CASES = [BenchmarkCase('load_all_car_dir', setup_load),
+         BenchmarkCase('update_car_directory', setup_save),
+         BenchmarkCase('get_all_entry_logs', setup_get_all_entry_logs),
+         BenchmarkCase('filter_entries_mileage', setup_filter(['mileage>50000'])),
+         BenchmarkCase('filter_entries_category_desc', setup_filter(['category=swap', 'desc=Synthetic'])),
+         BenchmarkCase('filter_entries_tag', setup_filter(['tag=warranty'])),
+         BenchmarkCase('sort_entries_latest', setup_sort('latest')),
+         BenchmarkCase('sort_entries_mileage', setup_sort('mileage')),
+         BenchmarkCase('sort_scheduled_time_remaining', setup_sort('time_remaining', scheduled=True)),
+         BenchmarkCase('sort_cars_latest', setup_sort_cars),
+         read_case('read_car', 'read', 'car'),
+         read_case('read_car_filtered', 'read', 'car', '--filter', 'name={car}'),
+         read_case('read_collection', 'read', 'collection', '--car', '{car}'),
+         read_case('read_component', 'read', 'component', '--car', '{car}'),
+         read_case('read_entry', 'read', 'entry', '--car', '{car}'),
+         read_case('read_entry_filtered', 'read', 'entry', '--car', '{car}', '--filter', 'mileage>50000')]
+
+
+def get_cases(names: list[str] = None) -> list[BenchmarkCase]:
+    if not names:
+        return CASES
+    return [case for case in CASES if case.name in names]
@@ -0,0 +1,67 @@
+"""Compare disk size, load and save time of every save file codec on the same synthetic fleet."""
+
+import os
+import pathlib
+import statistics
+import tempfile
+
+from dataclasses import dataclass, asdict
+
+from carlogger.directory_manager import DirectoryManager
+from carlogger.filedata_manager import JSONFiledataManager, Durability
+from carlogger.serialization import CODECS
+
+from benchmarks.fleet_generator import FleetSpec, generate_fleet
+from benchmarks.runner import measure
+
+
+@dataclass
+class CodecResult:
+    codec: str
+    size: int
+    load: float
+    save: float
+
+    def get_formatted_info(self) -> str:
+        return f"{self.codec:<14} {self.size / 1024:10.1f} KiB  load {self.load * 1000:10.3f} ms  " \
+               f"save {self.save * 1000:10.3f} ms"
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+def get_directory_size(path: pathlib.Path) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+def run_codec(spec: FleetSpec, save_dir: pathlib.Path, codec: str, repeat: int) -> CodecResult:
+    """Generate the fleet, convert it to the codec and time loading and saving all of it.\n
+    Saves go through a fresh data manager every time so that no write is skipped as unchanged, and without fsync
+    so that only serialization and writing are compared."""
+    def create_directory_manager() -> DirectoryManager:
+        return DirectoryManager(JSONFiledataManager(Durability.NONE, codec), save_dir)
+
+    generate_fleet(spec, save_dir)
+    cars = create_directory_manager().load_all_car_dir()
+
+    def save():
+        directory_manager = create_directory_manager()
+
+        for car in cars:
+            directory_manager.update_car_directory(car)
+
+    save()
+
+    return CodecResult(codec, get_directory_size(save_dir),
+                       statistics.median(measure(create_directory_manager().load_all_car_dir, repeat)),
+                       statistics.median(measure(save, repeat)))
+
+
+def compare_codecs(spec: FleetSpec, repeat: int = 5, codecs: list[str] = None) -> list[CodecResult]:
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="carlogger_codecs_") as root:
+        for codec in codecs or list(CODECS):
+            results.append(run_codec(spec, pathlib.Path(root).joinpath(codec), codec, repeat))
+
+    return results
@@ -0,0 +1,139 @@
+"""Deterministic synthetic save directory generator."""
+
+import contextlib
+import datetime
+import io
+import pathlib
+import random
+import uuid
+
+from dataclasses import dataclass, asdict
+
+from carlogger.directory_manager import DirectoryManager
+from carlogger.filedata_manager import JSONFiledataManager
+from carlogger.items.car import Car
+from carlogger.items.car_component import CarComponent
+from carlogger.items.car_info import CarInfo
+from carlogger.items.component_collection import ComponentCollection
+from carlogger.items.entry_category import EntryCategory
+from carlogger.util import format_tuple_to_date_string
+
+MANUFACTURERS = [('Skoda', 'Octavia'), ('Toyota', 'Corolla'), ('Volvo', 'V70'), ('Mazda', 'MX-5'), ('Fiat', 'Panda')]
+COLLECTION_NAMES = ['Engine', 'Brakes', 'Suspension', 'Body', 'Electrics', 'Interior', 'Exhaust', 'Cooling']
+COMPONENT_NAMES = ['Spark Plug', 'Oil Filter', 'Pads', 'Disc', 'Shock', 'Bulb', 'Belt', 'Pump', 'Hose', 'Wiper']
+TAGS = ['warranty', 'diy', 'workshop', 'oem', 'aftermarket', 'recall', 'inspection']
+BASE_DATE = datetime.date(2015, 1, 1)
+
+
+@dataclass(frozen=True)
+class FleetSpec:
+    cars: int = 5
+    collections: int = 3
+    collection_depth: int = 1
+    components: int = 3
+    entries: int = 20
+    scheduled_entries: int = 2
+    seed: int = 0
+
+    def get_entry_count(self) -> int:
+        return self.cars * self.collections * self.collection_depth * self.components * self.entries
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+SCALES = {'small': FleetSpec(cars=3, collections=2, components=3, entries=10),
+          'medium': FleetSpec(cars=10, collections=4, collection_depth=2, components=4, entries=25),
+          'large': FleetSpec(cars=25, collections=6, collection_depth=2, components=5, entries=50)}
+
+# 'large' takes minutes with the current item filter, run it explicitly with '--scales large'
+DEFAULT_SCALES = ['small', 'medium']
+
+
+def date_from_offset(days: int) -> str:
+    date = BASE_DATE + datetime.timedelta(days=days)
+    return format_tuple_to_date_string((date.day, date.month, date.year))
+
+
+class FleetGenerator:
+    """Builds cars from a FleetSpec through the regular item API and saves them with DirectoryManager.\n
+    All names, dates, mileages and item and entry ids are drawn from a seeded random generator, so the same spec always
+    produces the same save directory. Every top-level collection gets a chain of 'collection_depth' nested
+    collections and every collection holds 'components' components."""
+    def __init__(self, spec: FleetSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+
+    def generate(self, save_dir: pathlib.Path) -> list[Car]:
+        save_dir = pathlib.Path(save_dir)
+        save_dir.mkdir(parents=True, exist_ok=True)
+        directory_manager = DirectoryManager(JSONFiledataManager(), save_dir)
+        cars = []
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for car_index in range(self.spec.cars):
+                car = self.create_car(car_index, save_dir)
+                directory_manager.create_car_directory(car)
+                directory_manager.update_car_directory(car)
+                cars.append(car)
+
+        return cars
+
+    def create_car(self, car_index: int, save_dir: pathlib.Path) -> Car:
+        manufacturer, model = self.rng.choice(MANUFACTURERS)
+        car_info = CarInfo(manufacturer, model, year=self.rng.randint(1995, 2023), mileage=0,
+                           name=f"{manufacturer}_{model}_{car_index:04d}", custom_info={'vin': self._random_id()[:17]})
+        car = Car(car_info, path=save_dir.joinpath(car_info.name))
+
+        for collection_index in range(self.spec.collections):
+            parent = None
+
+            for depth in range(self.spec.collection_depth):
+                name = f"{COLLECTION_NAMES[collection_index % len(COLLECTION_NAMES)]}_{collection_index}_{depth}"
+                collection = car.create_nested_collection(name, parent.name) if parent else car.create_collection(name)
+                collection.id = self._random_id()
+                self.fill_collection(collection)
+                parent = collection
+
+        car_info.mileage = max([component.current_mileage for component in car.get_all_components()] + [0])
+        return car
+
+    def fill_collection(self, collection: ComponentCollection):
+        for component_index in range(self.spec.components):
+            name = f"{COMPONENT_NAMES[component_index % len(COMPONENT_NAMES)]}_{component_index}"
+            component = collection.create_component(name, desc=f"Synthetic component {component_index}")
+            component.id = self._random_id()
+            self.fill_component(component)
+
+    def fill_component(self, component: CarComponent):
+        day, mileage = self.rng.randint(0, 365), self.rng.randint(0, 50000)
+
+        for _ in range(self.spec.entries):
+            day += self.rng.randint(1, 60)
+            mileage += self.rng.randint(50, 3000)
+            component.create_entry_from_file({'desc': f"Synthetic entry {self.rng.randint(0, 10 ** 6)}",
+                                              'date': date_from_offset(day),
+                                              'mileage': mileage,
+                                              'category': self.rng.choice(EntryCategory.get_categories()),
+                                              'tags': self.rng.sample(TAGS, self.rng.randint(0, 2)),
+                                              'id': self._random_id(),
+                                              'custom_info': {'cost': self.rng.randint(10, 2000)}})
+
+        for index in range(self.spec.scheduled_entries):
+            rule = 'date' if index % 2 == 0 else 'mileage'
+            component.create_scheduled_entry_from_file({'desc': f"Synthetic scheduled entry {index}",
+                                                        'date': date_from_offset(day + self.rng.randint(1, 365)),
+                                                        'mileage': mileage + self.rng.randint(1000, 20000),
+                                                        'category': 'check',
+                                                        'tags': [],
+                                                        'id': self._random_id(),
+                                                        'frequency': self.rng.choice([30, 90, 365, 5000, 15000]),
+                                                        'repeating': True,
+                                                        'rule': rule})
+
+    def _random_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+
+def generate_fleet(spec: FleetSpec, save_dir: pathlib.Path) -> list[Car]:
+    return FleetGenerator(spec).generate(save_dir)
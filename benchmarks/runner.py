@@ -0,0 +1,127 @@
+"""Time benchmark cases at several fleet scales, store results as JSON and compare them against a baseline."""
+
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+from dataclasses import dataclass, asdict
+from typing import Callable
+
+from benchmarks.cases import BenchmarkCase, BenchmarkContext, get_cases
+from benchmarks.fleet_generator import FleetSpec, SCALES, DEFAULT_SCALES, generate_fleet
+
+RESULTS_VERSION = 1
+
+
+@dataclass
+class Timing:
+    scale: str
+    case: str
+    min: float
+    median: float
+    mean: float
+    runs: int
+
+    def get_key(self) -> tuple[str, str]:
+        return self.scale, self.case
+
+    def get_formatted_info(self) -> str:
+        return f"{self.scale:<8} {self.case:<32} min {self.min * 1000:10.3f} ms  " \
+               f"median {self.median * 1000:10.3f} ms  ({self.runs} runs)"
+
+
+@dataclass
+class Regression:
+    baseline: Timing
+    current: Timing
+
+    @property
+    def ratio(self) -> float:
+        return self.current.median / self.baseline.median if self.baseline.median else float('inf')
+
+    def get_formatted_info(self) -> str:
+        return f"REGRESSION: {self.current.scale}/{self.current.case} median " \
+               f"{self.baseline.median * 1000:.3f} ms -> {self.current.median * 1000:.3f} ms " \
+               f"({(self.ratio - 1) * 100:+.1f}%)"
+
+
+def measure(func: Callable, repeat: int = 5) -> list[float]:
+    """Call func 'repeat' times after one warm-up call and return duration of each call in seconds."""
+    func()
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def run_case(case: BenchmarkCase, context: BenchmarkContext, scale: str, repeat: int) -> Timing:
+    durations = measure(case.setup(context), repeat)
+    return Timing(scale, case.name, min(durations), statistics.median(durations), statistics.fmean(durations),
+                  len(durations))
+
+
+def run_benchmarks(scales: dict[str, FleetSpec] = None, case_names: list[str] = None, repeat: int = 5,
+                   progress: Callable[[Timing], None] = None) -> dict:
+    """Generate a save directory for every scale in a temporary directory and time all cases against it."""
+    scales = scales or {scale: SCALES[scale] for scale in DEFAULT_SCALES}
+    timings = []
+
+    for scale, spec in scales.items():
+        with tempfile.TemporaryDirectory(prefix=f"carlogger_bench_{scale}_") as save_dir:
+            save_dir = pathlib.Path(save_dir)
+            generate_fleet(spec, save_dir)
+            context = BenchmarkContext.load(spec, save_dir)
+
+            for case in get_cases(case_names):
+                timing = run_case(case, context, scale, repeat)
+                timings.append(timing)
+
+                if progress:
+                    progress(timing)
+
+    return {'version': RESULTS_VERSION,
+            'meta': {'python': sys.version.split()[0],
+                     'platform': platform.platform(),
+                     'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                     'repeat': repeat},
+            'scales': {scale: spec.to_json() for scale, spec in scales.items()},
+            'results': [asdict(timing) for timing in timings]}
+
+
+def save_results(results: dict, path: pathlib.Path):
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+
+def load_timings(path: pathlib.Path) -> dict[tuple[str, str], Timing]:
+    with open(path, 'r') as file:
+        results = json.load(file)
+
+    return {(timing['scale'], timing['case']): Timing(**timing) for timing in results['results']}
+
+
+def compare_results(baseline: dict[tuple[str, str], Timing], current: dict[tuple[str, str], Timing],
+                    threshold: float = 0.25, min_delta: float = 0.0005) -> list[Regression]:
+    """Return cases whose median got slower than baseline by more than 'threshold' (0.25 = 25%).
+    Differences under 'min_delta' seconds are treated as noise. Cases missing from either side are skipped."""
+    regressions = []
+
+    for key, timing in current.items():
+        if not (baseline_timing := baseline.get(key)):
+            continue
+
+        if timing.median - baseline_timing.median < min_delta:
+            continue
+
+        if timing.median > baseline_timing.median * (1 + threshold):
+            regressions.append(Regression(baseline_timing, timing))
+
+    return regressions
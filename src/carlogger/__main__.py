@@ -1,34 +1,74 @@
 """Entrance point of this project"""
 
+import contextlib
 import sys
 
 from carlogger.gui.root_window import RootWindow
 from carlogger.session import AppSession
-from carlogger.cli.arg_parser import ArgParser
+from carlogger.cli.arg_parser import ArgParser, strip_global_options
 from carlogger.directory_manager import DirectoryManager
-from carlogger.filedata_manager import JSONFiledataManager
+from carlogger.filedata_manager import JSONFiledataManager, Durability
+from carlogger.metrics import METRICS
+from carlogger.profiling import CommandProfiler, is_profiling_requested
+from carlogger.tracing import TRACER
 
 
 def main(argv: list[str] = None) -> int:
-    raw_args = sys.argv
+    raw_args = strip_global_options(sys.argv)
 
-    parser = ArgParser()
-    parser.setup_args()
+    # Profiling has to start before the arguments are parsed to include parsing as well
+    profiler = CommandProfiler() if is_profiling_requested(sys.argv[1:] if argv is None else argv) else None
+    phase = profiler.phase if profiler else lambda name: contextlib.nullcontext()
 
-    parsed_args: dict = parser.parse_args(argv)
+    if profiler:
+        profiler.start()
 
-    data_manager = JSONFiledataManager()
-    directory_manager = DirectoryManager(data_manager)
-    app = AppSession(directory_manager)
+    with phase('parse'):
+        parser = ArgParser()
+        parser.setup_args()
 
-    app.execute_console_args(parser.get_subparser_type(raw_args), parsed_args, raw_args)
+        parsed_args: dict = parser.parse_args(argv)
+        subparser_type = parser.get_subparser_type(raw_args)
+
+    if parsed_args.get('trace'):
+        TRACER.enable()
+
+    with phase('setup'):
+        data_manager = JSONFiledataManager(parsed_args.get('durability') or Durability.BATCH)
+        directory_manager = DirectoryManager(data_manager)
+        app = AppSession(directory_manager)
+
+    if profiler:
+        profiler.instrument(directory_manager)
+
+    with phase('execute'), TRACER.span(f"carlogger {subparser_type}", 'command'):
+        app.execute_console_args(subparser_type, parsed_args, raw_args)
 
     if parsed_args.get('gui'):
-        app.create_gui(RootWindow())
+        with phase('gui'):
+            app.create_gui(RootWindow())
 
     if parsed_args.get('printargs'):
         print(parsed_args)
 
+    if parsed_args.get('timings'):
+        print(f"\nTimings:\n{METRICS.get_summary()}", file=sys.stderr)
+
+        if directory_manager.save_report.saves:
+            print(directory_manager.save_report.get_formatted_info(), file=sys.stderr)
+
+    if path := parsed_args.get('trace'):
+        TRACER.dump(path)
+        print(f"Trace of {len(TRACER.spans)} spans saved to {path}", file=sys.stderr)
+
+    if profiler:
+        profiler.stop()
+        print(profiler.get_report(), file=sys.stderr)
+
+        if path := parsed_args.get('profile_output'):
+            profiler.dump(path)
+            print(f"Profile saved to {path}", file=sys.stderr)
+
     return 0
 
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime
+import sys
 
 from abc import abstractmethod, ABC
 from typing import TYPE_CHECKING
@@ -11,14 +13,20 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from carlogger.session import AppSession
 
+from carlogger.const import TODAY
 from carlogger.items.car import Car
 from carlogger.items.car_info import CarInfo
 from carlogger.items.component_collection import ComponentCollection
 from carlogger.items.car_component import CarComponent
 from carlogger.items.log_entry import LogEntry
-from carlogger.items.item_filter import ItemFilter
 from carlogger.items.item_sorter import ItemSorter
-from carlogger.util import sort_key_is_attrib
+from carlogger.forecast import parse_duration
+from carlogger.metrics import METRICS
+from carlogger.migrations import Migrator, is_format_supported
+from carlogger.odometer_ingest import OdometerIngest
+from carlogger.schedule_calendar import write_ical
+from carlogger.serialization import FORMAT_VERSION
+from carlogger.util import sort_key_is_attrib, is_date, date_string_to_date
 
 
 class ArgExecutor(ABC):
@@ -104,7 +112,7 @@ class DeleteArgExecutor(ArgExecutor):
 
         # Filter entries
         if filters[0] != '*':
-            item_filter = ItemFilter()
+            item_filter = self.app_session.get_item_filter()
             entries = item_filter.filter_items(entries, filters)
 
         # Delete by index
@@ -263,7 +271,7 @@ class ReadArgExecutor(ArgExecutor):
         # Filter Cars
 
         if filters[0] != '*':
-            item_filter = ItemFilter()
+            item_filter = self.app.get_item_filter()
             all_cars = item_filter.filter_items(all_cars, filters)
 
         sort_key = self.args.get('sort') or 'latest'
@@ -301,7 +309,7 @@ class ReadArgExecutor(ArgExecutor):
         colls = car.collections
 
         if filters[0] != '*':
-            item_filter = ItemFilter()
+            item_filter = self.app.get_item_filter()
             comps = item_filter.filter_items(colls, filters)
 
         sort_key = self.args.get('sort') or 'latest'
@@ -338,7 +346,7 @@ class ReadArgExecutor(ArgExecutor):
         comps = car.get_all_components()
 
         if filters[0] != '*':
-            item_filter = ItemFilter()
+            item_filter = self.app.get_item_filter()
             comps = item_filter.filter_items(comps, filters)
 
         sort_key = self.args.get('sort') or 'latest'
@@ -368,14 +376,30 @@ class ReadArgExecutor(ArgExecutor):
         """Return list of log entries of cached car."""
         car_name = self.args.get('car')
         car = self.app.get_car_by_name(car_name)
-        entries: list[LogEntry] = car.get_all_entry_logs(include_scheduled=True)
 
-        # Filter Entries
+        if self.args.get('tag_counts'):
+            self.print_tag_counts(car.tag_index.get_tag_counts())
+            return
 
         filters = self.args.get('filters')
+        item_filter = self.app.get_item_filter()
+        tag_filters = [tags for f in filters if f != '*' and (tags := item_filter.get_filter_tags(f))]
+
+        # Tagged entries are looked up in the tag index instead of checking every entry
+        if tag_filters:
+            entries = car.tag_index.get_entries_with_any(tag_filters[0])
+
+            for tags in tag_filters[1:]:
+                ids = set().union(*[car.tag_index.get_entry_ids(tag) for tag in tags])
+                entries = [entry for entry in entries if entry.id in ids]
+
+            filters = [f for f in filters if not item_filter.get_filter_tags(f)] or ['*']
+        else:
+            entries: list[LogEntry] = car.get_all_entry_logs(include_scheduled=True)
+
+        # Filter Entries
 
         if filters[0] != '*':
-            item_filter = ItemFilter()
             entries = item_filter.filter_items(entries, filters)
 
         sort_key = self.args.get('sort') or 'latest'
@@ -401,6 +425,11 @@ class ReadArgExecutor(ArgExecutor):
         for entry in entries:
             print(entry.get_formatted_info())
 
+    def print_tag_counts(self, tag_counts: dict[str, int]):
+        """Print how many entries use each tag, most used first."""
+        for tag, count in sorted(tag_counts.items(), key=lambda x: (-x[1], x[0])):
+            print(f"{tag}: {count}")
+
 
 class UpdateArgExecutor(ArgExecutor):
     """Handles 'update' subparser for updating car, collection, component or entry log data."""
@@ -604,3 +633,309 @@ class ImportArgExecutor(ArgExecutor):
             case 'car': return 'car'
             case 'collection': return 'collection'
             case 'component': return 'component'
+
+
+class SearchArgExecutor(ArgExecutor):
+    """Handles 'search' subparser for finding items across the whole fleet."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        self.search()
+
+    def search(self):
+        text = ' '.join(self.parsed_args['text'])
+
+        self.app_session.load_all_cars()
+        hits = self.app_session.search(text, self.parsed_args.get('count') or 20)
+
+        if not hits:
+            print(f"No results for '{text}'")
+
+        for hit in hits:
+            print(hit.get_formatted_info())
+
+
+class IndexArgExecutor(ArgExecutor):
+    """Handles 'index' subparser for managing custom info indexes."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+        self.arg_func_map = {'add': self.add_index,
+                             'remove': self.remove_index,
+                             'list': self.list_indexes}
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        self.arg_func_map.get(self.parsed_args.get('index_action') or 'list')()
+
+    def add_index(self):
+        item_type, key = self.parsed_args['item_type'], self.parsed_args['key']
+
+        if self.app_session.add_custom_info_index(item_type, key, numeric=self.parsed_args.get('numeric', False)):
+            print(f"SUCCESS: Index on '{key}' of {item_type} items was added")
+        else:
+            print(f"FAIL: Index on '{key}' of {item_type} items already exists")
+
+    def remove_index(self):
+        item_type, key = self.parsed_args['item_type'], self.parsed_args['key']
+
+        if self.app_session.remove_custom_info_index(item_type, key):
+            print(f"SUCCESS: Index on '{key}' of {item_type} items was removed")
+        else:
+            print(f"FAIL: Index on '{key}' of {item_type} items was not found")
+
+    def list_indexes(self):
+        definitions = self.app_session.custom_info_indexes.definitions
+
+        if not definitions:
+            print("No custom info indexes declared")
+
+        for definition in definitions:
+            print(definition.get_formatted_info())
+
+
+class DueArgExecutor(ArgExecutor):
+    """Handles 'due' subparser for listing upcoming and overdue scheduled entries."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        self.print_due_entries()
+
+    def print_due_entries(self):
+        if car_name := self.parsed_args.get('car'):
+            self.app_session.get_car_by_name(car_name)
+        else:
+            self.app_session.load_all_cars()
+
+        due_entries = self.app_session.get_due_entries(self.parsed_args.get('count') or 5,
+                                                       overdue_only=self.parsed_args.get('overdue', False))
+
+        if not due_entries:
+            print("No overdue entries" if self.parsed_args.get('overdue') else "No scheduled entries")
+
+        for due_entry in due_entries:
+            print(due_entry.get_formatted_info())
+
+
+class IngestArgExecutor(ArgExecutor):
+    """Handles 'ingest' subparser for applying streamed odometer readings."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        self.ingest()
+
+    def ingest(self):
+        path = self.parsed_args.get('path') or '-'
+
+        self.app_session.load_all_cars()
+        odometer_ingest = OdometerIngest(self.app_session, window=self.parsed_args.get('window') or 1.0)
+
+        if path == '-':
+            stats = odometer_ingest.run(sys.stdin, follow=self.parsed_args.get('follow', False))
+        else:
+            with open(path, 'r') as file:
+                stats = odometer_ingest.run(file, follow=self.parsed_args.get('follow', False))
+
+        print(stats.get_formatted_info())
+
+
+class ForecastArgExecutor(ArgExecutor):
+    """Handles 'forecast' subparser for listing scheduled entries by projected due date."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        self.print_forecast()
+
+    def print_forecast(self):
+        within_days = None
+
+        if within := self.parsed_args.get('within'):
+            try:
+                within_days = parse_duration(within)
+            except ValueError as e:
+                print(e)
+                return
+
+        if car_name := self.parsed_args.get('car'):
+            self.app_session.get_car_by_name(car_name)
+        else:
+            self.app_session.load_all_cars()
+
+        forecast = self.app_session.get_forecast(within_days)
+
+        if not forecast.entries:
+            print("No scheduled entries" if within_days is None else f"No entries due within {within_days} days")
+
+        for forecast_entry in forecast.entries:
+            print(forecast_entry.get_formatted_info())
+
+        if forecast.unknown:
+            print(f"{len(forecast.unknown)} mileage-ruled entries can't be projected, "
+                  f"their cars lack dated mileage history")
+
+
+class CalendarArgExecutor(ArgExecutor):
+    """Handles 'calendar' subparser for listing or exporting future occurrences of scheduled entries."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        try:
+            start, end = self.get_date_range()
+        except ValueError as e:
+            print(e)
+            return
+
+        if car_name := self.parsed_args.get('car'):
+            self.app_session.get_car_by_name(car_name)
+        else:
+            self.app_session.load_all_cars()
+
+        occurrences = self.app_session.iter_calendar(start, end)
+
+        if path := self.parsed_args.get('ical'):
+            self.export_ical(occurrences, path)
+        else:
+            self.print_calendar(occurrences)
+
+    def get_date_range(self) -> tuple[datetime.date, datetime.date]:
+        from_date = self.parsed_args.get('from_date') or TODAY
+        to_date = self.parsed_args.get('to_date') or '3m'
+
+        if not is_date(from_date):
+            raise ValueError(f"Invalid date '{from_date}', expected dd-mm-yyyy")
+
+        start = date_string_to_date(from_date)
+
+        if is_date(to_date):
+            end = date_string_to_date(to_date)
+        else:
+            end = start + datetime.timedelta(days=parse_duration(to_date))
+
+        if end < start:
+            raise ValueError(f"Calendar end {to_date} is before its start {from_date}")
+
+        return start, end
+
+    def print_calendar(self, occurrences):
+        count = 0
+
+        for occurrence in occurrences:
+            print(occurrence.get_formatted_info())
+            count += 1
+
+        if not count:
+            print("No scheduled entries within this date range")
+
+    def export_ical(self, occurrences, path: str):
+        if path == '-':
+            write_ical(occurrences, sys.stdout)
+            return
+
+        with open(path, 'w', newline='') as file:
+            count = write_ical(occurrences, file)
+
+        print(f"Exported {count} events to {path}")
+
+
+class StatsArgExecutor(ArgExecutor):
+    """Handles 'stats' subparser for printing metrics recorded while loading the save directory."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        if car_name := self.parsed_args.get('car'):
+            self.app_session.get_car_by_name(car_name)
+        else:
+            self.app_session.load_all_cars()
+
+        match self.parsed_args.get('format'):
+            case 'prometheus': print(METRICS.to_prometheus(), end='')
+            case 'json': print(METRICS.to_json())
+            case _: self.print_summary()
+
+    def print_summary(self):
+        cars = self.app_session.cars
+        entries = sum(len(car.get_all_entry_logs(include_scheduled=True)) for car in cars)
+        print(f"Loaded {len(cars)} cars with {entries} entries\n")
+        print(METRICS.get_summary())
+
+
+class CodecArgExecutor(ArgExecutor):
+    """Handles 'codec' subparser for printing or changing the codec of the save directory."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        if not (codec := self.parsed_args.get('codec')):
+            print(self.app_session.directory_manager.save_format.codec)
+            return
+
+        converted = self.app_session.convert_save_codec(codec)
+        print(f"Rewrote {len(converted)} cars with '{codec}' codec")
+
+
+class MigrateArgExecutor(ArgExecutor):
+    """Handles 'migrate' subparser for upgrading the save directory format."""
+    def __init__(self, parsed_args: dict, app_session: AppSession, raw_args: list[str]):
+        self.parsed_args = parsed_args
+        self.app_session = app_session
+        self.raw_args = raw_args[1::]
+
+    def evaluate_args(self):
+        """Execute mapped functions based on passed args."""
+        version = self.app_session.directory_manager.save_format.version
+
+        if not is_format_supported(version):
+            print(f"Save directory format version {version} is newer than the supported version {FORMAT_VERSION}")
+            return
+
+        migrator = Migrator(self.app_session.directory_manager)
+        pending = migrator.get_pending()
+
+        if not pending:
+            print(f"Save directory is up to date, format version {version}")
+            return
+
+        if self.parsed_args.get('status'):
+            self.print_status(migrator, version)
+            return
+
+        self.app_session.migrate_save_directory(lambda progress: print(progress.get_formatted_info()))
+        print(f"Save directory migrated to format version {pending[-1].version}")
+
+    def print_status(self, migrator: Migrator, version: int):
+        print(f"Format version {version}, pending migrations:")
+
+        for migration in migrator.get_pending():
+            print(f"{migration.version}: {migration.description}")
+
+        if done := migrator.load_state().get('done'):
+            print(f"Interrupted run will resume, {len(done)} cars already migrated")
@@ -3,7 +3,29 @@
 import argparse
 
 from carlogger.cli.subparser import Subparser, AddSubparser, ReadSubparser, DeleteSubparser, UpdateSubparser, \
-    ImportSubparser, ExportSubparser
+    ImportSubparser, ExportSubparser, SearchSubparser, IndexSubparser, DueSubparser, IngestSubparser, \
+    ForecastSubparser, CalendarSubparser, StatsSubparser, CodecSubparser, MigrateSubparser
+from carlogger.filedata_manager import Durability
+
+GLOBAL_FLAGS = ('--printargs', '--profile', '--timings')
+GLOBAL_VALUE_OPTIONS = ('--profile-output', '--trace', '--durability')
+SUBCOMMANDS = ('add', 'read', 'delete', 'update', 'import', 'export', 'search', 'index', 'due', 'ingest', 'forecast',
+               'calendar', 'stats', 'codec', 'migrate')
+
+
+def strip_global_options(args: list[str]) -> list[str]:
+    """Remove global options along with their values from raw arguments.\n
+    Executors read raw arguments by position, global options placed before the subcommand would shift them."""
+    stripped = []
+    args = iter(args)
+
+    for arg in args:
+        if arg in GLOBAL_VALUE_OPTIONS:
+            next(args, None)
+        elif arg.split('=')[0] not in GLOBAL_FLAGS + GLOBAL_VALUE_OPTIONS:
+            stripped.append(arg)
+
+    return stripped
 
 
 class ArgParser:
@@ -29,6 +51,34 @@ class ArgParser:
                                  action='store_true',
                                  help="Print parsed arguments to the console.")
 
+        self.parser.add_argument('--profile',
+                                 action='store_true',
+                                 help="Print time spent parsing, loading, executing and saving along with peak "
+                                      "memory and the slowest functions after the command finishes.")
+
+        self.parser.add_argument('--profile-output',
+                                 type=str,
+                                 metavar="PATH",
+                                 help="Also write the profile to a file, raw cProfile data for '.prof' paths, "
+                                      "JSON summary otherwise. Implies --profile.")
+
+        self.parser.add_argument('--timings',
+                                 action='store_true',
+                                 help="Print file I/O counts, bytes and operation timings after the command "
+                                      "finishes.")
+
+        self.parser.add_argument('--trace',
+                                 type=str,
+                                 metavar="PATH",
+                                 help="Record nested session, directory, filter and sort operations and write them "
+                                      "as Chrome trace-event JSON, open it in chrome://tracing or ui.perfetto.dev.")
+
+        self.parser.add_argument('--durability',
+                                 choices=[level.value for level in Durability],
+                                 help="When saved files are fsynced: 'file' after every file, 'batch' once per "
+                                      "save cycle (default) or 'none' to leave it to the OS, ex.: for bulk imports. "
+                                      "Writes are atomic at every level.")
+
         self.setup_subparsers()
 
     def setup_subparsers(self):
@@ -38,6 +88,15 @@ class ArgParser:
         self.add_subparser(UpdateSubparser(self))
         self.add_subparser(ImportSubparser(self))
         self.add_subparser(ExportSubparser(self))
+        self.add_subparser(SearchSubparser(self))
+        self.add_subparser(IndexSubparser(self))
+        self.add_subparser(DueSubparser(self))
+        self.add_subparser(IngestSubparser(self))
+        self.add_subparser(ForecastSubparser(self))
+        self.add_subparser(CalendarSubparser(self))
+        self.add_subparser(StatsSubparser(self))
+        self.add_subparser(CodecSubparser(self))
+        self.add_subparser(MigrateSubparser(self))
 
     def add_subparser(self, subparser):
         self.subparser_obj.append(subparser)
@@ -47,21 +106,7 @@ class ArgParser:
         self.parsed_args = self.parser.parse_args(args).__dict__
         return self.parsed_args
 
-    def get_subparser_type(self, argv: list[str]) -> str:
-        if 'add' in argv:
-            return 'add'
-
-        if 'read' in argv:
-            return 'read'
-
-        if 'delete' in argv:
-            return 'delete'
-
-        if 'update' in argv:
-            return 'update'
-
-        if 'import' in argv:
-            return 'import'
-
-        if 'export' in argv:
-            return 'export'
+    def get_subparser_type(self, argv: list[str]) -> str | None:
+        """Return subcommand named by the first positional argument, words after it are only its arguments,
+        ex.: 'search add' or 'index add'."""
+        return next((arg for arg in argv if not arg.startswith('-') and arg in SUBCOMMANDS), None)
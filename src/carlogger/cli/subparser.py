@@ -5,6 +5,7 @@ import argparse
 from abc import ABC, abstractmethod
 
 from carlogger.const import TODAY
+from carlogger.serialization import CODECS
 
 
 class ParseKwargs(argparse.Action):
@@ -55,7 +56,8 @@ class ReadSubparser(Subparser):
                                      "Pass arguments as string 'key=value' pairs, separated by commas.\n"
                                      "Supports operands: '=' (equal), '<', '>', '<=' '>='\n"
                                      "Example: --filter 'date=01-01-2000' 'mileage<1000'\n"
-                                     "Also supports value ranges, ex.: 'key=lower-upper'",
+                                     "Also supports value ranges, ex.: 'key=lower-upper'\n"
+                                     "and lists of accepted values, ex.: 'tag in (warranty,recall)'",
                                 metavar='FILTER OPTIONS',
                                 dest='filters',
                                 nargs='*',
@@ -108,6 +110,11 @@ class ReadSubparser(Subparser):
                                             help="Parent car name.",
                                             required=True)
 
+        self.read_entry_parser.add_argument('--tagcounts',
+                                            action='store_true',
+                                            dest='tag_counts',
+                                            help="Print how many entries of the car use each tag instead.")
+
         self.add_sort_parser()
         self.add_filter_parser()
         self.add_count_parser()
@@ -794,3 +801,251 @@ class ExportSubparser(Subparser):
         self.add_path_arg()
         self.add_nochild_arg()
         self.add_values_arg()
+
+
+class SearchSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.search_parser = self.parser_parent.subparsers.add_parser('search',
+                                                                      help="Find cars, collections, components and "
+                                                                           "entries by name, description, tags or "
+                                                                           "custom info.",
+                                                                      formatter_class=argparse.RawTextHelpFormatter)
+
+        self.search_parser.add_argument('text',
+                                        metavar="TEXT",
+                                        help="Words to look for, partial words are matched too.",
+                                        nargs='+')
+
+        self.search_parser.add_argument('--count',
+                                        type=int,
+                                        metavar="MAX COUNT",
+                                        help="Max amount of displayed hits.",
+                                        default=20)
+
+
+class IndexSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.index_parser = self.parser_parent.subparsers.add_parser('index',
+                                                                     help="Manage secondary indexes on custom info "
+                                                                          "keys, used by '--filter' automatically.",
+                                                                     formatter_class=argparse.RawTextHelpFormatter)
+
+        self.index_subparsers = self.index_parser.add_subparsers(help="Choose index action.\n",
+                                                                 dest='index_action')
+
+        # ===== ADD INDEX ===== #
+
+        self.add_index_parser = self.index_subparsers.add_parser('add')
+
+        self.add_index_parser.add_argument('item_type',
+                                           choices=['car', 'component', 'entry'],
+                                           help="Type of items to index.")
+
+        self.add_index_parser.add_argument('key',
+                                           metavar="KEY",
+                                           help="Custom info key to index.")
+
+        self.add_index_parser.add_argument('--numeric',
+                                           action='store_true',
+                                           help="Keep values sorted as numbers to also speed up '<', '>' and "
+                                                "range filters.\nEquality-only index is created otherwise.")
+
+        # ===== REMOVE INDEX ===== #
+
+        self.remove_index_parser = self.index_subparsers.add_parser('remove')
+
+        self.remove_index_parser.add_argument('item_type',
+                                              choices=['car', 'component', 'entry'],
+                                              help="Type of indexed items.")
+
+        self.remove_index_parser.add_argument('key',
+                                              metavar="KEY",
+                                              help="Indexed custom info key.")
+
+        # ===== LIST INDEXES ===== #
+
+        self.list_index_parser = self.index_subparsers.add_parser('list')
+
+
+class DueSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.due_parser = self.parser_parent.subparsers.add_parser('due',
+                                                                   help="List scheduled entries that are due the "
+                                                                        "soonest across the whole fleet.",
+                                                                   formatter_class=argparse.RawTextHelpFormatter)
+
+        self.due_parser.add_argument('--count',
+                                     type=int,
+                                     metavar="MAX COUNT",
+                                     help="Max amount of displayed entries.",
+                                     default=5)
+
+        self.due_parser.add_argument('--overdue',
+                                     action='store_true',
+                                     help="Only list entries whose date or target mileage has already passed.")
+
+        self.due_parser.add_argument('--car',
+                                     type=str,
+                                     metavar="CAR_NAME",
+                                     help="Only list entries of this car.")
+
+
+class IngestSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.ingest_parser = self.parser_parent.subparsers.add_parser('ingest',
+                                                                      help="Update car mileage from a stream of "
+                                                                           "odometer readings.",
+                                                                      formatter_class=argparse.RawTextHelpFormatter)
+
+        self.ingest_parser.add_argument('path',
+                                        metavar="PATH",
+                                        help="CSV file with 'car,mileage' rows or JSONL file with "
+                                             "{\"car\": ..., \"mileage\": ...} objects.\n"
+                                             "Pass '-' to read from standard input.",
+                                        nargs='?',
+                                        default='-')
+
+        self.ingest_parser.add_argument('--follow',
+                                        action='store_true',
+                                        help="Keep waiting for readings appended to the file, stop with Ctrl+C.")
+
+        self.ingest_parser.add_argument('--window',
+                                        type=float,
+                                        metavar="SECONDS",
+                                        help="Readings of a car arriving within this time are merged into a single "
+                                             "update and save.",
+                                        default=1.0)
+
+
+class ForecastSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.forecast_parser = self.parser_parent.subparsers.add_parser('forecast',
+                                                                        help="Rank scheduled entries of the fleet by "
+                                                                             "projected due date, mileage-ruled "
+                                                                             "entries are projected from mileage "
+                                                                             "driven per day.",
+                                                                        formatter_class=argparse.RawTextHelpFormatter)
+
+        self.forecast_parser.add_argument('--within',
+                                          type=str,
+                                          metavar="DURATION",
+                                          help="Only list entries projected to be due within this time, "
+                                               "ex.: 30d, 6w, 3m, 1y.")
+
+        self.forecast_parser.add_argument('--car',
+                                          type=str,
+                                          metavar="CAR_NAME",
+                                          help="Only list entries of this car.")
+
+
+class CalendarSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.calendar_parser = self.parser_parent.subparsers.add_parser('calendar',
+                                                                        help="List every occurrence of scheduled "
+                                                                             "entries of the fleet within a date "
+                                                                             "range, including repetitions.",
+                                                                        formatter_class=argparse.RawTextHelpFormatter)
+
+        self.calendar_parser.add_argument('--from',
+                                          type=str,
+                                          dest='from_date',
+                                          metavar="DATE",
+                                          help="First day of the calendar as dd-mm-yyyy, today by default.",
+                                          default=TODAY)
+
+        self.calendar_parser.add_argument('--to',
+                                          type=str,
+                                          dest='to_date',
+                                          metavar="DATE",
+                                          help="Last day of the calendar as dd-mm-yyyy or duration after the first "
+                                               "day, ex.: 30d, 6w, 3m, 1y.",
+                                          default='3m')
+
+        self.calendar_parser.add_argument('--car',
+                                          type=str,
+                                          metavar="CAR_NAME",
+                                          help="Only list entries of this car.")
+
+        self.calendar_parser.add_argument('--ical',
+                                          type=str,
+                                          metavar="PATH",
+                                          help="Write occurrences to an iCalendar (.ics) file instead, "
+                                               "pass '-' to write to standard output.")
+
+
+class StatsSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.stats_parser = self.parser_parent.subparsers.add_parser('stats',
+                                                                     help="Load the save directory and print file "
+                                                                          "I/O and operation metrics.",
+                                                                     formatter_class=argparse.RawTextHelpFormatter)
+
+        self.stats_parser.add_argument('--format',
+                                       type=str,
+                                       choices=['text', 'prometheus', 'json'],
+                                       help="Output format, 'prometheus' prints text exposition format that "
+                                            "can be scraped or dropped into a textfile collector.",
+                                       default='text')
+
+        self.stats_parser.add_argument('--car',
+                                       type=str,
+                                       metavar="CAR_NAME",
+                                       help="Only load this car.")
+
+
+class CodecSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.codec_parser = self.parser_parent.subparsers.add_parser('codec',
+                                                                     help="Print or change the codec save files "
+                                                                          "of this save directory are written with.",
+                                                                     formatter_class=argparse.RawTextHelpFormatter)
+
+        self.codec_parser.add_argument('codec',
+                                       type=str,
+                                       nargs='?',
+                                       choices=list(CODECS),
+                                       help="Record new codec and rewrite all car directories with it.\n"
+                                            "'json-pretty' - indented JSON (default)\n"
+                                            "'json-compact' - JSON without whitespace\n"
+                                            "'marshal' - binary, fastest to load, not human-readable")
+
+
+class MigrateSubparser(Subparser):
+    def __init__(self, parser_parent):
+        self.parser_parent = parser_parent
+
+    def create_subparser(self):
+        self.migrate_parser = self.parser_parent.subparsers.add_parser('migrate',
+                                                                       help="Upgrade the save directory to the "
+                                                                            "current format version, one car at a "
+                                                                            "time. An interrupted run resumes where "
+                                                                            "it stopped.",
+                                                                       formatter_class=argparse.RawTextHelpFormatter)
+
+        self.migrate_parser.add_argument('--status',
+                                         action='store_true',
+                                         help="Only print format version and pending migrations.")
@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 
 PATH = pathlib.Path(__file__).parent.parent.parent
 CARS_PATH = PATH.joinpath("save")
+THUMBNAILS_PATH = PATH.joinpath(".cache", "thumbnails")
 
 TODAY = datetime.today().date().strftime("%d-%m-%Y")
 
@@ -1,25 +1,66 @@
 """Manage car save directories."""
 
+import contextlib
 import os
 import pathlib
 import shutil
+import threading
+import time
+
+from dataclasses import dataclass
 
 from carlogger.items.car import Car
-from carlogger.filedata_manager import FiledataManager, JSONFiledataManager, TxtFiledataManager, CSVFiledataManager
+from carlogger.filedata_manager import FiledataManager, JSONFiledataManager, TxtFiledataManager, CSVFiledataManager, \
+    FileData, JSONSerializableObject, is_temp_file
 from carlogger.items.component_collection import ComponentCollection
+from carlogger.items.custom_info_index import CustomInfoIndexes, IndexDefinition
 from carlogger.items.car_component import CarComponent
 from carlogger.items.car_info import CarInfo
 from carlogger.const import CARS_PATH
 from carlogger.items.item_sorter import ItemSorter
+from carlogger.metrics import DIRECTORY_SECONDS, CAR_LOAD_SECONDS, FILES_PER_CAR_SAVE, timed_operation
 from carlogger.printer import Printer
+from carlogger.serialization import SaveFormat, DEFAULT_CODEC, LEGACY_FORMAT_VERSION, get_codec
+from carlogger.tracing import traced
 from carlogger.util import get_car_dirs, is_date
 
 
+@dataclass
+class SaveReport:
+    """Files written and skipped as unchanged by car directory updates."""
+    saves: int = 0
+    written: int = 0
+    skipped: int = 0
+
+    def count(self, written: bool):
+        """Count a single file save by whether it was written or skipped."""
+        if written:
+            self.written += 1
+        else:
+            self.skipped += 1
+
+    def add(self, report: 'SaveReport'):
+        self.saves += report.saves
+        self.written += report.written
+        self.skipped += report.skipped
+
+    def get_formatted_info(self) -> str:
+        return f"{self.saves} car directory saves: {self.written} files written, " \
+               f"{self.skipped} unchanged files skipped"
+
+
 class DirectoryManager:
     def __init__(self, data_manager: FiledataManager, car_save_dir=CARS_PATH):
         self.data_manager = data_manager
         self.car_save_dir = car_save_dir
 
+        self.save_report = SaveReport()
+        self.last_save_report = SaveReport()
+        self._save_report_lock = threading.Lock()
+        self.save_format = SaveFormat()
+
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
     def create_car_directory(self, car: Car):
         path = car.path
         data_path = self.create_car_info_path(car)
@@ -42,6 +83,8 @@ class DirectoryManager:
         else:
             Printer.print_msg(Car, 'ADD_SUCCESS', name=path.name, relation=path)
 
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
     def remove_car_directory(self, car: Car):
         """Delete a car directory along with all its data files from 'save' directory if it exists."""
         path = car.path
@@ -52,82 +95,153 @@ class DirectoryManager:
             Printer.print_msg(Car, 'DEL_FAIL', name=path.name, relation=path)
             return
 
+    @traced('directory')
     def remove_item(self, item):
         self.data_manager.delete_file(item)
 
+    @traced('directory')
+    def remove_items(self, items: list):
+        """Remove save files of many items, files that are already gone are skipped."""
+        for item in items:
+            with contextlib.suppress(FileNotFoundError):
+                self.data_manager.delete_file(item)
+
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
     def update_car_directory(self, car: Car):
         car.car_info.path = self.create_car_info_path(car)
-        self.data_manager.save_file(car.car_info, self.create_car_info_path(car))
-        self.update_collections_files(car.collections)
+        report = SaveReport(1)
+
+        with self.data_manager.batch():
+            report.count(self.data_manager.save_file(car.car_info, self.create_car_info_path(car)))
+            report.add(self.update_collections_files(car.collections))
+
+        self._record_save_report(report)
+
+    def get_car_items(self, car: Car) -> list[tuple[JSONSerializableObject, pathlib.Path]]:
+        """Every item saved in a car directory along with its file path, entries of components get sorted
+        the same way `update_car_directory` sorts them."""
+        suffix = self.data_manager.suffix
+        car.car_info.path = self.create_car_info_path(car)
+        items = [(car.car_info, pathlib.Path(self.create_car_info_path(car)))]
+
+        for coll in car.collections:
+            items.append((coll, pathlib.Path(coll.get_target_path(suffix))))
 
+            for comp in coll.components:
+                self._sort_component_entries(comp)
+                items.append((comp, pathlib.Path(comp.get_target_path(suffix))))
+
+        return items
+
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
+    def write_car_files(self, files: list[tuple[FileData, pathlib.Path]]):
+        report = SaveReport(1)
+
+        with self.data_manager.batch():
+            for data, path in files:
+                report.count(self.data_manager.save_file(data, path))
+
+        self._record_save_report(report)
+
+    def _record_save_report(self, report: SaveReport):
+        with self._save_report_lock:
+            self.last_save_report = report
+            self.save_report.add(report)
+
+        FILES_PER_CAR_SAVE.observe(report.written)
+
+    @traced('directory')
     def rename_car_dir(self, car: Car, legacy_car_info_path: str):
         os.remove(legacy_car_info_path)
         os.rename(car.path, car.path.parent.joinpath(car.car_info.name))
         car.path = car.get_target_path()
         self.update_car_directory(car)
 
-    def update_collections_files(self, comp_collections: list[ComponentCollection]):
+    @traced('directory')
+    def update_collections_files(self, comp_collections: list[ComponentCollection]) -> SaveReport:
+        report = SaveReport()
+
         for coll in comp_collections:
-            self.data_manager.save_file(coll, coll.get_target_path(self.data_manager.suffix))
-            self.update_components_files(coll.components)
+            report.count(self.data_manager.save_file(coll, coll.get_target_path(self.data_manager.suffix)))
+            report.add(self.update_components_files(coll.components))
 
-    def update_components_files(self, comp_list: list[CarComponent]):
-        for comp in comp_list:
+        return report
+
+    @traced('directory')
+    def update_components_files(self, comp_list: list[CarComponent]) -> SaveReport:
+        report = SaveReport()
 
-            if len(comp.log_entries) > 0:
-                item_sorter = ItemSorter(comp.log_entries, 'latest')
-                comp.log_entries = item_sorter.get_sorted_list()
+        for comp in comp_list:
+            self._sort_component_entries(comp)
+            report.count(self.data_manager.save_file(comp, comp.get_target_path(self.data_manager.suffix)))
 
-            if len(comp.scheduled_log_entries) > 0:
-                item_sorter = ItemSorter(comp.scheduled_log_entries, 'latest')
-                comp.scheduled_log_entries = item_sorter.get_sorted_list()
+        return report
 
-            self.data_manager.save_file(comp, comp.get_target_path(self.data_manager.suffix))
+    def _sort_component_entries(self, comp: CarComponent):
+        if len(comp.log_entries) > 0:
+            item_sorter = ItemSorter(comp.log_entries, 'latest')
+            comp.log_entries = item_sorter.get_sorted_list()
 
+        if len(comp.scheduled_log_entries) > 0:
+            item_sorter = ItemSorter(comp.scheduled_log_entries, 'latest')
+            comp.scheduled_log_entries = item_sorter.get_sorted_list()
 
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
     def load_car_dir(self, car_name: str):
         """Load target car inside 'save' folder via name."""
         car_dirs = get_car_dirs(self.car_save_dir)
 
         if car_name in car_dirs:
+            start = time.perf_counter()
             path = self.car_save_dir.joinpath(car_name)
             car_info = CarInfo(**self.data_manager.load_file(self._create_car_info_path(path)))
 
             new_car = Car(car_info, path=path)
             collections = self.load_car_collections_from_path(path, new_car)
             new_car.collections = collections
+            self._link_parent_collections(new_car)
 
-            for coll in new_car.collections:
-                if coll.parent_collection != "":
-                    coll.parent_collection = new_car.get_collection_by_name(pathlib.Path(coll.parent_collection).stem)
-
+            CAR_LOAD_SECONDS.inc(time.perf_counter() - start, car=car_name)
             return new_car
 
         raise NotADirectoryError(f"'{car_name}' directory not found in save folder")
 
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
     def load_all_car_dir(self) -> list[Car]:
         """Load all saved cars inside 'save' folder and return them as list of objects."""
+        cars = self.load_car_catalog()
+
+        for car in cars:
+            self.load_car_details(car)
+
+        return cars
+
+    def load_car_catalog(self) -> list[Car]:
+        """Load only car info files of all saved cars, collections are left empty.\n
+        Reading the catalog is cheap, use `load_car_details` to fill in the rest of each car."""
         cars: list[Car] = []
-        car_dirs = get_car_dirs()
 
-        for directory in car_dirs:
+        for directory in get_car_dirs(self.car_save_dir):
             path = self.car_save_dir.joinpath(directory)
             car_info = CarInfo(**self.data_manager.load_file(self._create_car_info_path(path)))
+            cars.append(Car(car_info, path=path))
 
-            new_car = Car(car_info, path=path)
-            collections = self.load_car_collections_from_path(path, new_car)
-            new_car.collections = collections
-            cars.append(new_car)
+        return cars
 
-            for car in cars:
-                for coll in car.collections:
-                    if coll.parent_collection != "":
-                        try:
-                            coll.parent_collection = new_car.get_collection_by_name(coll.parent_collection.split()[-2])
-                        except Exception:
-                            pass
+    @timed_operation(DIRECTORY_SECONDS)
+    @traced('directory')
+    def load_car_details(self, car: Car) -> Car:
+        """Load collections, components and entries of a car that was loaded from the catalog."""
+        start = time.perf_counter()
+        car.collections = self.load_car_collections_from_path(car.path, car)
+        self._link_parent_collections(car)
 
-        return cars
+        CAR_LOAD_SECONDS.inc(time.perf_counter() - start, car=car.car_info.name)
+        return car
 
     def load_car_collections_from_path(self, path, parent_car: Car = None) -> list[ComponentCollection]:
         """Load collections from target car directory and return them as list."""
@@ -136,23 +250,14 @@ class DirectoryManager:
 
         try:
             for coll in os.listdir(collections_path):
+                if is_temp_file(coll):
+                    continue
+
                 collection_data = self.data_manager.load_file(collections_path.joinpath(coll))
                 new_collection = ComponentCollection(**collection_data, path=collections_path, car=parent_car)
                 components = self.load_car_components_from_path(new_collection)
-                new_collection.collections = \
-                    [ComponentCollection(name=data.get('name'),
-                                         desc=data.get('desc'),
-                                         collections=data.get('collections'),
-                                         components=data.get('components'),
-                                         parent_collection=data.get('parent_collection'),
-                                         car=parent_car,
-                                         custom_info=data.get('custom_info', {}))
-                     for data in new_collection.collections]
                 new_collection.components.clear()
 
-                for c in new_collection.collections:
-                    c.path = collections_path
-
                 for comp in components:
                     if comp.current_mileage < new_collection.car.mileage:
                         comp.current_mileage = new_collection.car.mileage
@@ -160,23 +265,59 @@ class DirectoryManager:
 
                 collections.append(new_collection)
 
+            collections_by_id = {coll.id: coll for coll in collections if coll.id}
+
+            for coll in collections:
+                coll.collections = [self._create_nested_collection(ref, collections_by_id, parent_car, collections_path)
+                                    for ref in coll.collections]
+
             return collections
 
         except FileNotFoundError:
             return []
 
+    def _create_nested_collection(self, ref: dict, collections_by_id: dict[str, ComponentCollection], car: Car,
+                                  path: pathlib.Path) -> ComponentCollection:
+        """Nested collection entry of a parent collection built from its reference,
+        references by id only hold the id so the rest is taken from the loaded collection."""
+        if source := collections_by_id.get(ref.get('id')):
+            ref = {'id': source.id, 'name': source.name, 'desc': source.desc, 'custom_info': source.custom_info}
+
+        return ComponentCollection(name=ref.get('name'),
+                                   desc=ref.get('desc'),
+                                   collections=ref.get('collections'),
+                                   components=ref.get('components'),
+                                   parent_collection=ref.get('parent_collection'),
+                                   car=car,
+                                   custom_info=ref.get('custom_info', {}),
+                                   path=path,
+                                   id=ref.get('id', ''))
+
+    def _link_parent_collections(self, car: Car):
+        """Replace parent collection ids, or paths in files saved before ids, with loaded collections."""
+        collections_by_id = {coll.id: coll for coll in car.collections if coll.id}
+
+        for coll in car.collections:
+            if coll.parent_collection != "":
+                coll.parent_collection = collections_by_id.get(coll.parent_collection) or \
+                                         car.get_collection_by_name(pathlib.Path(coll.parent_collection).stem)
+
     def load_car_components_from_path(self, collection: ComponentCollection) -> list[CarComponent]:
         coms = []
+        components_path = collection.path.parent.joinpath('components')
 
-        for child in collection.children:
+        for ref in collection.components:
             try:
-                if "collections" not in child['path']:
-                    item_data: dict = self.data_manager.load_file(child['path'])
+                path = ref.get('path') or components_path.joinpath(f"{ref['id']}.{self.data_manager.suffix}")
+
+                if "collections" not in str(path):
+                    item_data: dict = self.data_manager.load_file(path)
 
                     c = CarComponent(item_data['name'],
                                      desc=item_data.get('desc'),
                                      custom_info=item_data.get('custom_info', {}),
-                                     path=collection.path.parent.joinpath('components'))
+                                     path=components_path,
+                                     id=item_data.get('id', ''))
                     c.parent = collection
 
                     for part in item_data['part_list']:
@@ -197,6 +338,45 @@ class DirectoryManager:
         for entry in comp_data.get('scheduled_log_entries'):
             component_ref.create_scheduled_entry_from_file(entry)
 
+    def get_index_definitions_path(self) -> pathlib.Path:
+        return pathlib.Path(self.car_save_dir).joinpath(f"indexes.{self.data_manager.suffix}")
+
+    def load_index_definitions(self) -> list[IndexDefinition]:
+        """Load custom info indexes declared for this save directory."""
+        try:
+            data = self.data_manager.load_file(self.get_index_definitions_path())
+        except (OSError, ValueError):
+            return []
+
+        return [IndexDefinition(**definition) for definition in data.get('indexes', [])]
+
+    def save_index_definitions(self, indexes: CustomInfoIndexes):
+        self.data_manager.save_file(indexes, self.get_index_definitions_path())
+
+    def get_save_format_path(self) -> pathlib.Path:
+        return pathlib.Path(self.car_save_dir).joinpath(f"format.{self.data_manager.suffix}")
+
+    def load_save_format(self) -> SaveFormat:
+        """Load format record of this save directory and write new files with its codec and layout from now on."""
+        try:
+            data = self.data_manager.load_file(self.get_save_format_path())
+        except (OSError, ValueError):
+            data = {}
+
+        self.save_format = SaveFormat(data.get('codec', DEFAULT_CODEC), data.get('version', LEGACY_FORMAT_VERSION))
+        self._apply_save_format()
+
+        return self.save_format
+
+    def save_save_format(self, save_format: SaveFormat):
+        self.save_format = save_format
+        self._apply_save_format()
+        self.data_manager.save_file(save_format, self.get_save_format_path())
+
+    def _apply_save_format(self):
+        self.data_manager.codec = get_codec(self.save_format.codec)
+        self.data_manager.layout_version = self.save_format.version
+
     def _create_car_info_path(self, dir_path):
         a = dir_path.joinpath(f"{dir_path.name}.{self.data_manager.suffix}")
         return a
@@ -0,0 +1,64 @@
+"""In-process change notifications about created, updated and deleted items."""
+
+from enum import StrEnum, auto
+from typing import Callable
+
+from carlogger.const import ITEM
+
+
+class ItemEvent(StrEnum):
+    created = auto()
+    updated = auto()
+    deleted = auto()
+    due = auto()
+
+
+class EventBus:
+    """Lets listeners (GUI lists, indexes) react to item changes without reloading the whole fleet.\n
+    Callbacks are invoked synchronously on the emitting thread as `callback(event, item)`, batch callbacks receive
+    all items of an `emit_many` call at once as `callback(event, items)`, so listeners that re-render react once
+    per bulk change. 'due' is emitted for scheduled entries that became due because of an odometer update."""
+    def __init__(self):
+        self._subscribers: dict[ItemEvent, list[Callable]] = {event: [] for event in ItemEvent}
+        self._batch_subscribers: dict[ItemEvent, list[Callable]] = {event: [] for event in ItemEvent}
+
+    def subscribe(self, callback: Callable[[ItemEvent, ITEM], None], *events: ItemEvent):
+        """Register callback for chosen events, all events by default."""
+        self._add_callback(self._subscribers, callback, events)
+
+    def unsubscribe(self, callback: Callable[[ItemEvent, ITEM], None], *events: ItemEvent):
+        self._remove_callback(self._subscribers, callback, events)
+
+    def subscribe_batch(self, callback: Callable[[ItemEvent, list[ITEM]], None], *events: ItemEvent):
+        """Register callback receiving a list of items for chosen events, all events by default."""
+        self._add_callback(self._batch_subscribers, callback, events)
+
+    def unsubscribe_batch(self, callback: Callable[[ItemEvent, list[ITEM]], None], *events: ItemEvent):
+        self._remove_callback(self._batch_subscribers, callback, events)
+
+    def emit(self, event: ItemEvent, item: ITEM):
+        self.emit_many(event, [item])
+
+    def emit_many(self, event: ItemEvent, items: list[ITEM]):
+        """Notify item subscribers once per item and batch subscribers once with all items."""
+        if not items:
+            return
+
+        for callback in list(self._subscribers[event]):
+            for item in items:
+                callback(event, item)
+
+        for callback in list(self._batch_subscribers[event]):
+            callback(event, list(items))
+
+    @staticmethod
+    def _add_callback(subscribers: dict[ItemEvent, list[Callable]], callback: Callable, events: tuple[ItemEvent]):
+        for event in events or ItemEvent:
+            if callback not in subscribers[event]:
+                subscribers[event].append(callback)
+
+    @staticmethod
+    def _remove_callback(subscribers: dict[ItemEvent, list[Callable]], callback: Callable, events: tuple[ItemEvent]):
+        for event in events or ItemEvent:
+            if callback in subscribers[event]:
+                subscribers[event].remove(callback)
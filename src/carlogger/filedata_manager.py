@@ -1,12 +1,76 @@
 """Save and load collections, components, logs."""
 
-import json
+import contextlib
+import copy
+import hashlib
 import csv
 import os
+import pathlib
+import threading
 
 from abc import ABC, abstractmethod
+from enum import StrEnum
 from typing import Protocol
 
+from carlogger.metrics import FILE_READS, FILE_WRITES, FILE_WRITES_SKIPPED, FILE_DELETES, BYTES_READ, BYTES_WRITTEN, \
+    DECODE_SECONDS, ENCODE_SECONDS
+from carlogger.serialization import Codec, DEFAULT_CODEC, LEGACY_FORMAT_VERSION, get_codec, detect_codec, \
+    encode_layout, decode_layout
+
+TEMP_SUFFIX = ".tmp"
+
+
+class Durability(StrEnum):
+    """When saved files are fsynced. Files are always written to a temp file first and renamed over the target,
+    so a failed or interrupted write never leaves a truncated file behind regardless of the level."""
+    NONE = "none"
+    BATCH = "batch"
+    FILE = "file"
+
+
+class WriteBatch(threading.local):
+    """Files written by the current thread that still wait for fsync at the end of the outermost batch."""
+    def __init__(self):
+        self.depth = 0
+        self.written: set[str] = set()
+
+
+def get_content_digest(content: str | bytes) -> bytes:
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def is_temp_file(path: str | pathlib.Path) -> bool:
+    """Whether file is a leftover of an interrupted atomic write."""
+    path = pathlib.Path(path)
+    return path.name.startswith('.') and path.suffix == TEMP_SUFFIX
+
+
+def fsync_file(path: str):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path: str):
+    """Persist renames and new entries of a directory, directories cannot be opened this way on Windows."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+
+    fd = os.open(path or '.', os.O_RDONLY | os.O_DIRECTORY)
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 class JSONSerializableObject(Protocol):
     """Object that implements `to_json` function."""
@@ -18,19 +82,125 @@ class JSONSerializableObject(Protocol):
         pass
 
 
+class FileData:
+    """Already serialized item dictionary, saved as is."""
+    def __init__(self, data: dict):
+        self.data = data
+
+    @classmethod
+    def snapshot(cls, obj: JSONSerializableObject) -> 'FileData':
+        """Copy of item data that no longer shares anything with the item, safe to save from another thread."""
+        return cls(copy.deepcopy(obj.to_json()))
+
+    def to_json(self) -> dict:
+        return self.data
+
+
 class FiledataManager(ABC):
     """Abstract implementation of class that loads and saves data to files."""
 
     suffix = ""
 
+    def __init__(self, durability: Durability = Durability.BATCH):
+        self.durability = Durability(durability)
+        self._batch = WriteBatch()
+
+        # Path -> (digest, size, mtime) of content last read from or written to that file
+        self._known_content: dict[str, tuple[bytes, int, int]] = {}
+
+    def is_unchanged(self, filepath, content: str | bytes) -> bool:
+        """Whether file still holds exactly this content as of the last time it was read or written here.\n
+        Files modified or removed by anything else since then are detected by their size and modification time."""
+        known = self._known_content.get(os.path.abspath(filepath))
+
+        if not known or known[0] != get_content_digest(content):
+            return False
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+
+        return (stat.st_size, stat.st_mtime_ns) == known[1:]
+
+    def remember_content(self, filepath, content: str | bytes):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+
+        self._known_content[os.path.abspath(filepath)] = \
+            (get_content_digest(content), stat.st_size, stat.st_mtime_ns)
+
+    def forget_content(self, filepath):
+        self._known_content.pop(os.path.abspath(filepath), None)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Group writes of one save cycle, with BATCH durability written files and their directories are fsynced
+        once when the outermost batch ends instead of after every file."""
+        self._batch.depth += 1
+
+        try:
+            yield
+        finally:
+            self._batch.depth -= 1
+
+            if self._batch.depth == 0:
+                self.sync()
+
+    def sync(self):
+        """fsync files written since the last sync, then each of their directories once."""
+        written, self._batch.written = self._batch.written, set()
+
+        try:
+            for path in written:
+                fsync_file(path)
+
+            for directory in {os.path.dirname(path) for path in written}:
+                fsync_directory(directory)
+        except OSError:
+            # Synced again by the next sync on this thread
+            self._batch.written |= written
+            raise
+
+    @contextlib.contextmanager
+    def open_atomic(self, filepath, mode: str = "w", **open_kwargs):
+        """Open a temp file next to the target for writing, it replaces the target only once fully written."""
+        filepath = os.fspath(filepath)
+        directory, name = os.path.split(filepath)
+        temp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}{TEMP_SUFFIX}")
+
+        try:
+            with open(temp_path, mode, **open_kwargs) as file:
+                yield file
+
+                if self.durability == Durability.FILE:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+            os.replace(temp_path, filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+        if self.durability == Durability.FILE:
+            fsync_directory(directory)
+        elif self.durability == Durability.BATCH:
+            self._batch.written.add(filepath)
+
+            if self._batch.depth == 0:
+                self.sync()
+
     @abstractmethod
     def load_file(self, filepath):
         """Load data from target file."""
         pass
 
     @abstractmethod
-    def save_file(self, obj, filepath=None, *values):
-        """Save data as file to target path."""
+    def save_file(self, obj, filepath=None, *values) -> bool:
+        """Save data as file to target path, return False when the write was skipped as unchanged."""
         pass
 
     @abstractmethod
@@ -47,33 +217,74 @@ class FiledataManager(ABC):
     def export_selected_values(self, keys_to_export, data_to_save):
         return
 
+    def _count_read(self, file):
+        FILE_READS.inc(format=self.suffix)
+        BYTES_READ.inc(os.fstat(file.fileno()).st_size, format=self.suffix)
+
+    def _count_write(self, file):
+        FILE_WRITES.inc(format=self.suffix)
+        BYTES_WRITTEN.inc(file.tell(), format=self.suffix)
+
+    def _count_delete(self):
+        FILE_DELETES.inc(format=self.suffix)
+
+    def _count_skipped_write(self):
+        FILE_WRITES_SKIPPED.inc(format=self.suffix)
+
 
 class JSONFiledataManager(FiledataManager):
+    """Saves items through a codec, pretty JSON by default, in the file layout of 'layout_version'.
+    Loading detects the codec and layout of each file on its own, so files keep their '.json' names and a save
+    directory may mix codecs and layouts while it's being converted."""
     suffix = "json"
 
+    def __init__(self, durability: Durability = Durability.BATCH, codec: Codec | str = DEFAULT_CODEC):
+        super().__init__(durability)
+        self.codec = get_codec(codec) if isinstance(codec, str) else codec
+        self.layout_version = LEGACY_FORMAT_VERSION
+
     def load_file(self, filepath) -> dict:
-        """Load data from target JSON file."""
-        with open(filepath, "r") as file:
-            return json.load(file)
+        """Load data from target file written by any of the codecs."""
+        with open(filepath, "rb") as file:
+            self._count_read(file)
+            content = file.read()
+
+        self.remember_content(filepath, content)
+
+        with DECODE_SECONDS.time(format=self.suffix):
+            return decode_layout(detect_codec(content).decode(content))
 
     def save_file(self, obj: JSONSerializableObject, filepath=None, *values):
-        """Converts object to a dictionary to be saved to target path in a JSON file."""
-        data_to_save: dict = obj.to_json()
-        if values:
-            data_to_save = self.export_selected_values(values, data_to_save)
+        """Converts object to a dictionary to be saved to target path in a file encoded by the codec."""
+        with ENCODE_SECONDS.time(format=self.suffix):
+            data_to_save: dict = obj.to_json()
+            if values:
+                data_to_save = self.export_selected_values(values, data_to_save)
+
+            content = self.codec.encode(encode_layout(data_to_save, self.layout_version))
 
         if filepath is None:
             filepath = obj.get_target_path(self.suffix)
 
-        with open(filepath, "w+") as file:
-            json.dump(data_to_save, file, indent=3)
+        if self.is_unchanged(filepath, content):
+            self._count_skipped_write()
+            return False
+
+        with self.open_atomic(filepath, "wb") as file:
+            file.write(content)
+            self._count_write(file)
+
+        self.remember_content(filepath, content)
+        return True
 
     def delete_file(self, obj: JSONSerializableObject):
         """Remove target savefile from the system."""
-        os.remove(obj.get_target_path(self.suffix))
+        self.delete_file_raw(obj.get_target_path(self.suffix))
 
     def delete_file_raw(self, filepath: str):
         os.remove(filepath)
+        self.forget_content(filepath)
+        self._count_delete()
 
     def export_selected_values(self, keys_to_export, data_to_save: dict):
         values_to_export = {}
@@ -91,27 +302,43 @@ class TxtFiledataManager(FiledataManager):
     def load_file(self, filepath) -> list[str]:
         """Load data from target txt file."""
         with open(filepath, "r") as file:
-            return file.readlines()
+            self._count_read(file)
+
+            with DECODE_SECONDS.time(format=self.suffix):
+                return file.readlines()
 
     def save_file(self, obj, filepath=None, *values):
         """Save item to target path as a txt file."""
-        data_to_save: dict = obj.to_json()
+        with ENCODE_SECONDS.time(format=self.suffix):
+            data_to_save: dict = obj.to_json()
 
-        if values:
-            data_to_save = self.export_selected_values(*values, data_to_save)
+            if values:
+                data_to_save = self.export_selected_values(*values, data_to_save)
+
+            content = str(data_to_save)
 
         if filepath is None:
             filepath = obj.get_target_path(self.suffix)
 
-        with open(filepath, "w+") as file:
-            file.write(str(data_to_save))
+        if self.is_unchanged(filepath, content):
+            self._count_skipped_write()
+            return False
+
+        with self.open_atomic(filepath) as file:
+            file.write(content)
+            self._count_write(file)
+
+        self.remember_content(filepath, content)
+        return True
 
     def delete_file(self, obj):
         """Remove target savefile from the system."""
-        os.remove(obj.get_target_path(self.suffix))
+        self.delete_file_raw(obj.get_target_path(self.suffix))
 
     def delete_file_raw(self, filepath: str):
         os.remove(filepath)
+        self.forget_content(filepath)
+        self._count_delete()
 
     def export_selected_values(self, keys_to_export, data_to_save: dict):
         values_to_export = {}
@@ -129,12 +356,18 @@ class CSVFiledataManager(FiledataManager):
     def load_file(self, filepath) -> list[str]:
         """Load data from target txt file."""
         with open(filepath, "r") as file:
-            return file.readlines()
+            self._count_read(file)
+
+            with DECODE_SECONDS.time(format=self.suffix):
+                return file.readlines()
 
     def save_file(self, obj, filepath=None, *values: list):
         """Save item to target path as a csv file."""
         values = list(values)
-        data_to_save: dict = obj.to_json()
+
+        with ENCODE_SECONDS.time(format=self.suffix):
+            data_to_save: dict = obj.to_json()
+
         children = None
 
         if values:
@@ -151,7 +384,7 @@ class CSVFiledataManager(FiledataManager):
         if filepath is None:
             filepath = obj.get_target_path(self.suffix)
 
-        with open(filepath, "w+", newline='', encoding='utf-8') as file:
+        with self.open_atomic(filepath, newline='', encoding='utf-8') as file:
             writer = csv.DictWriter(file, fieldnames=fields)
             writer.writeheader()
             if children:
@@ -160,12 +393,18 @@ class CSVFiledataManager(FiledataManager):
             else:
                 writer.writerow(data_to_save)
 
+            self._count_write(file)
+
+        return True
+
     def delete_file(self, obj):
         """Remove target savefile from the system."""
-        os.remove(obj.get_target_path(self.suffix))
+        self.delete_file_raw(obj.get_target_path(self.suffix))
 
     def delete_file_raw(self, filepath: str):
         os.remove(filepath)
+        self.forget_content(filepath)
+        self._count_delete()
 
     def export_selected_values(self, keys_to_export, data_to_save: dict):
         values_to_export = {}
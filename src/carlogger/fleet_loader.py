@@ -0,0 +1,79 @@
+"""Load saved cars on a background thread so the GUI can show up before the whole fleet is read."""
+
+import queue
+import threading
+
+from enum import StrEnum
+
+from carlogger.directory_manager import DirectoryManager
+from carlogger.items.car import Car
+
+
+class LoadEvent(StrEnum):
+    CATALOG = "catalog"
+    CAR_LOADED = "car_loaded"
+    CAR_FAILED = "car_failed"
+    FINISHED = "finished"
+
+
+class FleetLoader:
+    """Reads the car catalog first and then the details of each car on a worker thread.\n
+    The worker never touches the GUI, results are put in a queue as `(LoadEvent, payload)` pairs and are meant to be
+    drained from the GUI thread with `poll`."""
+    def __init__(self, directory_manager: DirectoryManager):
+        self.directory_manager = directory_manager
+
+        self.total = 0
+        self.loaded = 0
+
+        self._results: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self._thread = threading.Thread(target=self._run, name='carlogger-fleet-loader', daemon=True)
+        self._thread.start()
+
+    def join(self):
+        if self._thread:
+            self._thread.join()
+
+    def poll(self, max_events: int = 10) -> list[tuple[LoadEvent, ...]]:
+        """Return up to 'max_events' results without blocking."""
+        events = []
+
+        while len(events) < max_events:
+            try:
+                events.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+
+        return events
+
+    def _run(self):
+        try:
+            cars: list[Car] = self.directory_manager.load_car_catalog()
+        except Exception as e:
+            self._results.put((LoadEvent.FINISHED, e))
+            return
+
+        self.total = len(cars)
+        self._results.put((LoadEvent.CATALOG, cars))
+
+        for car in cars:
+            try:
+                self.directory_manager.load_car_details(car)
+            except Exception as e:
+                self._results.put((LoadEvent.CAR_FAILED, (car, e)))
+            else:
+                self._results.put((LoadEvent.CAR_LOADED, car))
+
+            self.loaded += 1
+
+        self._results.put((LoadEvent.FINISHED, None))
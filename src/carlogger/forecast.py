@@ -0,0 +1,167 @@
+"""Forecast when mileage-ruled scheduled entries come due from the mileage each car drives per day."""
+
+import datetime
+import re
+
+from dataclasses import dataclass, field
+
+from carlogger.const import ITEM, TODAY
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.items.car import Car
+from carlogger.items.log_entry import LogEntry, ScheduledLogEntry
+from carlogger.scheduler import DueKind, get_scheduled_entries
+from carlogger.util import date_string_to_date, date_string_to_ordinal, format_tuple_to_date_string, is_date
+
+DURATION_UNITS = {'d': 1, 'w': 7, 'm': 30, 'y': 365}
+
+
+def parse_duration(duration: str) -> int:
+    """Convert duration such as '30d', '6w', '3m', '1y' or plain '30' to number of days."""
+    if not (match := re.fullmatch(r'\s*(\d+)\s*([dwmy]?)\s*', duration.lower())):
+        raise ValueError(f"Invalid duration '{duration}', expected number of days or ex.: 30d, 6w, 3m, 1y")
+
+    return int(match.group(1)) * DURATION_UNITS[match.group(2) or 'd']
+
+
+def get_item_car(item: ITEM) -> Car | None:
+    try:
+        match item.__class__.__name__:
+            case 'Car': return item
+            case 'ComponentCollection': return item.car
+            case 'CarComponent': return item.parent.car
+            case _: return item.component.parent.car
+    except AttributeError:
+        return None
+
+
+def get_mileage_points(car: Car) -> list[tuple[int, int]]:
+    """Return (date ordinal, mileage) of every dated log entry with mileage, scheduled entries are left out as
+    their date and mileage are targets, not readings."""
+    return [(date_string_to_ordinal(entry.date), entry.mileage) for entry in car.get_all_entry_logs()
+            if entry.mileage > 0 and is_date(entry.date)]
+
+
+def fit_mileage_velocity(points: list[tuple[int, int]]) -> float | None:
+    """Least squares slope of mileage over days, None without two distinct dates or when mileage isn't growing.
+    Only running sums are kept so the whole history is fitted in a single pass."""
+    n = sum_x = sum_y = sum_xx = sum_xy = 0
+    first_day = points[0][0] if points else 0
+
+    for day, mileage in points:
+        x = day - first_day
+        n += 1
+        sum_x += x
+        sum_y += mileage
+        sum_xx += x * x
+        sum_xy += x * mileage
+
+    denominator = n * sum_xx - sum_x * sum_x
+
+    if n < 2 or denominator == 0:
+        return None
+
+    velocity = (n * sum_xy - sum_x * sum_y) / denominator
+    return velocity if velocity > 0 else None
+
+
+@dataclass(order=True)
+class ForecastEntry:
+    days: int
+    date: datetime.date = field(compare=False)
+    entry: ScheduledLogEntry = field(compare=False)
+    velocity: float | None = field(compare=False, default=None)
+
+    def get_formatted_info(self) -> str:
+        date = format_tuple_to_date_string((self.date.day, self.date.month, self.date.year))
+        basis = f" @ {round(self.velocity, 1)} km/day" if self.velocity else ""
+        return f"[{date}] [{self._days_to_str()}{basis}] {self.get_location()} | {self.entry.get_formatted_info()}"
+
+    def get_location(self) -> str:
+        component = self.entry.component
+
+        try:
+            return f"{component.parent.car.car_info.name}/{component.name}"
+        except AttributeError:
+            return component.name
+
+    def _days_to_str(self) -> str:
+        if self.days > 0:
+            return f"in {self.days} days"
+        elif self.days == 0:
+            return "Today"
+        else:
+            return f"{abs(self.days)} days ago"
+
+
+@dataclass
+class Forecast:
+    entries: list[ForecastEntry] = field(default_factory=list)
+    unknown: list[ScheduledLogEntry] = field(default_factory=list)
+
+
+class MileageForecaster:
+    """Fits mileage driven per day of each car from its log entry history.\n
+    Fits are cached per car until one of its log entries is created, updated or deleted, the forecaster follows
+    item events when constructed with an event bus."""
+    def __init__(self, event_bus: EventBus = None):
+        self._velocities: dict[int, float | None] = {}
+
+        if event_bus:
+            event_bus.subscribe(self.on_item_event)
+
+    def fit(self, cars: list[Car]) -> dict[str, float | None]:
+        """Fit every car that has no cached velocity yet, return velocities by car name."""
+        return {car.car_info.name: self.get_velocity(car) for car in cars}
+
+    def get_velocity(self, car: Car) -> float | None:
+        if id(car) not in self._velocities:
+            self._velocities[id(car)] = fit_mileage_velocity(sorted(get_mileage_points(car)))
+        return self._velocities[id(car)]
+
+    def invalidate(self, car: Car):
+        self._velocities.pop(id(car), None)
+
+    def clear(self):
+        self._velocities.clear()
+
+    def on_item_event(self, event: ItemEvent, item: ITEM):
+        if event == ItemEvent.due or isinstance(item, ScheduledLogEntry):
+            return
+
+        if event != ItemEvent.deleted and not isinstance(item, LogEntry):
+            return
+
+        if car := get_item_car(item):
+            self.invalidate(car)
+
+    def get_projected_due_date(self, entry: ScheduledLogEntry) -> datetime.date | None:
+        if entry.get_schedule_rule() == DueKind.date:
+            return entry.get_projected_due_date()
+
+        car = get_item_car(entry)
+        return entry.get_projected_due_date(self.get_velocity(car) if car else None)
+
+    def get_forecast(self, cars: list[Car], within_days: int = None) -> Forecast:
+        """Rank scheduled entries of all cars by projected due date, optionally only those due within n days.
+        Mileage-ruled entries of cars without enough mileage history can't be projected and are listed apart."""
+        forecast = Forecast()
+        today = date_string_to_date(TODAY)
+
+        for car in cars:
+            velocity = self.get_velocity(car)
+
+            for entry in get_scheduled_entries(car):
+                is_mileage = entry.get_schedule_rule() == DueKind.mileage
+                due_date = entry.get_projected_due_date(velocity if is_mileage else None)
+
+                if due_date is None:
+                    forecast.unknown.append(entry)
+                    continue
+
+                days = (due_date - today).days
+
+                if within_days is None or days <= within_days:
+                    forecast.entries.append(ForecastEntry(days, due_date, entry, velocity if is_mileage else None))
+
+        forecast.entries.sort()
+        return forecast
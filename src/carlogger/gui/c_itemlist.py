@@ -1,3 +1,6 @@
+from typing import Callable
+
+from carlogger.event_bus import ItemEvent
 from carlogger.items.item_sorter import ItemSorter
 from carlogger.items.log_entry import LogEntry
 from carlogger.const import ITEM
@@ -7,6 +10,7 @@ from carlogger.util import get_all_required_fields
 class ItemList:
     def __init__(self, parent, widget, app_session):
         self.items = []
+        self.item_filters: list[Callable[[ITEM], bool] | None] = []
         self.parent = parent
         self.widget = widget
         self.app_session = app_session
@@ -19,10 +23,19 @@ class ItemList:
         item_sorter.sort_method = sort_method
         return item_sorter.get_sorted_list(reverse)
 
-    def create_items(self, items: list[ITEM], header: str, sort_key: str = '*'):
+    def create_items(self, items: list[ITEM], header: str, sort_key: str = '*',
+                     item_filter: Callable[[ITEM], bool] = None):
+        """Create new list of items.\n
+        'item_filter' decides whether created or updated items belong to this list, the list then subscribes
+        to item events and patches its rows in place. Lists without it are never patched."""
         items = self.sort_items(items,
                                 'latest' if sort_key == '*' else sort_key)
         self.items.append(items)
+        self.item_filters.append(item_filter)
+
+        if item_filter and self.app_session:
+            self.app_session.event_bus.subscribe_batch(self.on_items_event)
+
         self.widget.create_items(items, header, self._get_sort_methods(items))
 
     def update_items(self, index: int, sort_key: str = '*', reverse: bool = False):
@@ -34,6 +47,42 @@ class ItemList:
     def request_item_update(self):
         self.app_session.request_item_update()
 
+    def on_items_event(self, event: ItemEvent, changed_items: list[ITEM]):
+        """Patch only the rows affected by the change instead of rebuilding the whole list,
+        rows removed by one bulk change are removed with a single re-render."""
+        for index, items in enumerate(self.items):
+            item_filter = self.item_filters[index]
+
+            if item_filter is None:
+                continue
+
+            removed_items = []
+
+            for item in changed_items:
+                is_listed = item in items
+                belongs = item_filter(item)
+
+                if is_listed and (event == ItemEvent.deleted or not belongs):
+                    items.remove(item)
+                    removed_items.append(item)
+                elif is_listed and event in (ItemEvent.updated, ItemEvent.due):
+                    self.widget.refresh_item(item, index)
+                elif not is_listed and belongs and event != ItemEvent.deleted:
+                    items.append(item)
+                    self.widget.add_item(item, index)
+
+            if removed_items:
+                self.widget.remove_items(removed_items, index)
+
+    def unsubscribe(self):
+        if self.app_session:
+            self.app_session.event_bus.unsubscribe_batch(self.on_items_event)
+
+    def clear(self):
+        self.unsubscribe()
+        self.items = []
+        self.item_filters = []
+
     def collapse_widget(self):
         self.widget.collapse_widget()
 
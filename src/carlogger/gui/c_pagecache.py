@@ -0,0 +1,100 @@
+from collections import OrderedDict
+
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.items.car_component import CarComponent
+from carlogger.items.component_collection import ComponentCollection
+from carlogger.items.log_entry import LogEntry
+from carlogger.const import ITEM
+
+
+class PageCache:
+    """Bounded LRU of built item pages keyed by item identity.\n
+    Every item event marks cached pages of the item and all of its ancestors as stale, a stale page is destroyed
+    instead of reused. Only cached pages are tracked, so nothing outlives the page it belongs to. Pages pushed out
+    of the cache are destroyed."""
+    def __init__(self, event_bus: EventBus = None, max_pages: int = 8):
+        self.max_pages = max_pages
+        self._pages: OrderedDict[int, tuple[ITEM, object]] = OrderedDict()
+        self._stale: set[int] = set()
+
+        if event_bus:
+            event_bus.subscribe(self.on_item_event)
+
+    def is_stale(self, item: ITEM) -> bool:
+        return id(item) in self._stale
+
+    def bump(self, item: ITEM):
+        """Mark cached pages of item and every item containing it as changed."""
+        for changed_item in [item, *self._get_ancestors(item)]:
+            if self._get_entry(changed_item):
+                self._stale.add(id(changed_item))
+
+    def on_item_event(self, event: ItemEvent, item: ITEM):
+        self.bump(item)
+
+    def get(self, item: ITEM):
+        """Return cached page of an item if the item didn't change since the page was built."""
+        if id(item) not in self._pages:
+            return None
+
+        cached_item, page = self._pages[id(item)]
+
+        if cached_item is not item or self.is_stale(item):
+            self._pop(id(item))
+            page.destroy()
+            return None
+
+        self._pages.move_to_end(id(item))
+        return page
+
+    def put(self, item: ITEM, page):
+        old_entry = self._pop(id(item))
+
+        if old_entry and old_entry[1] is not page:
+            old_entry[1].destroy()
+
+        self._pages[id(item)] = (item, page)
+
+        while len(self._pages) > self.max_pages:
+            self._pop(next(iter(self._pages)))[1].destroy()
+
+    def has_page(self, page) -> bool:
+        return any(cached_page is page for _, cached_page in self._pages.values())
+
+    def clear(self):
+        for _, page in self._pages.values():
+            page.destroy()
+
+        self._pages.clear()
+        self._stale.clear()
+
+    def __len__(self):
+        return len(self._pages)
+
+    def _get_entry(self, item: ITEM) -> tuple[ITEM, object] | None:
+        entry = self._pages.get(id(item))
+        return entry if entry and entry[0] is item else None
+
+    def _pop(self, key: int) -> tuple[ITEM, object] | None:
+        self._stale.discard(key)
+        return self._pages.pop(key, None)
+
+    def _get_ancestors(self, item: ITEM) -> list[ITEM]:
+        ancestors = []
+
+        if isinstance(item, LogEntry):
+            item = item.component
+            ancestors.append(item)
+
+        if isinstance(item, CarComponent):
+            item = item.parent
+            ancestors.append(item)
+
+        while isinstance(item, ComponentCollection):
+            if isinstance(item.parent_collection, ComponentCollection):
+                item = item.parent_collection
+            else:
+                item = item.car
+            ancestors.append(item)
+
+        return [ancestor for ancestor in ancestors if ancestor is not None]
@@ -2,6 +2,7 @@ from customtkinter import CTkImage
 from PIL import Image
 
 from carlogger.const import PATH
+from carlogger.gui.image_cache import image_cache
 
 # ===== Colors ===== #
 
@@ -9,11 +10,23 @@ BG_GRAY_PRIMARY = '#1b1c1b'
 BG_GRAY_SECONDARY = '#2e2e2e'
 BLUE_1 = '#35383d'
 
-car_png = Image.open(PATH.joinpath("./src/carlogger/gui/img/car.png"))
-collection_png = Image.open(PATH.joinpath("./src/carlogger/gui/img/collection.png"))
-component_png = Image.open(PATH.joinpath("./src/carlogger/gui/img/component.png"))
-house_png = Image.open(PATH.joinpath("./src/carlogger/gui/img/house.png"))
-search_png = Image.open(PATH.joinpath("./src/carlogger/gui/img/search.png"))
+# ===== Item Lists ===== #
+
+ITEM_LIST_PAGE_SIZE = 25
+
+
+def _load_icon(file_name: str) -> Image.Image:
+    """Decode bundled icon once at startup, every widget then shares the same image."""
+    with Image.open(PATH.joinpath("./src/carlogger/gui/img", file_name)) as img:
+        img.load()
+        return img
+
+
+car_png = _load_icon("car.png")
+collection_png = _load_icon("collection.png")
+component_png = _load_icon("component.png")
+house_png = _load_icon("house.png")
+search_png = _load_icon("search.png")
 
 # ===== Item Icons ===== #
 
@@ -53,12 +66,11 @@ component_icon_mini = CTkImage(light_image=component_png,
 
 
 def get_img_from_path(path, item) -> CTkImage:
-    try:
-        img = Image.open(path)
-    except OSError:
-        return item.image
+    """Get tile image of a user image through the shared image cache, fall back to item's default icon."""
+    if img := image_cache.get(path):
+        return img
 
-    return CTkImage(light_image=img, dark_image=img, size=(165, 165))
+    return item.image
 
 
 def get_img_from_class(item) -> CTkImage:
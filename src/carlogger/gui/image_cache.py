@@ -0,0 +1,112 @@
+"""Process-wide cache of user item images shown on tiles and item pages."""
+
+import hashlib
+import os
+import pathlib
+import threading
+
+from collections import OrderedDict
+
+from customtkinter import CTkImage
+from PIL import Image
+
+from carlogger.const import THUMBNAILS_PATH
+
+TILE_IMAGE_SIZE = (165, 165)
+
+
+class ImageCache:
+    """LRU cache of tile-sized images keyed by source path, modification time and file size.\n
+    Every source image is decoded only once: its tile-sized thumbnail is stored in 'thumbnail_dir' and read from
+    there on later runs. Decoded thumbnails are kept in memory until 'memory_budget' (in bytes) is exceeded,
+    least recently used images are evicted first."""
+    def __init__(self, memory_budget: int = 32 * 1024 * 1024, thumbnail_dir=THUMBNAILS_PATH,
+                 size: tuple[int, int] = TILE_IMAGE_SIZE):
+        self.memory_budget = memory_budget
+        self.thumbnail_dir = pathlib.Path(thumbnail_dir)
+        self.size = size
+
+        self.memory_used = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._images: OrderedDict[tuple, tuple[CTkImage, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path) -> CTkImage | None:
+        """Return tile image of target file or None if it can't be read."""
+        try:
+            key = self._create_key(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return self._images[key][0]
+
+        try:
+            img = self._load_thumbnail(path, key)
+        except OSError:
+            return None
+
+        image = CTkImage(light_image=img, dark_image=img, size=self.size)
+        cost = img.width * img.height * len(img.getbands())
+
+        with self._lock:
+            self.misses += 1
+            self._images[key] = (image, cost)
+            self.memory_used += cost
+            self._evict()
+
+        return image
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self.memory_used = 0
+
+    def __len__(self):
+        return len(self._images)
+
+    def _create_key(self, path) -> tuple[str, int, int]:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def _get_thumbnail_path(self, key: tuple) -> pathlib.Path:
+        digest = hashlib.sha1(repr((key, self.size)).encode()).hexdigest()
+        return self.thumbnail_dir.joinpath(f"{digest}.png")
+
+    def _load_thumbnail(self, path, key: tuple) -> Image.Image:
+        thumbnail_path = self._get_thumbnail_path(key)
+
+        try:
+            with Image.open(thumbnail_path) as img:
+                img.load()
+                return img
+        except OSError:
+            pass
+
+        with Image.open(path) as img:
+            img.draft('RGB', self.size)
+            img.thumbnail(self.size)
+            thumbnail = img.convert('RGBA') if img.mode not in ('RGB', 'RGBA') else img.copy()
+
+        try:
+            os.makedirs(self.thumbnail_dir, exist_ok=True)
+            thumbnail.save(thumbnail_path)
+        except OSError:
+            # Thumbnail on disk is only an optimization, the image is still usable
+            pass
+
+        return thumbnail
+
+    def _evict(self):
+        while self.memory_used > self.memory_budget and len(self._images) > 1:
+            _, (_, cost) = self._images.popitem(last=False)
+            self.memory_used -= cost
+
+
+image_cache = ImageCache()
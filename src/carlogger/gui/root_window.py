@@ -6,6 +6,7 @@ from carlogger.gui.w_editcollection import EditCollectionPopup
 from carlogger.gui.w_editcomponent import EditComponentPopup
 from carlogger.gui.w_homepage import Homepage
 from carlogger.gui.c_carlist import CarList
+from carlogger.gui.c_pagecache import PageCache
 from carlogger.gui.w_carlist import CarFrame
 from carlogger.gui.w_navigation import NavigationBar
 from carlogger.gui.w_editentry import EditEntryPopup
@@ -14,6 +15,12 @@ from carlogger.gui.w_addcar import AddCarPopup
 from carlogger.gui.w_addcollection import AddCollectionPopup
 from carlogger.gui.w_addcomponent import AddComponentPopup
 from carlogger.gui.w_itempage import CarPage, CollectionPage, ComponentPage
+from carlogger.gui.w_search import SearchPage
+from carlogger.fleet_loader import LoadEvent
+from carlogger.items.log_entry import LogEntry
+from carlogger.printer import Printer
+from carlogger.search_index import get_item_path
+from carlogger.util import is_scheduled_entry
 
 
 class RootWindow(CTk):
@@ -30,6 +37,7 @@ class RootWindow(CTk):
 
         self.title('Carlogger')
         self.geometry("1000x700")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -53,6 +61,7 @@ class RootWindow(CTk):
 
         self.car_list = None
         self.homepage = None
+        self.page_cache: PageCache = ...
 
     def _on_mousewheel(self, event):
         if event.num == 5 or event.delta == -120:
@@ -61,9 +70,51 @@ class RootWindow(CTk):
             self.canvas.yview_scroll(-1, "units")
 
     def start_mainloop(self):
+        self.page_cache = PageCache(self.app_session.event_bus)
         self.go_to_homepage()
+        self.poll_save_status()
+        self.poll_fleet_loader()
         self.mainloop()
 
+    def poll_fleet_loader(self):
+        """Hand cars loaded by the background loader over to the session and show their tiles as they come.\n
+        Only a few results are processed per tick so the window stays responsive while the fleet is loading."""
+        fleet_loader = self.app_session.fleet_loader
+
+        for event, payload in fleet_loader.poll():
+            match event:
+                case LoadEvent.CATALOG:
+                    self.navigation.set_load_progress(0, len(payload))
+                case LoadEvent.CAR_LOADED:
+                    if self.app_session.add_loaded_car(payload) and self.current_page is self.homepage:
+                        self.car_list.add_car(payload)
+                    self.navigation.set_load_progress(fleet_loader.loaded, fleet_loader.total)
+                case LoadEvent.CAR_FAILED:
+                    car, error = payload
+                    Printer.print_msg(car, 'LOAD_FAIL', name=car.car_info.name, relation=car.path,
+                                      reason=f"({error})")
+                case LoadEvent.FINISHED:
+                    self.navigation.hide_load_progress()
+
+                    if self.current_page is self.homepage:
+                        self.homepage.refresh_entries()
+                    return
+
+        self.after(50, self.poll_fleet_loader)
+
+    def poll_save_status(self):
+        """Mirror save queue state in the navigation bar, polled so the worker thread never touches Tk."""
+        if self.app_session:
+            self.navigation.set_save_status(self.app_session.save_queue.status)
+
+        self.after(250, self.poll_save_status)
+
+    def on_close(self):
+        if self.app_session:
+            self.app_session.close()
+
+        self.destroy()
+
     def reset_item_list_widget(self):
         self.homepage.item_container.collapse_widget()
 
@@ -134,8 +185,7 @@ class RootWindow(CTk):
         car_frame = CarFrame(self.homepage, self)
         car_frame.grid(row=0, column=0, sticky='nsew')
 
-        if self.current_page:
-            self.current_page.destroy()
+        self.close_current_page()
         self.current_page = self.homepage
 
         if not self.car_list:
@@ -147,12 +197,13 @@ class RootWindow(CTk):
         self.homepage.homepage_init()
 
     def go_to_car(self, car):
-        car_page = CarPage(self.scrollable_frame,
-                           root=self,
-                           item_ref=car,
-                           go_to_func=self.go_to_collection,
-                           add_widget_func=self.open_collection_add_window)
-        car_page.create_items(car.get_non_nested_collections())
+        if not (car_page := self.page_cache.get(car)):
+            car_page = CarPage(self.scrollable_frame,
+                               root=self,
+                               item_ref=car,
+                               go_to_func=self.go_to_collection,
+                               add_widget_func=self.open_collection_add_window)
+            car_page.create_items(car.get_non_nested_collections())
 
         self.open_page(car_page, car.car_info.name, car)
         self.selected_car = car
@@ -160,32 +211,89 @@ class RootWindow(CTk):
     def go_to_collection(self, collection):
         self.selected_collection = collection
 
-        collection_page = CollectionPage(self.scrollable_frame,
-                                         root=self,
-                                         item_ref=collection,
-                                         go_to_func=self.go_to_component,
-                                         add_widget_func=self.open_component_add_window)
+        if not (collection_page := self.page_cache.get(collection)):
+            collection_page = CollectionPage(self.scrollable_frame,
+                                             root=self,
+                                             item_ref=collection,
+                                             go_to_func=self.go_to_component,
+                                             add_widget_func=self.open_component_add_window)
 
-        collection_page.create_items(collection.children)
+            collection_page.create_items(collection.children)
 
         self.open_page(collection_page, collection.name, collection)
 
     def go_to_component(self, component):
         self.selected_component = component
 
+        if component_page := self.page_cache.get(component):
+            self.open_page(component_page, component.name, component)
+            return
+
         component_page = ComponentPage(self.scrollable_frame, root=self, item_ref=component)
 
         component_page.item_container.parent = component_page.item_list
         component_page.item_container.app_session = self.app_session
 
-        component_page.item_list.create_items(component.scheduled_log_entries, 'Scheduled Log Entries', 'oldest')
-        component_page.item_list.create_items(component.log_entries, 'Log Entries', 'latest')
+        component_page.item_list.create_items(component.scheduled_log_entries, 'Scheduled Log Entries', 'oldest',
+                                              lambda item: is_scheduled_entry(item) and item.component is component)
+        component_page.item_list.create_items(component.log_entries, 'Log Entries', 'latest',
+                                              lambda item: isinstance(item, LogEntry)
+                                              and not is_scheduled_entry(item) and item.component is component)
 
         self.open_page(component_page, component.name, component)
 
+    def show_search_results(self, text: str):
+        if not text:
+            if isinstance(self.current_page, SearchPage):
+                self.navigation.clear_items()
+                self.go_to_homepage()
+            return
+
+        hits = self.app_session.search(text, limit=50)
+
+        if not isinstance(self.current_page, SearchPage):
+            self.close_current_page()
+            self.current_page = SearchPage(self.scrollable_frame, self)
+
+        self.current_page.set_hits(text, hits)
+
+    def open_search_hit(self, item):
+        """Open page of the found item, entries are shown on the page of their component."""
+        if isinstance(item, LogEntry):
+            item = item.component
+
+        path = get_item_path(item)
+        self.navigation.clear_items()
+
+        for ancestor in path[:-1]:
+            self.navigation.add_nav_item(ancestor.car_info.name if ancestor is path[0] else ancestor.name, ancestor)
+
+        self.selected_car = path[0]
+
+        match item.__class__.__name__:
+            case 'Car':
+                self.go_to_car(item)
+            case 'ComponentCollection':
+                self.go_to_collection(item)
+            case 'CarComponent':
+                self.selected_collection = item.parent
+                self.go_to_component(item)
+
     def open_page(self, new_page, name, item_ref):
-        if self.current_page:
-            self.current_page.destroy()
+        if self.current_page is not new_page:
+            self.close_current_page()
 
+        new_page.show()
         self.current_page = new_page
+        self.page_cache.put(item_ref, new_page)
         self.navigation.add_nav_item(name, item_ref)
+
+    def close_current_page(self):
+        """Hide current page if it is kept in the page cache, destroy it otherwise."""
+        if not self.current_page:
+            return
+
+        if self.page_cache.has_page(self.current_page):
+            self.current_page.hide()
+        else:
+            self.current_page.destroy()
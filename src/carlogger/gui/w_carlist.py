@@ -37,7 +37,7 @@ class CarCard(CTkFrame):
 
     def get_item_image(self):
         if img := self.car.custom_info.get('image'):
-            return get_img_from_path(img)
+            return get_img_from_path(img, self)
         else:
             return self.image
 
@@ -113,6 +113,14 @@ class Container(CTkFrame, ABC):
         for item in items:
             self.add_item(item)
 
+    def update_items(self, items: list[ITEM]):
+        """Replace listed item tiles, keeping the add button in place."""
+        for widget_item in self.widget_items[1:]:
+            widget_item.inner_frame.destroy()
+
+        del self.widget_items[1:]
+        self.create_items(items)
+
     def go_to(self, item_ref: ITEM):
         self.go_to_func(item_ref)
 
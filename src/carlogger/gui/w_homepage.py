@@ -2,6 +2,8 @@ from customtkinter import CTkFrame, CTkButton
 
 from carlogger.gui.c_itemlist import ItemList
 from carlogger.gui.w_itemlist import ItemContainer
+from carlogger.event_bus import ItemEvent
+from carlogger.items.log_entry import LogEntry
 
 
 class Homepage(CTkFrame):
@@ -44,6 +46,9 @@ class Homepage(CTkFrame):
 
         self.item_list = ItemList(self, widget=self.item_container, app_session=self.root.app_session)
 
+        if self.root.app_session:
+            self.root.app_session.event_bus.subscribe_batch(self.on_items_event)
+
     def open_entry_add_window(self):
         self.root.open_entry_add_window_homepage(self, False)
 
@@ -58,9 +63,7 @@ class Homepage(CTkFrame):
 
     def homepage_init(self):
         if self.root.cars:
-            all_scheduled_entries = self._get_all_scheduled_entries()
-            scheduled_entries = self.item_list.sort_items(all_scheduled_entries, 'time_remaining')[
-                                :min(5, len(all_scheduled_entries)):]
+            scheduled_entries = self._get_next_scheduled_entries(5)
             self.create_items(scheduled_entries,
                               self.root.cars[0],
                               'Scheduled Log Entries',
@@ -72,6 +75,29 @@ class Homepage(CTkFrame):
                               self.root.cars[0],
                               'Log Entries')
 
+    def on_items_event(self, event: ItemEvent, items: list):
+        """Rebuild the top entries from cars already in memory once per change that touched any entry."""
+        if any(isinstance(item, LogEntry) for item in items):
+            self.refresh_entries()
+
+    def refresh_entries(self):
+        self.item_list.clear()
+        self.item_container.collapse_widget()
+        self.homepage_init()
+
+    def destroy(self):
+        if self.root.app_session:
+            self.root.app_session.event_bus.unsubscribe_batch(self.on_items_event)
+        super().destroy()
+
+    def _get_next_scheduled_entries(self, n: int) -> list:
+        """Take entries due the soonest from the session scheduler instead of sorting every scheduled entry."""
+        if self.root.app_session:
+            return [due_entry.entry for due_entry in self.root.app_session.scheduler.get_next_due(n)]
+
+        all_scheduled_entries = self._get_all_scheduled_entries()
+        return self.item_list.sort_items(all_scheduled_entries, 'time_remaining')[:n]
+
     def _get_all_scheduled_entries(self) -> list:
         cars = self.root.cars
         scheduled_entries = [car.get_all_scheduled_entry_logs() for car in cars]
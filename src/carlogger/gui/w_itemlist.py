@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from carlogger.gui.c_itemlist import ItemList
 from carlogger.gui.w_deletion_confirmation import DeletionConfirmation
-from carlogger.gui.const_gui import BG_GRAY_PRIMARY, BLUE_1
+from carlogger.gui.const_gui import BG_GRAY_PRIMARY, BLUE_1, ITEM_LIST_PAGE_SIZE
 
 from carlogger.const import ITEM
 
@@ -75,9 +75,18 @@ class ItemContainer(CTkFrame):
         sortable_item_list = self.item_list_widgets[index]
         sortable_item_list.update_items(items)
 
+    def add_item(self, item: ITEM, index: int):
+        self.item_list_widgets[index].add_row(item)
+
+    def remove_items(self, items: list[ITEM], index: int):
+        self.item_list_widgets[index].remove_rows(items)
+
+    def refresh_item(self, item: ITEM, index: int):
+        self.item_list_widgets[index].refresh_row(item)
+
     def refresh_items(self):
-        self.root.go_to_homepage()
-        self.root.go_to_component(self.component)
+        for item_list in self.item_list_widgets:
+            item_list.refresh_label()
 
     def add_sort_buttons(self, sort_methods: list[str], item_list: SortableItemList):
         for s in sort_methods:
@@ -88,18 +97,29 @@ class ItemContainer(CTkFrame):
             child.destroy()
         self.item_list_widgets = []
 
+    def destroy(self):
+        if isinstance(self.parent, ItemList):
+            self.parent.unsubscribe()
+        super().destroy()
+
 
 class SortableItemList(CTkFrame):
+    """List of entries rendered one page at a time.\n
+    Only rows of the visible page exist as widgets, they are recycled when the page, sort order or list content
+    changes instead of being destroyed and created again."""
     def __init__(self, master,
                  parent: ItemContainer,
                  header: str,
                  items,
                  index: int,
+                 page_size: int = ITEM_LIST_PAGE_SIZE,
                  **values):
         super().__init__(master, **values)
         self.parent: ItemContainer = parent
         self.header = header
         self.index = index
+        self.page_size = page_size
+        self.page = 0
 
         self.sort_buttons: list[SortButton] = []
         self.active_sort_button: SortButton = None
@@ -107,6 +127,7 @@ class SortableItemList(CTkFrame):
 
         self.items: list[ITEM] = items
         self.widget_items: list[Item] = []
+        self._spare_rows: list[Item] = []
 
         self.selected_items: list[Item] = []
 
@@ -144,6 +165,25 @@ class SortableItemList(CTkFrame):
         self.item_frame = CTkFrame(master=self.parent, fg_color=BG_GRAY_PRIMARY)
         self.item_frame.pack(fill='x', padx=10, pady=10)
 
+        self.page_buttons_frame = CTkFrame(master=self.parent, fg_color='transparent')
+
+        self.prev_page_button = CTkButton(self.page_buttons_frame,
+                                          text='<',
+                                          font=('Lato', 17),
+                                          width=35,
+                                          command=self.go_to_previous_page)
+        self.prev_page_button.grid(row=0, column=0, padx=5)
+
+        self.page_label = CTkLabel(self.page_buttons_frame, text='', font=('Lato', 17), width=150)
+        self.page_label.grid(row=0, column=1, padx=5)
+
+        self.next_page_button = CTkButton(self.page_buttons_frame,
+                                          text='>',
+                                          font=('Lato', 17),
+                                          width=35,
+                                          command=self.go_to_next_page)
+        self.next_page_button.grid(row=0, column=2, padx=5)
+
         self.update_items(self.items)
         self.set_add_button_message()
 
@@ -178,7 +218,6 @@ class SortableItemList(CTkFrame):
             entries.append(item.item_ref)
 
         self.parent.root.delete_entries(entries)
-        self.refresh_items()
 
     def sort_items(self, sort_key: str, button_ref, reverse: bool):
         if self.active_sort_button and self.active_sort_button != button_ref:
@@ -213,50 +252,143 @@ class SortableItemList(CTkFrame):
         return sort_method in items
 
     def update_items(self, items: list):
-        self.clear_items()
-        self.items = []
+        """Show new (e.g. re-sorted) list of items starting from the first page."""
+        self.items = list(items)
+        self.page = 0
+        self.render_page()
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-len(self.items) // self.page_size))
+
+    def get_visible_items(self) -> list[ITEM]:
+        start = self.page * self.page_size
+        return self.items[start:start + self.page_size]
+
+    def go_to_next_page(self):
+        if self.page + 1 < self.page_count:
+            self.page += 1
+            self.render_page()
+
+    def go_to_previous_page(self):
+        if self.page > 0:
+            self.page -= 1
+            self.render_page()
+
+    def render_page(self):
+        """Bind visible items to row widgets, reusing existing rows and hiding the unused ones."""
+        self.page = min(self.page, self.page_count - 1)
+        visible_items = self.get_visible_items()
+        self.clear_selection()
+
+        if any(type(row) is not self._get_row_class(item) for row, item in zip(self.widget_items, visible_items)):
+            self.clear_items()
+
+        for row, item in enumerate(visible_items):
+            row_id = self.page * self.page_size + row
+
+            if row < len(self.widget_items):
+                self.widget_items[row].set_item(item, row_id)
+            else:
+                self.create_item(item, row_id)
 
-        for item in items:
-            self.create_item(item)
+        for widget in self.widget_items[len(visible_items):]:
+            widget.pack_forget()
+            self._spare_rows.append(widget)
+
+        del self.widget_items[len(visible_items):]
+
+        self.refresh_label()
+        self.refresh_page_buttons()
+
+    def refresh_page_buttons(self):
+        if self.page_count < 2:
+            self.page_buttons_frame.pack_forget()
+            return
+
+        self.page_buttons_frame.pack(after=self.item_frame, anchor='e', padx=10, pady=5)
+        start = self.page * self.page_size
+        self.page_label.configure(text=f"{start + 1}-{start + len(self.widget_items)} of {len(self.items)}")
+        self.prev_page_button.configure(state='normal' if self.page > 0 else 'disabled')
+        self.next_page_button.configure(state='normal' if self.page + 1 < self.page_count else 'disabled')
+
+    def clear_selection(self):
+        for widget in self.selected_items:
+            widget.is_selected.set(False)
+
+        self.selected_items = []
+
+        if not self.parent.homepage:
+            self.set_delete_button_message()
 
     def refresh_items(self):
         self.parent.refresh_items()
 
+    def refresh_label(self):
         try:
-            self.item_label.configure(text=f"{self.header} [{len(self.widget_items)}]")
+            self.item_label.configure(text=f"{self.header} [{len(self.items)}]")
         except Exception:
             pass
 
-    def create_item(self, item_obj, row=-1):
-        if item_obj.__class__.__name__ == 'ScheduledLogEntry':
-            self.create_scheduled_entry(item_obj, row)
+    def add_row(self, item_obj: ITEM):
+        """Append newly created item, only the page it lands on is re-rendered."""
+        self.items.append(item_obj)
+
+        if len(self.items) > (self.page + 1) * self.page_size:
+            self.refresh_label()
+            self.refresh_page_buttons()
         else:
-            self.create_log_entry(item_obj, row)
+            self.render_page()
 
-        self.item_label.configure(text=f"{self.header} [{len(self.widget_items)}]")
+    def remove_rows(self, item_objs: list[ITEM]):
+        """Remove target items and rebind rows of the current page once."""
+        removed_ids = {id(item_obj) for item_obj in item_objs}
+        items = [item for item in self.items if id(item) not in removed_ids]
 
-    def create_log_entry(self, item_obj, row: int = -1):
-        if row == -1:
-            row = len(self.items)
+        if len(items) != len(self.items):
+            self.items = items
+            self.render_page()
 
-        new_item = Item(master=self.item_frame,
-                        parent=self,
-                        item_ref=item_obj,
-                        row=row,
-                        homepage=self.parent.homepage)
-        self.widget_items.append(new_item)
+    def refresh_row(self, item_obj: ITEM):
+        """Update labels of the row displaying target item."""
+        for widget in self.widget_items:
+            if widget.item_ref is item_obj:
+                widget.update_all_info()
+                break
 
-    def create_scheduled_entry(self, item_obj, row: int = -1):
+    def _get_row_class(self, item_obj: ITEM) -> type[Item]:
+        if item_obj.__class__.__name__ == 'ScheduledLogEntry':
+            return ScheduledLogEntryItem
+        return Item
+
+    def create_item(self, item_obj, row=-1):
+        """Show item in a spare row widget, a new row is created only if there is none left."""
         if row == -1:
-            row = len(self.items)
+            row = len(self.widget_items)
+
+        row_class = self._get_row_class(item_obj)
 
-        new_item = ScheduledLogEntryItem(master=self.item_frame,
-                                         parent=self,
-                                         item_ref=item_obj,
-                                         row=row,
-                                         homepage=self.parent.homepage)
+        for widget in self._spare_rows:
+            if type(widget) is row_class:
+                self._spare_rows.remove(widget)
+                widget.pack(expand=True, fill='x', padx=10, pady=5)
+                widget.set_item(item_obj, row)
+                self.widget_items.append(widget)
+                return
+
+        new_item = row_class(master=self.item_frame,
+                             parent=self,
+                             item_ref=item_obj,
+                             row=row,
+                             homepage=self.parent.homepage)
         self.widget_items.append(new_item)
 
+    def create_log_entry(self, item_obj, row: int = -1):
+        self.create_item(item_obj, row)
+
+    def create_scheduled_entry(self, item_obj, row: int = -1):
+        self.create_item(item_obj, row)
+
     def update_item(self, item, item_ref: ITEM, data_to_update: list[str]):
         item.item_ref = item_ref
 
@@ -278,6 +410,7 @@ class SortableItemList(CTkFrame):
         for child in self.item_frame.winfo_children():
             child.destroy()
         self.widget_items = []
+        self._spare_rows = []
 
     def open_entry_edit_window(self, item_ref: ITEM, item_widget):
         self.parent.root.open_entry_edit_window(item_ref, item_widget)
@@ -483,10 +616,10 @@ class Item(CTkFrame):
         self.date_label.configure(text=self._get_date())
 
     def update_desc(self):
-        self.desc_label.configure(text=self.item_ref.desc)
+        self.desc_label.configure(text=self._get_item_name())
 
     def update_component(self):
-        self.parent_label.configure(text=self.item_ref.component.name)
+        self.parent_label.configure(text=self._get_component_name())
 
     def update_category(self):
         self.category_label.configure(text=self._get_item_category())
@@ -497,6 +630,15 @@ class Item(CTkFrame):
     def update_custom_info(self):
         self.create_custom_info()
 
+    def set_item(self, item_ref: ITEM, row: int):
+        """Rebind recycled row to another item."""
+        self.item_ref = item_ref
+        self.id = row
+        self.update_all_info()
+
+        if self.homepage:
+            self.parent_car_label.configure(text=self.item_ref.component.parent.car.car_info.name)
+
     def update_all_info(self):
         self.update_desc()
         self.update_date()
@@ -566,6 +708,12 @@ class ScheduledLogEntryItem(Item):
                 case 'date': self.date_label.configure(text_color='white')
                 case 'mileage': self.mileage_label.configure(text_color='white')
 
+    def update_all_info(self):
+        super().update_all_info()
+
+        if not self.homepage:
+            self._set_time_remaining_text_color()
+
     def _get_mileage(self):
         if self.item_ref.get_schedule_rule() == 'mileage':
             return f"{self.item_ref.mileage} km\n" \
@@ -574,9 +722,5 @@ class ScheduledLogEntryItem(Item):
         return f"{self.item_ref.mileage} km"
 
     def mark_entry_as_complete(self):
-        entry = self.parent.parent.app_session.set_scheduled_entry_as_done(self.parent.parent.parent_car, self.item_ref)
-        self.parent.update_item(self, entry, ['date', 'mileage'])
-
-        new_entry = self.item_ref.component.latest_entry
-        self.parent.parent.item_list_widgets[1].create_log_entry(new_entry)
-        self.parent.refresh_items()
+        # Rows of the new log entry and of the rescheduled entry are patched through item events
+        self.parent.parent.app_session.set_scheduled_entry_as_done(self.parent.parent.parent_car, self.item_ref)
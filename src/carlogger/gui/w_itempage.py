@@ -1,5 +1,6 @@
 from customtkinter import CTkFrame
 
+from carlogger.event_bus import ItemEvent
 from carlogger.gui.c_itemlist import ItemList
 from carlogger.gui.w_genericlist import Container
 from carlogger.gui.w_collectionlist import CollectionContainer
@@ -14,6 +15,9 @@ class ItemPage:
                  itembox_widget=ItemInfoBox):
         self.item_ref = item_ref
         self.itembox_widget = itembox_widget
+        self.destroyed = False
+        self.listed_items = []
+        self.app_session = root.app_session
 
         self.container = container
 
@@ -30,17 +34,47 @@ class ItemPage:
                                    add_widget_func=add_widget_func,
                                    item_page_ref=self)
 
+        if self.app_session:
+            self.app_session.event_bus.subscribe_batch(self.on_items_event)
+
     def create_items(self, items: list):
+        self.listed_items = list(items)
         self.container.create_items(items)
 
+    def get_children(self) -> list:
+        return self.item_ref.children
+
+    def on_items_event(self, event: ItemEvent, items: list):
+        """Rebuild item tiles once when any of the listed children is added, changed or removed."""
+        if event == ItemEvent.due or self.destroyed:
+            return
+
+        children = self.get_children()
+
+        if any(item in self.listed_items or item in children for item in items):
+            self.listed_items = list(children)
+            self.container.update_items(children)
+
     def get_item_img(self):
         if img := self.item_ref.custom_info.get('image'):
             return get_img_from_path(img, self)
         else:
             return self.container.image
 
+    def show(self):
+        self.main_frame.grid()
+
+    def hide(self):
+        self.main_frame.grid_remove()
+
     def destroy(self):
-        self.main_frame.destroy()
+        if not self.destroyed:
+            self.destroyed = True
+
+            if self.app_session:
+                self.app_session.event_bus.unsubscribe_batch(self.on_items_event)
+
+            self.main_frame.destroy()
 
 
 class CarPage(ItemPage):
@@ -48,6 +82,9 @@ class CarPage(ItemPage):
                  itembox_widget=ItemInfoBox):
         super().__init__(master, root, item_ref, go_to_func, add_widget_func, container, itembox_widget)
 
+    def get_children(self) -> list:
+        return self.item_ref.get_non_nested_collections()
+
 
 class CollectionPage(ItemPage):
     def __init__(self, master, root, item_ref, go_to_func, add_widget_func, container=ComponentContainer,
@@ -59,6 +96,7 @@ class ComponentPage:
     def __init__(self, master, root, item_ref, itembox_widget=ComponentInfoBox):
         self.item_ref = item_ref
         self.itembox_widget = itembox_widget
+        self.destroyed = False
 
         self.main_frame = CTkFrame(master)
         self.main_frame.grid(row=0, column=0, sticky='nsew')
@@ -79,5 +117,13 @@ class ComponentPage:
         else:
             return component_icon
 
+    def show(self):
+        self.main_frame.grid()
+
+    def hide(self):
+        self.main_frame.grid_remove()
+
     def destroy(self):
-        self.main_frame.destroy()
+        if not self.destroyed:
+            self.destroyed = True
+            self.main_frame.destroy()
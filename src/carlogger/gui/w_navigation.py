@@ -1,6 +1,6 @@
-from customtkinter import CTkFrame, CTkButton, CTkLabel
+from customtkinter import CTkFrame, CTkButton, CTkLabel, CTkProgressBar, CTkEntry
 
-from carlogger.gui.const_gui import BG_GRAY_PRIMARY, get_img_from_class
+from carlogger.gui.const_gui import BG_GRAY_PRIMARY, get_img_from_class, search_icon_mini
 
 
 class NavigationBar(CTkFrame):
@@ -29,6 +29,24 @@ class NavigationBar(CTkFrame):
         self.main_frame.grid_columnconfigure(7, weight=0)
         self.main_frame.grid_columnconfigure(8, weight=1)
 
+        self.save_status_label = CTkLabel(master=self.master_frame, text='', font=('Lato', 15))
+        self.save_status_label.pack(side='right', padx=10)
+
+        self.search_entry = CTkEntry(master=self.master_frame,
+                                     placeholder_text='Search',
+                                     font=('Lato', 15),
+                                     width=200)
+        self.search_entry.pack(side='right', padx=5)
+        self.search_entry.bind('<KeyRelease>', self.on_search_typed)
+
+        self.search_icon = CTkLabel(master=self.master_frame, text='', image=search_icon_mini)
+        self.search_icon.pack(side='right')
+
+        self._search_job = None
+
+        self.load_progress_label = CTkLabel(master=self.master_frame, text='', font=('Lato', 15))
+        self.load_progress_bar = CTkProgressBar(master=self.master_frame, width=120)
+
     def add_nav_item(self, name: str, item_ref, **kwargs):
         if item_ref in self.nav_items:
             return
@@ -47,6 +65,44 @@ class NavigationBar(CTkFrame):
                            column=self._get_column())
         self.nav_widgets.append(nav_item)
 
+    def set_save_status(self, status: str):
+        if self.save_status_label.cget('text') != status:
+            self.save_status_label.configure(text=status)
+
+    def on_search_typed(self, *args):
+        """Debounce typing, search runs only after the user stops typing for a moment."""
+        if self._search_job:
+            self.after_cancel(self._search_job)
+
+        self._search_job = self.after(250, self.run_search)
+
+    def run_search(self):
+        self._search_job = None
+        self.root.show_search_results(self.search_entry.get().strip())
+
+    def clear_items(self):
+        """Remove every navigation item except for 'Home'."""
+        for widget in self.nav_widgets[1:]:
+            widget.button.grid_forget() if isinstance(widget, NavItem) else widget.separator.grid_forget()
+            widget.destroy()
+
+        self.nav_widgets = self.nav_widgets[:1]
+        self.nav_items = self.nav_items[:1]
+        self.current_item = self.nav_items[-1] if self.nav_items else None
+
+    def set_load_progress(self, loaded: int, total: int):
+        """Show how many cars have been loaded so far."""
+        if not self.load_progress_bar.winfo_ismapped():
+            self.load_progress_bar.pack(side='right', padx=5)
+            self.load_progress_label.pack(side='right', padx=5)
+
+        self.load_progress_label.configure(text=f"Loading cars {loaded}/{total}")
+        self.load_progress_bar.set(loaded / total if total else 1)
+
+    def hide_load_progress(self):
+        self.load_progress_bar.pack_forget()
+        self.load_progress_label.pack_forget()
+
     def add_separator(self):
         separator = Separator(self,
                               widget_master=self.main_frame,
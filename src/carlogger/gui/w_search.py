@@ -0,0 +1,41 @@
+from customtkinter import CTkFrame, CTkButton, CTkLabel
+
+from carlogger.gui.const_gui import BG_GRAY_PRIMARY, BLUE_1, get_img_from_class
+from carlogger.search_index import SearchHit
+
+
+class SearchPage(CTkFrame):
+    """Lists search hits, the same page is refilled while the user keeps typing."""
+    def __init__(self, master, root, **kwargs):
+        super().__init__(master, fg_color='transparent', **kwargs)
+        self.root = root
+        self.hit_widgets: list[CTkButton] = []
+
+        self.grid(row=0, column=0, sticky='nsew')
+        self.grid_columnconfigure(0, weight=1)
+
+        self.header_label = CTkLabel(self, text='', font=('Lato', 20), anchor='w')
+        self.header_label.grid(row=0, column=0, sticky='ew', padx=10, pady=5)
+
+        self.hit_frame = CTkFrame(self, fg_color=BG_GRAY_PRIMARY)
+        self.hit_frame.grid(row=1, column=0, sticky='nsew', padx=10, pady=10)
+        self.hit_frame.grid_columnconfigure(0, weight=1)
+
+    def set_hits(self, text: str, hits: list[SearchHit]):
+        for widget in self.hit_widgets:
+            widget.destroy()
+
+        self.hit_widgets = []
+        self.header_label.configure(text=f"Results for '{text}' [{len(hits)}]")
+
+        for row, hit in enumerate(hits):
+            hit_button = CTkButton(self.hit_frame,
+                                   text=f"{hit.get_location()}  |  {hit.text}",
+                                   image=get_img_from_class(hit.item),
+                                   font=('Lato', 17),
+                                   fg_color=BLUE_1,
+                                   anchor='w',
+                                   corner_radius=0,
+                                   command=lambda item=hit.item: self.root.open_search_hit(item))
+            hit_button.grid(row=row, column=0, sticky='ew', padx=10, pady=3)
+            self.hit_widgets.append(hit_button)
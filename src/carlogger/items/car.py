@@ -6,11 +6,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from carlogger.printer import Printer
-from carlogger.util import format_date_string_to_tuple, create_car_dir_path
+from carlogger.util import format_date_string_to_tuple, create_car_dir_path, create_item_id
 from carlogger.items.car_info import CarInfo
 from carlogger.items.component_collection import ComponentCollection
 from carlogger.items.car_component import CarComponent
 from carlogger.items.log_entry import LogEntry, ScheduledLogEntry
+from carlogger.items.tag_index import TagIndex
 
 
 @dataclass
@@ -19,6 +20,7 @@ class Car:
     car_info: CarInfo
     collections: list[ComponentCollection] = field(default_factory=list)
     path: Path = ""
+    tag_index: TagIndex = field(default_factory=TagIndex, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.path == "":
@@ -43,6 +45,12 @@ class Car:
         entries = [comp.latest_entry for comp in comps]
         return entries[-1]
 
+    def propagate_mileage(self):
+        """Raise current mileage of every component that is behind the car mileage."""
+        for component in self.get_all_components():
+            if component.current_mileage < self.car_info.mileage:
+                component.current_mileage = self.car_info.mileage
+
     def get_non_nested_collections(self) -> list[ComponentCollection]:
         """Get only collections belonging to this car that aren't children of other collections."""
         non_nested = filter(lambda coll: coll.parent_collection in (None, ""), self.collections)
@@ -77,7 +85,8 @@ class Car:
         try:
             self._check_for_collection_duplicates(name=name)
 
-            new_collection = ComponentCollection(name, car=self, path=self.path.joinpath("collections"))
+            new_collection = ComponentCollection(name, car=self, path=self.path.joinpath("collections"),
+                                                 id=create_item_id())
             self.collections.append(new_collection)
             Printer.print_msg(new_collection, 'ADD_SUCCESS', name=new_collection.name, relation=self.car_info.name)
 
@@ -91,7 +100,7 @@ class Car:
 
         parent_collection = self.get_collection_by_name(parent_collection_name)
         new_collection = ComponentCollection(name, car=self, parent_collection=parent_collection,
-                                             path=self.path.joinpath("collections"))
+                                             path=self.path.joinpath("collections"), id=create_item_id())
         parent_collection.collections.append(new_collection)
 
         self.collections.append(new_collection)
@@ -105,6 +114,8 @@ class Car:
         collection_to_remove = self.get_collection_by_name(name)
 
         if collection_to_remove:
+            for entry in collection_to_remove.get_all_entry_logs(include_scheduled=True):
+                self.tag_index.remove(entry)
 
             if parent := collection_to_remove.parent_collection:
                 parent.delete_collection(name)
@@ -120,8 +131,43 @@ class Car:
         else:
             Printer.print_msg(ComponentCollection, 'DEL_FAIL', name=name, relation=self.car_info.name)
 
-    def delete_children(self):
+    def delete_collections(self, names: list[str]) -> list[ComponentCollection]:
+        """Delete many collections by name together with all their nested collections in a single pass,
+        return every deleted collection."""
+        nested_collections: dict[int, list[ComponentCollection]] = {}
+
+        for coll in self.collections:
+            if coll.parent_collection:
+                nested_collections.setdefault(id(coll.parent_collection), []).append(coll)
+
+        names = set(names)
+        deleted_collections: dict[int, ComponentCollection] = {}
+        stack = [coll for coll in self.collections if coll.name in names]
+
+        while stack:
+            coll = stack.pop()
+
+            if id(coll) not in deleted_collections:
+                deleted_collections[id(coll)] = coll
+                stack.extend(nested_collections.get(id(coll), []))
+
+        self.collections[:] = [coll for coll in self.collections if id(coll) not in deleted_collections]
+        self.tag_index.remove_many([entry for coll in deleted_collections.values()
+                                    for comp in coll.components for entry in comp.get_all_entry_logs()])
+
+        for coll in deleted_collections.values():
+            parent = coll.parent_collection
+
+            if parent and id(parent) not in deleted_collections:
+                parent.delete_collection(coll.name)
+
+            Printer.print_msg(coll, 'DEL_SUCCESS', name=coll.name, relation=self.car_info.name)
+
+        return list(deleted_collections.values())
+
+    def delete_children(self) -> list[ComponentCollection]:
         """Clear all collections, components and entry logs."""
+        return self.delete_collections([coll.name for coll in self.collections])
 
 
     def _check_for_collection_duplicates(self, name):
@@ -16,6 +16,7 @@ from carlogger.const import TODAY
 
 if TYPE_CHECKING:
     from carlogger.items.component_collection import ComponentCollection
+    from carlogger.items.tag_index import TagIndex
 
 
 @dataclass(order=True)
@@ -36,6 +37,7 @@ class CarComponent:
     custom_info: dict[str, ...] = field(default_factory=dict)
 
     path: str = ""
+    id: str = ""
     _sort_index: str = field(init=False, repr=False, default='')
 
     def __post_init__(self):
@@ -73,6 +75,7 @@ class CarComponent:
             Printer.print_msg(None, 'ADD_FAIL', name="new entry", relation=self.name)
         else:
             self.log_entries.append(new_entry)
+            self._index_entry(new_entry)
 
             Printer.print_msg(new_entry, 'ADD_SUCCESS', name=f"Entry of id '{new_entry.id}'", relation=self.name)
 
@@ -93,6 +96,7 @@ class CarComponent:
                              _id=entry_data['id'],
                              custom_info=entry_data.get('custom_info') or {})
         self.log_entries.append(new_entry)
+        self._index_entry(new_entry)
 
         self._update_current_part(new_entry)
         self._update_mileage(new_entry)
@@ -124,6 +128,7 @@ class CarComponent:
             Printer.print_msg(new_entry, 'ADD_SUCCESS',
                               name=f"Scheduled entry of id '{new_entry.id}'", relation=self.name)
             self.scheduled_log_entries.append(new_entry)
+            self._index_entry(new_entry)
 
             return new_entry.id
 
@@ -153,6 +158,7 @@ class CarComponent:
                               reason=f"reason={e}")
         else:
             self.scheduled_log_entries.append(new_entry)
+            self._index_entry(new_entry)
 
             return new_entry.id
 
@@ -184,11 +190,13 @@ class CarComponent:
         Unique ID of updated entry cannot be changed."""
 
         entry_to_update = self.get_entry_by_id(entry_id)
+        self._unindex_entry(entry_to_update)
 
         for k, v in changes.items():
             if k not in ("_id", "id"):
-                entry_to_update.to_json()[k] = v
+                setattr(entry_to_update, k, v)
 
+        self._index_entry(entry_to_update)
         self._update_mileage(entry_to_update)
 
     def delete_entry_by_id(self, entry_id: str):
@@ -204,16 +212,39 @@ class CarComponent:
                 case 'ScheduledLogEntry':
                     self.scheduled_log_entries.remove(entry_to_delete)
 
+            self._unindex_entry(entry_to_delete)
+
             Printer.print_msg(entry_to_delete, 'DEL_SUCCESS',
                               name=f"Entry of id '{entry_to_delete.id}'", relation=self.name)
         else:
             Printer.print_msg(LogEntry, 'DEL_FAIL',
                               name=f"Entry of id '{entry_to_delete.id}'", relation=self.name)
 
+    def delete_entries_by_id(self, entry_ids: list[str]) -> list[LogEntry | ScheduledLogEntry]:
+        """Delete many log entries in a single pass and return the deleted ones, unknown ids are skipped."""
+        entry_ids = set(entry_ids)
+        deleted_entries = [entry for entry in self.get_all_entry_logs() if entry.id in entry_ids]
+
+        if not deleted_entries:
+            Printer.print_msg(LogEntry, 'DEL_FAIL', name="Entries", relation=self.name, reason="as none were found")
+            return []
+
+        self.log_entries[:] = [entry for entry in self.log_entries if entry.id not in entry_ids]
+        self.scheduled_log_entries[:] = [entry for entry in self.scheduled_log_entries if entry.id not in entry_ids]
+
+        if tag_index := self._get_tag_index():
+            tag_index.remove_many(deleted_entries)
+
+        self.refresh_parts()
+        Printer.print_msg(LogEntry, 'DEL_SUCCESS', name=f"{len(deleted_entries)} entries", relation=self.name)
+
+        return deleted_entries
+
     def delete_entry_by_index(self, entry_index: int = -1):
         """Removes log entry from list at target index, removes last one by default."""
         try:
             deleted_entry = self.log_entries.pop(entry_index)
+            self._unindex_entry(deleted_entry)
             self.refresh_parts()
             Printer.print_msg(LogEntry, 'DEL_SUCCESS',
                               name=f"Entry of id '{deleted_entry.id}'", relation=self.name)
@@ -224,6 +255,9 @@ class CarComponent:
 
     def delete_children(self, clear_parts=False):
         """Delete all entry logs."""
+        for entry in self.get_all_entry_logs():
+            self._unindex_entry(entry)
+
         self.log_entries.clear()
         self.scheduled_log_entries.clear()
 
@@ -231,6 +265,21 @@ class CarComponent:
             self.current_part = None
             self.part_list = []
 
+    def _get_tag_index(self) -> TagIndex | None:
+        """Return tag index of the parent car, None if component is not attached to a car yet."""
+        try:
+            return self.parent.car.tag_index
+        except AttributeError:
+            return None
+
+    def _index_entry(self, entry: LogEntry):
+        if tag_index := self._get_tag_index():
+            tag_index.add(entry)
+
+    def _unindex_entry(self, entry: LogEntry):
+        if tag_index := self._get_tag_index():
+            tag_index.remove(entry)
+
     def get_entry_by_id(self, entry_id: str) -> LogEntry | ScheduledLogEntry | None:
         """Return log entry by its unique id hash."""
         i = 0
@@ -254,6 +303,7 @@ class CarComponent:
     def to_json(self) -> dict:
         """Returns object properties as JSON-serializable dictionary."""
         d = {'type': 'component',
+             'id': self.id,
              'name': self.name,
              'current_part': self._clamp_current_part(),
              'part_list': [part.to_json() for part in self.part_list],
@@ -295,6 +345,9 @@ class CarComponent:
         if '.' in self.path.suffix:
             return self.path
 
+        if self.id:
+            return self.path.joinpath(f"{self.id}.{extension}")
+
         return self.path.joinpath(f"{self.parent.name}_{self.name.replace(' ', '_')}.{extension}")
 
     def get_formatted_info(self) -> str:
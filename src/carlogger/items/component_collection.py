@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 
 from carlogger.items.car_component import CarComponent
 from carlogger.printer import Printer
+from carlogger.util import create_item_id
 from carlogger.items.log_entry import LogEntry, ScheduledLogEntry
 
 
@@ -37,6 +38,7 @@ class ComponentCollection:
 
     custom_info: dict[str, ...] = field(default_factory=dict)
     path: str = ""
+    id: str = ""
 
     def __post_init__(self):
         self.path = pathlib.Path(self.path)
@@ -98,7 +100,7 @@ class ComponentCollection:
         """Create new car component, add it to the list and return object reference."""
         if not self._check_for_component_duplicates(name):
             new_component = CarComponent(name, desc=desc, custom_info=kwargs,
-                                         path=self.path.parent.joinpath('components'))
+                                         path=self.path.parent.joinpath('components'), id=create_item_id())
             new_component.parent = self
             new_component.current_mileage = self.car.mileage
 
@@ -115,6 +117,10 @@ class ComponentCollection:
         component_to_remove = self.get_component_by_name(name)
 
         if component_to_remove:
+            if self.car:
+                for entry in component_to_remove.get_all_entry_logs():
+                    self.car.tag_index.remove(entry)
+
             self.components.remove(component_to_remove)
             Printer.print_msg(component_to_remove, 'DEL_SUCCESS', name=component_to_remove.name,
                               relation=f"{self.car.car_info.name}->{self.name}")
@@ -122,6 +128,21 @@ class ComponentCollection:
             Printer.print_msg(component_to_remove, 'DEL_FAIL', name=component_to_remove.name,
                               relation=f"{self.car.car_info.name}->{self.name}")
 
+    def delete_components(self, names: list[str]) -> list[CarComponent]:
+        """Delete many components by name in a single pass and return the deleted ones."""
+        names = set(names)
+        deleted_components = [comp for comp in self.components if comp.name in names]
+        self.components[:] = [comp for comp in self.components if comp.name not in names]
+
+        if self.car:
+            self.car.tag_index.remove_many([entry for comp in deleted_components
+                                            for entry in comp.get_all_entry_logs()])
+
+        for comp in deleted_components:
+            Printer.print_msg(comp, 'DEL_SUCCESS', name=comp.name, relation=f"{self.car.car_info.name}->{self.name}")
+
+        return deleted_components
+
     def delete_collection(self, name: str):
         collection_to_remove = self.get_collection_by_name(name)
 
@@ -163,7 +184,8 @@ class ComponentCollection:
         Printer.print_msg(c, 'READ_FAIL', name=name, relation=f"{self.car.car_info.name}->{self.name}")
     
     def to_json(self) -> dict:
-        d = {'name': self.name,
+        d = {'id': self.id,
+             'name': self.name,
              'desc': self.desc,
              'parent_collection': self._get_parent_collection_path(self.parent_collection),
              'collections': [self._create_child_collection_reference(child, "json") for child in self.collections],
@@ -172,22 +194,41 @@ class ComponentCollection:
              }
         return d
 
+    def to_portable_json(self) -> dict:
+        """Dictionary for files outside the save directory, children are referenced by name and path of their save
+        file instead of by id alone so that the file can be imported into any car."""
+        return {**self.to_json(),
+                'collections': [self._create_portable_reference(child) for child in self.collections],
+                'components': [self._create_portable_reference(child) for child in self.components]}
+
+    def _create_portable_reference(self, obj: CarComponent | ComponentCollection) -> dict:
+        info = self._clamp_vague_info(obj, "json")
+        return {'name': info[0],
+                'path': info[1]}
+
     def _get_parent_collection_path(self, parent_collection: ComponentCollection) -> str:
+        """Id of the parent collection, or path to its save file if it has no id yet."""
         if parent_collection not in (None, ""):
-            return str(self.parent_collection.get_target_path("json"))
+            return self.parent_collection.id or str(self.parent_collection.get_target_path("json"))
         else:
             return ""
 
     def _create_child_reference(self, obj: CarComponent | ComponentCollection, extension: str) -> dict:
+        """Children with an id are referenced by it alone, so renaming a child leaves this file untouched."""
+        if child_id := self._get_child_id(obj):
+            return {'id': child_id}
+
         info = self._clamp_vague_info(obj, extension)
         return {'name': info[0],
                 'path': info[1]}
 
     def _create_child_collection_reference(self, obj: ComponentCollection, extension: str) -> dict:
-        info = self._clamp_vague_info(obj, extension)
+        return self._create_child_reference(obj, extension)
 
-        return {'name': info[0],
-                'path': info[1]}
+    def _get_child_id(self, obj: CarComponent | ComponentCollection | dict) -> str:
+        if isinstance(obj, dict):
+            return obj.get('id', '')
+        return obj.id
 
     def _clamp_vague_info(self, obj: ComponentCollection | dict, extension: str):
         match obj.__class__.__name__:
@@ -205,7 +246,7 @@ class ComponentCollection:
 
     def get_target_path(self, extension: str) -> str:
         """Extension without the dot"""
-        return self.path.joinpath(f"{self.name.replace(' ', '_')}.{extension}")
+        return self.path.joinpath(f"{self.id or self.name.replace(' ', '_')}.{extension}")
 
     def get_formatted_info(self) -> str:
         """Return well-formatted string representing data of this class."""
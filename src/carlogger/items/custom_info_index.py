@@ -0,0 +1,269 @@
+"""Declared secondary indexes over custom info values of cars, components and entries"""
+
+from __future__ import annotations
+
+import bisect
+
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from carlogger.event_bus import ItemEvent
+
+if TYPE_CHECKING:
+    from carlogger.const import ITEM
+    from carlogger.event_bus import EventBus
+
+
+class IndexedItemType(StrEnum):
+    car = 'car'
+    component = 'component'
+    entry = 'entry'
+
+
+ITEM_TYPES = {'Car': IndexedItemType.car,
+              'CarComponent': IndexedItemType.component,
+              'LogEntry': IndexedItemType.entry,
+              'ScheduledLogEntry': IndexedItemType.entry}
+
+
+def get_item_type(item: ITEM) -> IndexedItemType | None:
+    return ITEM_TYPES.get(item.__class__.__name__)
+
+
+def get_custom_info(item: ITEM) -> dict:
+    if item.__class__.__name__ == 'Car':
+        return item.car_info.custom_info or {}
+    return item.custom_info or {}
+
+
+def to_number(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_item_tree(item: ITEM):
+    """Yield item along with all of its children."""
+    stack = [item]
+
+    while stack:
+        current = stack.pop()
+        yield current
+
+        match current.__class__.__name__:
+            case 'Car': stack.extend(current.collections)
+            case 'ComponentCollection': stack.extend(current.children)
+            case 'CarComponent': stack.extend(current.get_all_entry_logs())
+
+
+@dataclass(frozen=True)
+class IndexDefinition:
+    item_type: IndexedItemType
+    key: str
+    numeric: bool = False
+
+    def __post_init__(self):
+        object.__setattr__(self, 'item_type', IndexedItemType(self.item_type))
+        object.__setattr__(self, 'key', self.key.lower())
+
+    def to_json(self) -> dict:
+        return {'item_type': str(self.item_type), 'key': self.key, 'numeric': self.numeric}
+
+    def get_formatted_info(self) -> str:
+        return f"{self.item_type}.{self.key} ({'numeric' if self.numeric else 'hash'})"
+
+
+class HashIndex:
+    """Maps exact custom info value to items holding it, answers '=' and 'in' filters."""
+    def __init__(self):
+        self._items: dict[str, set[int]] = {}
+        self._values: dict[int, str] = {}
+
+    def add(self, item: ITEM, value):
+        self.remove(item)
+        value = str(value)
+        self._items.setdefault(value, set()).add(id(item))
+        self._values[id(item)] = value
+
+    def remove(self, item: ITEM):
+        if (value := self._values.pop(id(item), None)) is None:
+            return
+
+        self._items[value].discard(id(item))
+
+        if not self._items[value]:
+            del self._items[value]
+
+    def find(self, operand: str, value: str) -> set[int] | None:
+        """Return ids of matching items, None if the operand can't be answered by this index."""
+        match operand:
+            case '=': return set(self._items.get(value, ()))
+            case 'in': return set().union(*[self._items.get(v, set()) for v in value])
+            case _: return None
+
+
+class NumericIndex:
+    """Keeps numeric custom info values sorted, answers equality, comparison and range filters via bisection."""
+    def __init__(self):
+        self._keys: list[tuple[float, int]] = []
+        self._values: dict[int, float] = {}
+
+    def add(self, item: ITEM, value):
+        self.remove(item)
+
+        if (number := to_number(value)) is None:
+            return
+
+        bisect.insort(self._keys, (number, id(item)))
+        self._values[id(item)] = number
+
+    def remove(self, item: ITEM):
+        if (number := self._values.pop(id(item), None)) is None:
+            return
+
+        del self._keys[bisect.bisect_left(self._keys, (number, id(item)))]
+
+    def find(self, operand: str, value) -> set[int] | None:
+        """Return ids of matching items, None if the operand can't be answered by this index."""
+        if operand == 'in':
+            numbers = [to_number(v) for v in value]
+            return None if None in numbers else set().union(*[self._between(n, n) for n in numbers])
+
+        if operand == ' ':
+            lower, upper = (to_number(v) for v in value)
+            return None if None in (lower, upper) else self._between(lower, upper)
+
+        if (number := to_number(value)) is None:
+            return None
+
+        match operand:
+            case '=': return self._between(number, number)
+            case '<': return self._slice(0, bisect.bisect_left(self._keys, (number,)))
+            case '<=' | '=<': return self._slice(0, bisect.bisect_right(self._keys, (number, float('inf'))))
+            case '>': return self._slice(bisect.bisect_right(self._keys, (number, float('inf'))), None)
+            case '>=' | '=>': return self._slice(bisect.bisect_left(self._keys, (number,)), None)
+            case _: return None
+
+    def _between(self, lower: float, upper: float) -> set[int]:
+        return self._slice(bisect.bisect_left(self._keys, (lower,)),
+                           bisect.bisect_right(self._keys, (upper, float('inf'))))
+
+    def _slice(self, start: int, end: int | None) -> set[int]:
+        return {item_id for _, item_id in self._keys[start:end]}
+
+
+class CustomInfoIndexes:
+    """Secondary indexes declared on custom info keys per item type.\n
+    Items have to be registered through `add_tree` (usually whole cars), the indexes are kept up to date through
+    item events when constructed with an event bus. ItemFilter consults them for filters on indexed keys and only
+    falls back to checking each item for lists containing items that were never registered."""
+    def __init__(self, definitions: list[IndexDefinition] = None, event_bus: EventBus = None):
+        self.definitions: list[IndexDefinition] = []
+        self._indexes: dict[tuple[str, str], HashIndex | NumericIndex] = {}
+        self._items: dict[int, ITEM] = {}
+
+        for definition in definitions or []:
+            self.declare(definition)
+
+        if event_bus:
+            event_bus.subscribe(self.on_item_event)
+
+    def declare(self, definition: IndexDefinition) -> bool:
+        """Create index and fill it with already registered items, return False if it already exists."""
+        if definition in self.definitions:
+            return False
+
+        self.drop(definition.item_type, definition.key)
+        self.definitions.append(definition)
+
+        index = NumericIndex() if definition.numeric else HashIndex()
+        self._indexes[(definition.item_type, definition.key)] = index
+
+        for item in self._items.values():
+            self._add_to_index(index, definition, item)
+
+        return True
+
+    def drop(self, item_type: str, key: str) -> bool:
+        definition = self.get_definition(item_type, key)
+
+        if not definition:
+            return False
+
+        self.definitions.remove(definition)
+        del self._indexes[(definition.item_type, definition.key)]
+        return True
+
+    def get_definition(self, item_type: str, key: str) -> IndexDefinition | None:
+        for definition in self.definitions:
+            if definition.item_type == item_type and definition.key == key.lower():
+                return definition
+        return None
+
+    def build(self, cars: list[ITEM]):
+        self.clear()
+
+        for car in cars:
+            self.add_tree(car)
+
+    def clear(self):
+        self._items.clear()
+
+        for definition in self.definitions:
+            self._indexes[(definition.item_type, definition.key)] = NumericIndex() if definition.numeric \
+                else HashIndex()
+
+    def add_tree(self, item: ITEM):
+        for child in iter_item_tree(item):
+            self.add_item(child)
+
+    def remove_tree(self, item: ITEM):
+        for child in iter_item_tree(item):
+            self.remove_item(child)
+
+    def add_item(self, item: ITEM):
+        self._items[id(item)] = item
+
+        for definition in self.definitions:
+            self._add_to_index(self._indexes[(definition.item_type, definition.key)], definition, item)
+
+    def remove_item(self, item: ITEM):
+        if self._items.pop(id(item), None) is None:
+            return
+
+        for index in self._indexes.values():
+            index.remove(item)
+
+    def on_item_event(self, event: ItemEvent, item: ITEM):
+        match event:
+            case ItemEvent.created:
+                self.add_tree(item)
+            case ItemEvent.updated:
+                self.add_item(item)
+            case ItemEvent.deleted:
+                self.remove_tree(item)
+
+    def to_json(self) -> dict:
+        return {'indexes': [definition.to_json() for definition in self.definitions]}
+
+    def covers(self, item: ITEM) -> bool:
+        return self._items.get(id(item)) is item
+
+    def find(self, item_type: str, key: str, operand: str, value) -> set[int] | None:
+        """Return ids of items of given type matching the filter, None if no index can answer it."""
+        if not (index := self._indexes.get((item_type, key.lower()))):
+            return None
+        return index.find(operand, value)
+
+    def _add_to_index(self, index: HashIndex | NumericIndex, definition: IndexDefinition, item: ITEM):
+        if get_item_type(item) != definition.item_type:
+            return
+
+        value = get_custom_info(item).get(definition.key)
+
+        if value is None:
+            index.remove(item)
+        else:
+            index.add(item, value)
@@ -1,8 +1,16 @@
+import re
+
 from abc import ABC, abstractmethod
 
 from carlogger.const import ITEM
+from carlogger.items.custom_info_index import CustomInfoIndexes, get_item_type
+from carlogger.items.tag_index import normalize_tag, get_entry_tags
+from carlogger.tracing import traced
 from carlogger.util import is_date_in_range, date_string_to_date
 
+IN_FILTER_PATTERN = re.compile(r"^\s*(\w+)\s+in\s+\((.*)\)\s*$", re.IGNORECASE)
+TAG_FILTER_KEYS = ('tag', 'tags')
+
 
 class FilterWorker(ABC):
     @classmethod
@@ -27,9 +35,16 @@ class FilterWorker(ABC):
                     return cls.eq(item, key, value)
                 else:
                     return cls.range(item, key, cls._range_to_tuple(value))
+            case 'in':
+                return cls.is_in(item, key, cls._list_to_tuple(value))
             case _:
                 return False
 
+    @classmethod
+    def is_in(cls, item: ITEM, key: str, values: tuple[str, ...]) -> bool:
+        """Item matches if it's equal to any of the values."""
+        return any(cls.eq(item, key, value) for value in values)
+
     @classmethod
     @abstractmethod
     def eq(cls, item: ITEM, key: str, val: str) -> bool:
@@ -65,6 +80,10 @@ class FilterWorker(ABC):
         r = range_str.split(' ')
         return r[0], r[1]
 
+    @classmethod
+    def _list_to_tuple(cls, list_str: str) -> tuple[str, ...]:
+        return tuple(value.strip() for value in list_str.split(',') if value.strip())
+
 
 class AttribFilterWorker(FilterWorker):
     @classmethod
@@ -344,11 +363,47 @@ class IDFilterWorker(FilterWorker):
         raise ValueError("ID Filter method does not support '-' (range) operand")
 
 
+class TagFilterWorker(FilterWorker):
+    @classmethod
+    def eq(cls, item: ITEM, key: str, val: str) -> bool:
+        return normalize_tag(val) in get_entry_tags(item)
+
+    @classmethod
+    def gt(cls, item: ITEM, key: str, val: str) -> bool:
+        raise ValueError("Tag Filter method does not support '>' operand")
+
+    @classmethod
+    def lt(cls, item: ITEM, key: str, val: str) -> bool:
+        raise ValueError("Tag Filter method does not support '<' operand")
+
+    @classmethod
+    def gt_eq(cls, item: ITEM, key: str, val: str) -> bool:
+        raise ValueError("Tag Filter method does not support '=>' operand")
+
+    @classmethod
+    def lt_eq(cls, item: ITEM, key: str, val: str) -> bool:
+        raise ValueError("Tag Filter method does not support '<=' operand")
+
+    @classmethod
+    def range(cls, item: ITEM, key: str, val: str) -> bool:
+        raise ValueError("Tag Filter method does not support '-' (range) operand")
+
+
 class ItemFilter:
+    def __init__(self, indexes: CustomInfoIndexes = None):
+        self.indexes = indexes
+
+    @traced('filter')
     def filter_items(self, item_list: list[ITEM], filters: list[str]) -> list[ITEM]:
         if '*' in filters:
             return item_list
 
+        if self.indexes:
+            item_list, filters = self._apply_indexed_filters(item_list, filters)
+
+            if not filters:
+                return item_list
+
         end_item_list = []
         d = [(filter_str, item) for filter_str in filters for item in item_list]
 
@@ -371,9 +426,52 @@ class ItemFilter:
             case 'parent': return ParentFilterWorker.apply_filter(item, *filter_values)
             case 'scheduled': return ScheduledEntryFilterWorker.apply_filter(item, *filter_values)
             case 'children': return ChildrenFilterWorker.apply_filter(item, *filter_values)
+            case 'tag' | 'tags': return TagFilterWorker.apply_filter(item, *filter_values)
             case _: return AttribFilterWorker.apply_filter(item, *filter_values)
 
+    def _apply_indexed_filters(self, item_list: list[ITEM], filters: list[str]) -> tuple[list[ITEM], list[str]]:
+        """Narrow down item list with filters that declared custom info indexes can answer.
+        Return narrowed list and filters that still have to be checked item by item."""
+        if not all(self.indexes.covers(item) for item in item_list):
+            return item_list, filters
+
+        item_types = {get_item_type(item) for item in item_list}
+        remaining_filters = []
+
+        for filter_str in filters:
+            filter_key, filter_operand, filter_value = self._get_filter_values(filter_str)
+
+            match filter_operand:
+                case 'in': filter_value = FilterWorker._list_to_tuple(filter_value)
+                case ' ': filter_value = FilterWorker._range_to_tuple(filter_value)
+
+            found = [self.indexes.find(item_type, filter_key, filter_operand, filter_value)
+                     for item_type in item_types]
+
+            if None in found:
+                remaining_filters.append(filter_str)
+            else:
+                matching_ids = set().union(*found)
+                item_list = [item for item in item_list if id(item) in matching_ids]
+
+        return item_list, remaining_filters
+
+    def get_filter_tags(self, filter_str: str) -> tuple[str, ...] | None:
+        """Return tags a 'tag=x' or 'tag in (x,y)' filter is looking for, None for other filters."""
+        filter_key, filter_operand, filter_value = self._get_filter_values(filter_str)
+
+        if filter_key not in TAG_FILTER_KEYS:
+            return None
+
+        match filter_operand:
+            case '=': return filter_value,
+            case 'in': return FilterWorker._list_to_tuple(filter_value)
+            case _: return None
+
     def _get_filter_values(self, filter_str: str):
+        if in_filter := IN_FILTER_PATTERN.match(filter_str):
+            return in_filter.group(1).lower(), 'in', in_filter.group(2)
+
         operand_index: int = self._get_operand_index(filter_str)
         filter_operand: str = filter_str[operand_index]
         filter_key = filter_str[0:operand_index:].lower()
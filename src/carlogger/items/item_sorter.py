@@ -3,7 +3,8 @@
 import uuid
 from typing import Callable, Any
 
-from carlogger.items.log_entry import LogEntry, ScheduledLogEntry
+from carlogger.items.log_entry import LogEntry, ScheduledLogEntry, get_time_remaining_batch
+from carlogger.tracing import traced
 from carlogger.util import date_string_to_date
 
 
@@ -17,6 +18,7 @@ class ItemSorter:
                                 'time_remaining': self.sort_by_time_remaining,
                                 'car': self.sort_by_parent_car}
 
+    @traced('sort')
     def get_sorted_list(self, reverse_order: bool = False) -> list:
         sort_method: str | Callable = self._get_sort_method()
 
@@ -68,26 +70,27 @@ class ItemSorter:
 
     def sort_by_time_remaining(self, items: list, reversed=False):
         if items[0].__class__.__name__ in ('LogEntry', 'ScheduledLogEntry'):
-            return self.sort_by_time_remaining_raw(items)
+            return self.sort_by_time_remaining_raw(items, reversed)
 
         entry_map: list[tuple[Any, list]] = []
 
         for item in items:
-            entry_map.append((item, [entry.get_time_remaining() for entry in item.get_all_entry_logs()]))
+            entry_map.append((item, get_time_remaining_batch(self._get_scheduled_entries(item))))
 
         items = sorted(entry_map, key=lambda x: x[1], reverse=reversed)
 
         return [e[0] for e in items]
 
-    def sort_by_time_remaining_raw(self, items: list[LogEntry | ScheduledLogEntry], reversed=False) -> list:
-        entry_map: list[tuple] = []
+    def sort_by_time_remaining_raw(self, items: list[ScheduledLogEntry], reversed=False) -> list:
+        time_remaining = get_time_remaining_batch(items)
+        order = sorted(range(len(items)), key=time_remaining.__getitem__, reverse=reversed)
 
-        for item in items:
-            entry_map.append((item, item.get_time_remaining()))
+        return [items[i] for i in order]
 
-        items = sorted(entry_map, key=lambda x: x[1], reverse=reversed)
-
-        return [e[0] for e in items]
+    def _get_scheduled_entries(self, item) -> list[ScheduledLogEntry]:
+        if item.__class__.__name__ == 'CarComponent':
+            return item.scheduled_log_entries
+        return item.get_all_scheduled_entry_logs()
 
     def sort_by_latest_entry(self, items: list, *args) -> list:
         if items[0].__class__.__name__ in ('LogEntry', 'ScheduledLogEntry'):
@@ -12,7 +12,7 @@ from carlogger.const import TODAY
 if TYPE_CHECKING:
     from carlogger.items.car_component import CarComponent
 from carlogger.items.entry_category import EntryCategory
-from carlogger.util import date_string_to_date, days_between_date_strings, format_tuple_to_date_string
+from carlogger.util import add_days_clamped, date_string_to_date, date_string_to_ordinal, format_tuple_to_date_string
 
 
 @dataclass(order=True)
@@ -88,6 +88,16 @@ class LogEntry:
             self.custom_info = dict(custom_info_keys)
 
 
+def get_time_remaining_batch(entries: list[ScheduledLogEntry]) -> list[int]:
+    """Return time remaining of many scheduled entries in one pass, same as calling `get_time_remaining` on each:
+    days until due date for date-ruled entries and mileage until target mileage for mileage-ruled ones."""
+    today = date_string_to_ordinal(TODAY)
+
+    return [date_string_to_ordinal(entry.date) - today if entry.rule == 'date'
+            else entry.mileage - entry.component.current_mileage
+            for entry in entries]
+
+
 @dataclass
 class LogEntryScheduleRule(ABC):
     """Abstract class for defining scheduling rule for ScheduledLogEntry class."""
@@ -110,6 +120,10 @@ class LogEntryScheduleRule(ABC):
     def time_remaining_to_str(self):
         pass
 
+    @abstractmethod
+    def get_projected_due_date(self, mileage_velocity: float | None) -> datetime.date | None:
+        pass
+
     @abstractmethod
     def get_formatted_info(self) -> str:
         pass
@@ -134,20 +148,22 @@ class DateScheduleRule(LogEntryScheduleRule):
 
     def get_time_remaining(self) -> int:
         """Get remaining days until scheduled entry as int"""
-        return days_between_date_strings(self.parent_log_entry.date, TODAY)
+        return date_string_to_ordinal(self.parent_log_entry.date) - date_string_to_ordinal(TODAY)
 
     def time_remaining_to_str(self) -> str:
         """Get remaining days until scheduled entry and return a formatted informative string"""
         days = self.get_time_remaining()
 
-        if self.get_time_remaining() > 0:
+        if days > 0:
             return f"in {days} days"
-        elif self.get_time_remaining() == 0:
+        elif days == 0:
             return f"Today"
-        elif self.get_time_remaining() < 0:
-            return f"{abs(days)} days ago"
         else:
-            return ""
+            return f"{abs(days)} days ago"
+
+    def get_projected_due_date(self, mileage_velocity: float | None = None) -> datetime.date:
+        """Date-ruled entries are due on their date regardless of mileage"""
+        return date_string_to_date(self.parent_log_entry.date)
 
     def get_formatted_info(self) -> str:
         """Return well-formatted string representing data of this class"""
@@ -175,13 +191,27 @@ class MileageScheduleRule(LogEntryScheduleRule):
         """Get remaining mileage until scheduled entry and return a formatted informative string"""
         mileage_remaining = self.get_time_remaining()
 
-        if self.get_time_remaining() > 0:
+        if mileage_remaining > 0:
             return f"-{mileage_remaining}"
-        elif self.get_time_remaining() < 0:
+        elif mileage_remaining < 0:
             return f"+{abs(mileage_remaining)}"
         else:
             return ""
 
+    def get_projected_due_date(self, mileage_velocity: float | None) -> datetime.date | None:
+        """Project date of reaching target mileage when driving 'mileage_velocity' per day,
+        return None if the velocity is unknown and target mileage wasn't reached yet, date.max if it's too far away"""
+        mileage_remaining = self.get_time_remaining()
+        today = date_string_to_date(TODAY)
+
+        if mileage_remaining <= 0:
+            return today
+
+        if not mileage_velocity or mileage_velocity <= 0:
+            return None
+
+        return add_days_clamped(today, mileage_remaining / mileage_velocity)
+
     def get_formatted_info(self) -> str:
         """Return well-formatted string representing data of this class."""
         return f"[Target Mileage: {self.parent_log_entry.mileage}] " \
@@ -263,6 +293,11 @@ class ScheduledLogEntry(LogEntry):
     def time_remaining_to_str(self) -> str:
         return self._schedule_obj.time_remaining_to_str()
 
+    def get_projected_due_date(self, mileage_velocity: float | None = None) -> datetime.date | None:
+        """Return date when this entry is expected to come due, mileage-ruled entries need
+        car's mileage driven per day to be projected."""
+        return self._schedule_obj.get_projected_due_date(mileage_velocity)
+
     def get_formatted_info(self) -> str:
         return self._schedule_obj.get_formatted_info()
 
@@ -0,0 +1,103 @@
+"""Inverted index of entry tags"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from carlogger.items.car import Car
+    from carlogger.items.log_entry import LogEntry
+
+
+def normalize_tag(tag) -> str:
+    return str(tag).strip().lower()
+
+
+def get_entry_tags(entry: LogEntry) -> set[str]:
+    tags = entry.tags or []
+
+    if isinstance(tags, str):
+        tags = [tags]
+
+    return {normalize_tag(tag) for tag in tags if normalize_tag(tag)}
+
+
+class TagIndex:
+    """Maps tag to entries of a single car that are tagged with it, kept up to date by CarComponent whenever
+    an entry is created, updated or deleted. Tags are case-insensitive."""
+    def __init__(self):
+        self._entries: dict[str, dict[str, LogEntry]] = {}
+
+    def add(self, entry: LogEntry):
+        for tag in get_entry_tags(entry):
+            self._entries.setdefault(tag, {})[entry.id] = entry
+
+    def remove(self, entry: LogEntry):
+        """Remove entry from every tag it is listed under, its current tags may already differ from indexed ones."""
+        for tag in list(self._entries):
+            tagged_entries = self._entries[tag]
+
+            if tagged_entries.pop(entry.id, None) is not None and not tagged_entries:
+                del self._entries[tag]
+
+    def remove_many(self, entries: list[LogEntry]):
+        """Remove many entries in a single pass over the tags."""
+        entry_ids = {entry.id for entry in entries}
+
+        if not entry_ids:
+            return
+
+        for tag in list(self._entries):
+            tagged_entries = self._entries[tag]
+
+            for entry_id in entry_ids.intersection(tagged_entries):
+                del tagged_entries[entry_id]
+
+            if not tagged_entries:
+                del self._entries[tag]
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_entries(self, tag: str) -> list[LogEntry]:
+        return list(self._entries.get(normalize_tag(tag), {}).values())
+
+    def get_entries_with_any(self, tags: list[str]) -> list[LogEntry]:
+        """Return entries tagged with at least one of the tags."""
+        found: dict[str, LogEntry] = {}
+
+        for tag in tags:
+            found.update(self._entries.get(normalize_tag(tag), {}))
+
+        return list(found.values())
+
+    def get_entry_ids(self, tag: str) -> set[str]:
+        return set(self._entries.get(normalize_tag(tag), {}))
+
+    def get_tag_counts(self) -> Counter:
+        return Counter({tag: len(entries) for tag, entries in self._entries.items()})
+
+    @property
+    def tags(self) -> list[str]:
+        return sorted(self._entries)
+
+
+class FleetTagIndex:
+    """Fleet-wide view over tag indexes of multiple cars."""
+    def __init__(self, cars: list[Car]):
+        self.cars = cars
+
+    def get_entries(self, tag: str) -> list[LogEntry]:
+        return [entry for car in self.cars for entry in car.tag_index.get_entries(tag)]
+
+    def get_entries_with_any(self, tags: list[str]) -> list[LogEntry]:
+        return [entry for car in self.cars for entry in car.tag_index.get_entries_with_any(tags)]
+
+    def get_tag_counts(self) -> Counter:
+        counts = Counter()
+
+        for car in self.cars:
+            counts.update(car.tag_index.get_tag_counts())
+
+        return counts
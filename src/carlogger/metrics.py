@@ -0,0 +1,204 @@
+"""Process-wide counters and histograms of file I/O and item operations."""
+
+import bisect
+import copy
+import functools
+import json
+import threading
+import time
+
+from contextlib import contextmanager
+
+SECONDS_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def format_labels(labels: tuple[tuple[str, str], ...], extra: str = '') -> str:
+    parts = [f'{key}="{value}"' for key, value in labels] + ([extra] if extra else [])
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+class Counter:
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self.values: dict[tuple, float] = {}
+        # Incremented from the save worker thread as well as the GUI thread
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(sorted(labels.items()))
+
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self.values.get(tuple(sorted(labels.items())), 0)
+
+    def get_total(self) -> float:
+        return sum(value for _, value in self.items())
+
+    def items(self) -> list[tuple[tuple, float]]:
+        with self._lock:
+            return list(self.values.items())
+
+    def reset(self):
+        with self._lock:
+            self.values.clear()
+
+    def to_prometheus(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{format_labels(labels)} {value:g}" for labels, value in self.items()]
+        return lines
+
+    def to_json(self) -> list[dict]:
+        return [{'labels': dict(labels), 'value': value} for labels, value in self.items()]
+
+
+class HistogramSeries:
+    def __init__(self, buckets: tuple):
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, buckets: tuple, value: float):
+        self.bucket_counts[bisect.bisect_left(buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class Histogram:
+    """Observations sorted into fixed buckets, along with their count and sum per label set."""
+    def __init__(self, name: str, description: str, buckets: tuple = SECONDS_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self.series: dict[tuple, HistogramSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(sorted(labels.items()))
+
+        with self._lock:
+            if key not in self.series:
+                self.series[key] = HistogramSeries(self.buckets)
+
+            self.series[key].observe(self.buckets, value)
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get(self, **labels) -> HistogramSeries | None:
+        return self.series.get(tuple(sorted(labels.items())))
+
+    def items(self) -> list[tuple[tuple, HistogramSeries]]:
+        """Copies of every series, safe to read while other threads keep observing."""
+        with self._lock:
+            return [(labels, copy.deepcopy(series)) for labels, series in self.series.items()]
+
+    def reset(self):
+        with self._lock:
+            self.series.clear()
+
+    def to_prometheus(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+
+        for labels, series in self.items():
+            cumulative = 0
+
+            for bound, bucket_count in zip(self.buckets + ('+Inf',), series.bucket_counts):
+                cumulative += bucket_count
+                bucket_label = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{format_labels(labels, bucket_label)} {cumulative}")
+
+            lines.append(f"{self.name}_sum{format_labels(labels)} {series.sum:g}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {series.count}")
+
+        return lines
+
+    def to_json(self) -> list[dict]:
+        return [{'labels': dict(labels), 'count': series.count, 'sum': series.sum,
+                 'buckets': dict(zip([str(b) for b in self.buckets + ('+Inf',)], series.bucket_counts))}
+                for labels, series in self.items()]
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: dict[str, Counter | Histogram] = {}
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self.metrics.setdefault(name, Counter(name, description))
+
+    def histogram(self, name: str, description: str, buckets: tuple = SECONDS_BUCKETS) -> Histogram:
+        return self.metrics.setdefault(name, Histogram(name, description, buckets))
+
+    def reset(self):
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def to_prometheus(self) -> str:
+        lines = []
+
+        for metric in self.metrics.values():
+            lines += metric.to_prometheus()
+
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> str:
+        return json.dumps({name: metric.to_json() for name, metric in self.metrics.items()}, indent=2)
+
+    def get_summary(self) -> str:
+        """Human-readable summary of everything recorded so far, metrics that were never touched are skipped."""
+        rows = []
+
+        for metric in self.metrics.values():
+            if isinstance(metric, Counter):
+                rows += [(f"{metric.name}{format_labels(labels)}", f"{value:g}")
+                         for labels, value in metric.items()]
+                continue
+
+            for labels, series in metric.items():
+                total = f"{series.sum * 1000:.2f} ms" if metric.buckets is SECONDS_BUCKETS else f"{series.sum:g}"
+                rows.append((f"{metric.name}{format_labels(labels)}", f"{series.count}x, {total}"))
+
+        width = max([len(name) for name, _ in rows] + [0])
+        return "\n".join(f"{name:<{width}}  {value}" for name, value in rows)
+
+
+METRICS = MetricsRegistry()
+
+FILE_READS = METRICS.counter('carlogger_file_reads_total', "Files read.")
+FILE_WRITES = METRICS.counter('carlogger_file_writes_total', "Files written.")
+FILE_WRITES_SKIPPED = METRICS.counter('carlogger_file_writes_skipped_total',
+                                      "Saves skipped because the file already held identical content.")
+FILE_DELETES = METRICS.counter('carlogger_file_deletes_total', "Files deleted.")
+BYTES_READ = METRICS.counter('carlogger_file_read_bytes_total', "Bytes read from save files.")
+BYTES_WRITTEN = METRICS.counter('carlogger_file_written_bytes_total', "Bytes written to save files.")
+DECODE_SECONDS = METRICS.histogram('carlogger_decode_seconds', "Time spent parsing file contents.")
+ENCODE_SECONDS = METRICS.histogram('carlogger_encode_seconds', "Time spent serializing items.")
+DIRECTORY_SECONDS = METRICS.histogram('carlogger_directory_operation_seconds',
+                                      "Duration of DirectoryManager load and update operations.")
+CAR_LOAD_SECONDS = METRICS.counter('carlogger_car_load_seconds_total', "Time spent loading each car directory.")
+FILES_PER_CAR_SAVE = METRICS.histogram('carlogger_files_per_car_save',
+                                       "Files written by a single car directory update.", COUNT_BUCKETS)
+SESSION_SECONDS = METRICS.histogram('carlogger_session_operation_seconds',
+                                    "Duration of AppSession add, update and delete operations, including saving.")
+
+
+def timed_operation(histogram: Histogram):
+    """Decorator observing duration of every call under an 'operation' label set to the function name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(operation=func.__name__):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
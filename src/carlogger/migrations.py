@@ -0,0 +1,177 @@
+"""Upgrade save directories to the current format version one car directory at a time."""
+
+import dataclasses
+import pathlib
+import uuid
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterator
+
+from carlogger.directory_manager import DirectoryManager
+from carlogger.filedata_manager import FileData, FiledataManager, is_temp_file
+from carlogger.serialization import FORMAT_VERSION
+from carlogger.util import get_car_dirs
+
+
+class Migration(ABC):
+    """Upgrade of a single car directory to 'version'.\n
+    Migrations work on raw file data instead of loaded cars and must be safe to run again on a car directory that
+    was interrupted halfway through, files already in the new layout are simply rewritten the same."""
+    version: int = 0
+    description = ""
+
+    @abstractmethod
+    def migrate_car(self, car_dir: pathlib.Path, data_manager: FiledataManager):
+        pass
+
+    def iter_files(self, directory: pathlib.Path) -> Iterator[pathlib.Path]:
+        if not directory.is_dir():
+            return
+
+        for path in sorted(directory.iterdir()):
+            if path.is_file() and not is_temp_file(path):
+                yield path
+
+
+class OrdinalDatesMigration(Migration):
+    version = 2
+    description = "Store entry dates as day ordinals"
+
+    def migrate_car(self, car_dir: pathlib.Path, data_manager: FiledataManager):
+        # Files are loaded in any layout and saved in the layout the data manager is set to
+        for path in self.iter_files(car_dir.joinpath('components')):
+            data_manager.save_file(FileData(data_manager.load_file(path)), path)
+
+
+class StableIdsMigration(Migration):
+    """Name collection and component files after item ids instead of item names.\n
+    Ids are derived from the legacy file names, so running it again over a half-migrated car directory assigns the
+    same ids. Component files are removed only after every collection refers to the new ones."""
+    version = 3
+    description = "Name collection and component files after stable ids"
+
+    def migrate_car(self, car_dir: pathlib.Path, data_manager: FiledataManager):
+        legacy_components = []
+
+        for path in self.iter_files(car_dir.joinpath('components')):
+            data = data_manager.load_file(path)
+
+            if not data.get('id'):
+                data['id'] = get_stable_id(car_dir, path)
+                data_manager.save_file(FileData(data), path.with_stem(data['id']))
+                legacy_components.append(path)
+
+        for path in self.iter_files(car_dir.joinpath('collections')):
+            data = data_manager.load_file(path)
+
+            if data.get('id'):
+                continue
+
+            data['id'] = get_stable_id(car_dir, path)
+            data['collections'] = [self.get_reference(car_dir, ref) for ref in data.get('collections') or []]
+            data['components'] = [self.get_reference(car_dir, ref) for ref in data.get('components') or []]
+
+            if data.get('parent_collection'):
+                data['parent_collection'] = get_stable_id(car_dir, pathlib.Path(data['parent_collection']))
+
+            data_manager.save_file(FileData(data), path.with_stem(data['id']))
+            data_manager.delete_file_raw(str(path))
+
+        for path in legacy_components:
+            data_manager.delete_file_raw(str(path))
+
+    def get_reference(self, car_dir: pathlib.Path, ref: dict) -> dict:
+        if ref.get('id'):
+            return ref
+        return {'id': get_stable_id(car_dir, pathlib.Path(ref['path']))}
+
+
+def get_stable_id(car_dir: pathlib.Path, legacy_path: pathlib.Path) -> str:
+    """Id of an item saved before stable ids, the same for every reference to its legacy file."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"carlogger:{car_dir.name}/{legacy_path.parent.name}/{legacy_path.stem}"))
+
+
+MIGRATIONS: list[Migration] = [OrdinalDatesMigration(), StableIdsMigration()]
+
+
+@dataclasses.dataclass
+class MigrationProgress:
+    migration: Migration
+    car_name: str
+    done: int
+    total: int
+
+    def get_formatted_info(self) -> str:
+        return f"[{self.done}/{self.total}] {self.car_name} migrated to version {self.migration.version}"
+
+
+class Migrator:
+    """Runs pending migrations over a save directory, streaming through it one car directory at a time.\n
+    Cars that are done are recorded in a state file after each car, a failed or interrupted run continues where it
+    stopped when started again. The format record is only bumped once every car of a migration is done."""
+    def __init__(self, directory_manager: DirectoryManager, migrations: list[Migration] = None):
+        self.directory_manager = directory_manager
+        self.migrations = MIGRATIONS if migrations is None else migrations
+
+    @property
+    def data_manager(self) -> FiledataManager:
+        return self.directory_manager.data_manager
+
+    def get_state_path(self) -> pathlib.Path:
+        return pathlib.Path(self.directory_manager.car_save_dir).joinpath(f"migration.{self.data_manager.suffix}")
+
+    def get_pending(self) -> list[Migration]:
+        version = self.directory_manager.load_save_format().version
+        return sorted([m for m in self.migrations if m.version > version], key=lambda m: m.version)
+
+    def load_state(self) -> dict:
+        try:
+            return self.data_manager.load_file(self.get_state_path())
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self, migration: Migration, done: list[str]):
+        self.data_manager.save_file(FileData({'version': migration.version, 'done': done}), self.get_state_path())
+
+    def run(self, progress: Callable[[MigrationProgress], None] = None) -> list[Migration]:
+        """Apply every pending migration and return them."""
+        pending = self.get_pending()
+
+        for migration in pending:
+            self.run_migration(migration, progress)
+
+        return pending
+
+    def run_migration(self, migration: Migration, progress: Callable[[MigrationProgress], None] = None):
+        save_dir = pathlib.Path(self.directory_manager.car_save_dir)
+        state = self.load_state()
+        done = state.get('done', []) if state.get('version') == migration.version else []
+        car_names = get_car_dirs(save_dir)
+
+        self.data_manager.layout_version = migration.version
+
+        try:
+            for car_name in car_names:
+                if car_name in done:
+                    continue
+
+                with self.data_manager.batch():
+                    migration.migrate_car(save_dir.joinpath(car_name), self.data_manager)
+
+                done.append(car_name)
+                self.save_state(migration, done)
+
+                if progress:
+                    progress(MigrationProgress(migration, car_name, len(done), len(car_names)))
+        finally:
+            self.data_manager.layout_version = self.directory_manager.save_format.version
+
+        self.directory_manager.save_save_format(dataclasses.replace(self.directory_manager.save_format,
+                                                                    version=migration.version))
+
+        if self.get_state_path().exists():
+            self.data_manager.delete_file_raw(str(self.get_state_path()))
+
+
+def is_format_supported(version: int) -> bool:
+    return version <= FORMAT_VERSION
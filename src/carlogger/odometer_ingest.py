@@ -0,0 +1,161 @@
+"""Ingest streamed odometer readings (telematics exports) for the whole fleet."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator, TextIO
+
+if TYPE_CHECKING:
+    from carlogger.session import AppSession
+
+CAR_KEYS = ('car', 'name', 'vehicle')
+MILEAGE_KEYS = ('mileage', 'odometer', 'km')
+
+
+@dataclass
+class OdometerReading:
+    car: str
+    mileage: int
+
+
+def parse_reading(line: str) -> OdometerReading | None:
+    """Parse 'car,mileage[,...]' CSV row or JSON object line, return None for headers and malformed lines."""
+    line = line.strip()
+
+    if not line:
+        return None
+
+    try:
+        if line[0] == '{':
+            data = json.loads(line)
+            car = next(data[key] for key in CAR_KEYS if key in data)
+            mileage = next(data[key] for key in MILEAGE_KEYS if key in data)
+        else:
+            row = next(csv.reader([line])) if '"' in line else line.split(',')
+            car, mileage = row[0], row[1]
+
+        return OdometerReading(str(car).strip(), int(float(mileage)))
+    except (ValueError, IndexError, StopIteration, TypeError):
+        return None
+
+
+def is_header(line: str) -> bool:
+    """Check whether line is a CSV header row like 'car,mileage'."""
+    row = line.strip().lower().split(',')
+    return len(row) >= 2 and row[0].strip(' "') in CAR_KEYS and row[1].strip(' "') in MILEAGE_KEYS
+
+
+def iter_lines(file: TextIO, follow=False, poll_interval: float = 0.2, idle_callback=None) -> Iterator[str]:
+    """Yield lines of a file or stream. With 'follow' keep waiting for lines appended to a file like 'tail -f' and
+    start over when the file gets truncated, 'idle_callback' is called whenever there is nothing new to read."""
+    while True:
+        line = file.readline()
+
+        if line:
+            yield line
+            continue
+
+        if not follow or not file.seekable():
+            return
+
+        if idle_callback:
+            idle_callback()
+
+        if os.fstat(file.fileno()).st_size < file.tell():
+            file.seek(0)
+
+        time.sleep(poll_interval)
+
+
+@dataclass
+class IngestStats:
+    readings: int = 0
+    malformed: int = 0
+    unknown_cars: int = 0
+    ignored: int = 0
+    updated_cars: int = 0
+    windows: int = 0
+    unknown_names: set[str] = field(default_factory=set)
+
+    def get_formatted_info(self) -> str:
+        info = f"{self.readings} readings, {self.updated_cars} car updates in {self.windows} windows, " \
+               f"{self.ignored} not increasing, {self.malformed} malformed"
+
+        if self.unknown_names:
+            info += f", {self.unknown_cars} for unknown cars: {', '.join(sorted(self.unknown_names))}"
+
+        return info
+
+
+class OdometerIngest:
+    """Coalesces odometer readings per car within a time window.\n
+    Only the highest reading of each car is kept until the window closes, then every car whose mileage increased is
+    updated through `AppSession.update_car_info`, so each affected car is saved once per window no matter how many
+    readings arrived for it. Readings lower than or equal to the current car mileage are ignored."""
+    def __init__(self, app_session: AppSession, window: float = 1.0):
+        self.app_session = app_session
+        self.window = window
+        self.stats = IngestStats()
+
+        self._cars = {car.car_info.name: car for car in app_session.cars}
+        self._pending: dict[str, int] = {}
+        self._window_start = time.monotonic()
+
+    def feed_line(self, line: str):
+        if reading := parse_reading(line):
+            self.feed(reading)
+        elif line.strip() and not is_header(line):
+            self.stats.malformed += 1
+
+        self.flush_if_due()
+
+    def feed(self, reading: OdometerReading):
+        self.stats.readings += 1
+
+        if reading.mileage > self._pending.get(reading.car, -1):
+            self._pending[reading.car] = reading.mileage
+
+    def flush_if_due(self):
+        if time.monotonic() - self._window_start >= self.window:
+            self.flush()
+
+    def flush(self):
+        """Apply highest pending reading of every car and start a new window."""
+        pending, self._pending = self._pending, {}
+        self._window_start = time.monotonic()
+
+        if not pending:
+            return
+
+        self.stats.windows += 1
+
+        for car_name, mileage in pending.items():
+            if not (car := self._cars.get(car_name)):
+                self.stats.unknown_cars += 1
+                self.stats.unknown_names.add(car_name)
+                continue
+
+            if mileage <= car.car_info.mileage:
+                self.stats.ignored += 1
+                continue
+
+            self.app_session.update_car_info(car, {'mileage': mileage})
+            self.stats.updated_cars += 1
+
+    def run(self, file: TextIO, follow=False, poll_interval: float = 0.2) -> IngestStats:
+        """Ingest every line of a file or stream, pending readings are applied when the input ends or is
+        interrupted."""
+        try:
+            for line in iter_lines(file, follow, poll_interval, idle_callback=self.flush_if_due):
+                self.feed_line(line)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.flush()
+
+        return self.stats
@@ -9,6 +9,7 @@ class Message(StrEnum):
     DEL_SUCCESS = "SUCCESS: {name} was deleted successfully from {relation}"
     DEL_FAIL = "FAIL: Failed to delete {name} in {relation} {reason}"
     READ_FAIL = "FAIL: {name} was not found in {relation}"
+    LOAD_FAIL = "FAIL: Failed to load {name} from {relation} {reason}"
     UPDATE_SUCCESS = "SUCCESS: {name} was updated"
     UPDATE_FAIL = "FAIL: Failed to update {name} {reason}"
 
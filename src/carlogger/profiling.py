@@ -0,0 +1,142 @@
+"""Opt-in profiling of a single CLI command: phase timings, cProfile statistics and peak memory."""
+
+import contextlib
+import cProfile
+import functools
+import json
+import pathlib
+import pstats
+import time
+import tracemalloc
+
+LOAD_METHODS = ('load_all_car_dir', 'load_car_catalog', 'load_car_details', 'load_car_dir')
+SAVE_METHODS = ('create_car_directory', 'update_car_directory', 'remove_car_directory', 'rename_car_dir')
+PROFILE_OPTIONS = ('--profile', '--profile-output')
+
+
+def is_profiling_requested(args: list[str]) -> bool:
+    return any(arg.split('=')[0] in PROFILE_OPTIONS for arg in args)
+
+
+class PhaseTimer:
+    """Accumulates exclusive wall time per named phase.\n
+    Phases may nest, time spent in an inner phase is only counted towards the inner one, so all phases add up to
+    the total time measured."""
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self._stack: list[list] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - frame[2]
+
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def wrap(self, obj, method_name: str, phase_name: str):
+        """Replace method of an instance with one that runs inside the given phase."""
+        method = getattr(obj, method_name)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with self.phase(phase_name):
+                return method(*args, **kwargs)
+
+        setattr(obj, method_name, wrapper)
+
+    def get_total(self) -> float:
+        return sum(self.phases.values())
+
+
+class CommandProfiler:
+    """Profiles everything between `start` and `stop` with cProfile and tracemalloc.\n
+    Use `phase` to split the command into parse, setup, execute etc. and `instrument` to have directory manager
+    loads and saves reported as separate 'load' and 'save' phases wherever they happen."""
+    def __init__(self, top: int = 15):
+        self.top = top
+        self.timer = PhaseTimer()
+        self.profile = cProfile.Profile()
+        self.peak_memory = 0
+        self._started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        tracemalloc.reset_peak()
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    def phase(self, name: str):
+        return self.timer.phase(name)
+
+    def instrument(self, directory_manager):
+        for method_name in LOAD_METHODS:
+            self.timer.wrap(directory_manager, method_name, 'load')
+
+        for method_name in SAVE_METHODS:
+            self.timer.wrap(directory_manager, method_name, 'save')
+
+        self.timer.wrap(directory_manager.data_manager, 'load_file', 'load')
+        self.timer.wrap(directory_manager.data_manager, 'save_file', 'save')
+
+    def get_top_functions(self) -> list[dict]:
+        stats = pstats.Stats(self.profile)
+        rows = []
+
+        for (file, line, function), (_, calls, own_time, cumulative_time, _) in stats.stats.items():
+            rows.append({'function': f"{pathlib.Path(file).name}:{line}({function})",
+                         'calls': calls,
+                         'tottime': own_time,
+                         'cumtime': cumulative_time})
+
+        return sorted(rows, key=lambda row: row['cumtime'], reverse=True)[:self.top]
+
+    def get_report(self) -> str:
+        total = self.timer.get_total() or 1e-9
+        lines = ["", "Profile:", f"{'phase':<12}{'time':>12}{'share':>9}"]
+
+        for name, duration in self.timer.phases.items():
+            lines.append(f"{name:<12}{duration * 1000:>9.2f} ms{duration / total:>9.1%}")
+
+        lines.append(f"{'total':<12}{total * 1000:>9.2f} ms")
+        lines.append(f"peak memory {self.peak_memory / 1024 / 1024:.2f} MiB")
+        lines.append("")
+        lines.append(f"{'cumtime':>10}{'tottime':>10}{'calls':>9}  function")
+
+        for row in self.get_top_functions():
+            lines.append(f"{row['cumtime']:>10.4f}{row['tottime']:>10.4f}{row['calls']:>9}  {row['function']}")
+
+        return "\n".join(lines)
+
+    def to_json(self) -> dict:
+        return {'phases': self.timer.phases,
+                'total': self.timer.get_total(),
+                'peak_memory': self.peak_memory,
+                'top_functions': self.get_top_functions()}
+
+    def dump(self, path: str | pathlib.Path):
+        """Write raw cProfile data for '.prof' paths (readable by pstats and snakeviz), JSON summary otherwise."""
+        path = pathlib.Path(path)
+
+        if path.suffix == '.prof':
+            self.profile.dump_stats(path)
+            return
+
+        with open(path, 'w') as file:
+            json.dump(self.to_json(), file, indent=2)
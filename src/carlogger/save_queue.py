@@ -0,0 +1,179 @@
+"""Write-behind persistence worker that saves modified items off the main thread."""
+
+import copy
+import pathlib
+import threading
+
+from enum import StrEnum
+
+from carlogger.directory_manager import DirectoryManager
+from carlogger.filedata_manager import FileData
+from carlogger.items.car import Car
+
+
+class SaveStatus(StrEnum):
+    SAVED = "Saved"
+    SAVING = "Saving…"
+    FAILED = "Save failed"
+
+
+class SaveQueue:
+    """Collects cars and item files marked as dirty and writes them to disk on a background thread.\n
+    Each request takes a snapshot of the files to write on the requesting thread, the worker never touches live items.
+    Only files whose data differs from the last requested snapshot of the same path are copied, so a small change
+    to a large car doesn't copy the whole car. Repeated requests for the same file made before the worker picks them
+    up are coalesced into a single write, the newest snapshot wins. Failed writes stay pending until a later pass,
+    flush or stop writes them. Nothing is written in the background until `start` is called."""
+    def __init__(self, directory_manager: DirectoryManager, delay: float = 0.25):
+        self.directory_manager = directory_manager
+        self.delay = delay
+
+        self.status: SaveStatus = SaveStatus.SAVED
+        self.last_error: Exception | None = None
+
+        self._dirty_cars: dict[int, dict[pathlib.Path, FileData]] = {}
+        self._dirty_items: dict[int, tuple[FileData, pathlib.Path]] = {}
+        self._requested: dict[pathlib.Path, dict] = {}
+
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background worker thread."""
+        if self.is_running:
+            return
+
+        # Files may have been written directly while the queue wasn't running
+        with self._pending_lock:
+            self._requested.clear()
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='carlogger-save-queue', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread and durably write everything that is still pending."""
+        self._stopped.set()
+        self._wakeup.set()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+    def request_save(self, car: Car):
+        """Mark files of a car directory that changed since their last request as dirty."""
+        with self._pending_lock:
+            requested = dict(self._requested)
+
+        files = {}
+
+        for item, path in self.directory_manager.get_car_items(car):
+            data = item.to_json()
+
+            if requested.get(path) != data:
+                files[path] = FileData(copy.deepcopy(data))
+
+        if not files:
+            return
+
+        with self._pending_lock:
+            self._requested.update({path: data.data for path, data in files.items()})
+            self._dirty_cars.setdefault(id(car), {}).update(files)
+            self.status = SaveStatus.SAVING
+
+        self._wakeup.set()
+
+    def request_item_save(self, item, path):
+        """Mark a single item file as dirty."""
+        data = FileData.snapshot(item)
+
+        with self._pending_lock:
+            self._requested[pathlib.Path(path)] = data.data
+            self._dirty_items[id(item)] = (data, path)
+            self.status = SaveStatus.SAVING
+
+        self._wakeup.set()
+
+    def discard(self, car: Car):
+        """Drop pending writes of a car, used when the car is about to be removed."""
+        with self._pending_lock:
+            self._dirty_cars.pop(id(car), None)
+            self._requested = {path: data for path, data in self._requested.items()
+                               if not path.is_relative_to(car.path)}
+
+    def has_pending(self) -> bool:
+        with self._pending_lock:
+            return len(self._dirty_cars) + len(self._dirty_items) > 0
+
+    def flush(self):
+        """Write every pending car and item file on the calling thread, waiting for the worker to finish
+        its current write first."""
+        self._write_pending()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+
+            # Give rapid successive edits a moment to coalesce into one write
+            if self._stopped.wait(self.delay):
+                return
+
+            self._wakeup.clear()
+            self._write_pending()
+
+    def _write_pending(self):
+        with self._write_lock:
+            with self._pending_lock:
+                cars = dict(self._dirty_cars)
+                items = dict(self._dirty_items)
+                self._dirty_cars.clear()
+                self._dirty_items.clear()
+
+            failed_cars = {}
+            failed_items = {}
+
+            # One fsync cycle for everything written in this pass
+            try:
+                with self.directory_manager.data_manager.batch():
+                    for key, files in cars.items():
+                        try:
+                            self.directory_manager.write_car_files([(data, path) for path, data in files.items()])
+                        except Exception as e:
+                            self.last_error = e
+                            failed_cars[key] = files
+
+                    for key, (data, path) in items.items():
+                        try:
+                            self.directory_manager.data_manager.save_file(data, path)
+                        except Exception as e:
+                            self.last_error = e
+                            failed_items[key] = (data, path)
+            except OSError as e:
+                # fsync at the end of the batch failed, written files may not be durable
+                self.last_error = e
+                failed_cars, failed_items = cars, items
+
+            with self._pending_lock:
+                # Requests made during this pass are newer than the failed snapshots
+                for key, files in failed_cars.items():
+                    pending_files = self._dirty_cars.setdefault(key, {})
+
+                    for path, data in files.items():
+                        pending_files.setdefault(path, data)
+
+                for key, item in failed_items.items():
+                    self._dirty_items.setdefault(key, item)
+
+                if failed_cars or failed_items:
+                    self.status = SaveStatus.FAILED
+                elif not self._dirty_cars and not self._dirty_items:
+                    self.status = SaveStatus.SAVED
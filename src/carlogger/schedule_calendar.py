@@ -0,0 +1,157 @@
+"""Expand repeating scheduled entries of the fleet into a calendar of future occurrences."""
+
+import datetime
+import heapq
+import itertools
+import math
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, TextIO
+
+from carlogger.const import TODAY
+from carlogger.forecast import MileageForecaster
+from carlogger.items.car import Car
+from carlogger.items.log_entry import ScheduledLogEntry
+from carlogger.scheduler import DueKind, get_scheduled_entries
+from carlogger.util import add_days_clamped, date_string_to_date, format_tuple_to_date_string
+
+ICAL_LINE_LENGTH = 75
+
+
+@dataclass(order=True)
+class Occurrence:
+    date: datetime.date
+    entry: ScheduledLogEntry = field(compare=False)
+    index: int = field(compare=False, default=0)
+    projected: bool = field(compare=False, default=False)
+
+    def get_formatted_info(self) -> str:
+        date = format_tuple_to_date_string((self.date.day, self.date.month, self.date.year))
+        note = " (projected)" if self.projected else ""
+        return f"[{date}]{note} {self.get_location()} | {self.entry.desc} [Type: {self.entry.category}]"
+
+    def get_location(self) -> str:
+        component = self.entry.component
+
+        try:
+            return f"{component.parent.car.car_info.name}/{component.name}"
+        except AttributeError:
+            return component.name
+
+
+def iter_date_occurrences(entry: ScheduledLogEntry, start: datetime.date,
+                          end: datetime.date) -> Iterator[Occurrence]:
+    """Yield occurrences of a date-ruled entry falling in [start, end], repeating ones every 'frequency' days."""
+    first = date_string_to_date(entry.date)
+
+    if not entry.repeating or entry.frequency <= 0:
+        if start <= first <= end:
+            yield Occurrence(first, entry)
+        return
+
+    # Jump straight to the first occurrence within range instead of stepping through the past ones
+    index = max(0, math.ceil((start - first).days / entry.frequency))
+
+    while (date := first + datetime.timedelta(days=index * entry.frequency)) <= end:
+        yield Occurrence(date, entry, index)
+        index += 1
+
+
+def iter_mileage_occurrences(entry: ScheduledLogEntry, start: datetime.date, end: datetime.date,
+                             mileage_velocity: float | None) -> Iterator[Occurrence]:
+    """Yield projected occurrences of a mileage-ruled entry falling in [start, end], repeating ones every
+    'frequency' mileage. Nothing is yielded when the car's mileage velocity is unknown."""
+    if not mileage_velocity or mileage_velocity <= 0:
+        return
+
+    today = date_string_to_date(TODAY)
+    remaining = max(entry.get_time_remaining(), 0)
+    step = entry.frequency if entry.repeating and entry.frequency > 0 else None
+
+    for index in itertools.count():
+        date = add_days_clamped(today, remaining / mileage_velocity)
+
+        # Projection past the last representable date, later occurrences can't come any sooner
+        if date > end or date == datetime.date.max:
+            return
+
+        if date >= start:
+            yield Occurrence(date, entry, index, projected=True)
+
+        if step is None:
+            return
+
+        remaining += step
+
+
+def iter_entry_occurrences(entry: ScheduledLogEntry, start: datetime.date, end: datetime.date,
+                           mileage_velocity: float | None = None) -> Iterator[Occurrence]:
+    if entry.get_schedule_rule() == DueKind.mileage:
+        return iter_mileage_occurrences(entry, start, end, mileage_velocity)
+    return iter_date_occurrences(entry, start, end)
+
+
+def iter_calendar(cars: list[Car], start: datetime.date, end: datetime.date,
+                  forecaster: MileageForecaster = None) -> Iterator[Occurrence]:
+    """Lazily yield occurrences of all scheduled entries of the fleet in date order.\n
+    Each entry gets its own generator and they are merged with a heap, so only one pending occurrence per entry is
+    held in memory no matter how long the range is."""
+    forecaster = forecaster or MileageForecaster()
+    generators = []
+
+    for car in cars:
+        for entry in get_scheduled_entries(car):
+            velocity = forecaster.get_velocity(car) if entry.get_schedule_rule() == DueKind.mileage else None
+            generators.append(iter_entry_occurrences(entry, start, end, velocity))
+
+    return heapq.merge(*generators)
+
+
+def escape_ical_text(text: str) -> str:
+    return str(text).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def fold_ical_line(line: str) -> str:
+    """Fold content line longer than 75 characters into continuation lines starting with a space."""
+    if len(line) <= ICAL_LINE_LENGTH:
+        return line + '\r\n'
+
+    parts = [line[:ICAL_LINE_LENGTH]]
+    parts += [line[i:i + ICAL_LINE_LENGTH - 1] for i in range(ICAL_LINE_LENGTH, len(line), ICAL_LINE_LENGTH - 1)]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def iter_ical_lines(occurrences: Iterable[Occurrence]) -> Iterator[str]:
+    """Yield iCalendar lines of all-day events, one event per occurrence."""
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    yield from ('BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//carlogger//schedule calendar//EN', 'CALSCALE:GREGORIAN')
+
+    for occurrence in occurrences:
+        entry = occurrence.entry
+        description = f"Category: {entry.category}, rule: {entry.rule}, frequency: {entry.frequency}"
+
+        if occurrence.projected:
+            description += ", projected from mileage driven per day"
+
+        yield 'BEGIN:VEVENT'
+        yield f"UID:{entry.id}-{occurrence.index}@carlogger"
+        yield f"DTSTAMP:{stamp}"
+        yield f"DTSTART;VALUE=DATE:{occurrence.date.strftime('%Y%m%d')}"
+        yield f"DTEND;VALUE=DATE:{(occurrence.date + datetime.timedelta(days=1)).strftime('%Y%m%d')}"
+        yield f"SUMMARY:{escape_ical_text(f'{occurrence.get_location()}: {entry.desc}')}"
+        yield f"DESCRIPTION:{escape_ical_text(description)}"
+        yield 'END:VEVENT'
+
+    yield 'END:VCALENDAR'
+
+
+def write_ical(occurrences: Iterable[Occurrence], file: TextIO) -> int:
+    """Stream occurrences to file as iCalendar events, return number of written events."""
+    count = 0
+
+    for line in iter_ical_lines(occurrences):
+        file.write(fold_ical_line(line))
+        count += line == 'BEGIN:VEVENT'
+
+    return count
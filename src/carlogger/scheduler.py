@@ -0,0 +1,301 @@
+"""Fleet-wide index of scheduled entries ordered by how soon they are due."""
+
+import bisect
+import heapq
+import itertools
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from carlogger.const import ITEM, TODAY
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.items.car import Car
+from carlogger.items.car_component import CarComponent
+from carlogger.items.component_collection import ComponentCollection
+from carlogger.items.log_entry import LogEntry, ScheduledLogEntry
+from carlogger.util import date_string_to_ordinal
+
+
+def get_scheduled_entries(item: ITEM) -> list[ScheduledLogEntry]:
+    """Return scheduled entries of an item and all of its children."""
+    if isinstance(item, ScheduledLogEntry):
+        return [item]
+    if isinstance(item, (Car, ComponentCollection)):
+        return item.get_all_scheduled_entry_logs()
+    if isinstance(item, CarComponent):
+        return list(item.scheduled_log_entries)
+    return []
+
+
+def get_entry_car(entry: ScheduledLogEntry) -> Car | None:
+    try:
+        return entry.component.parent.car
+    except AttributeError:
+        return None
+
+
+class DueKind(StrEnum):
+    date = 'date'
+    mileage = 'mileage'
+
+
+@dataclass(order=True)
+class DueEntry:
+    remaining: int
+    kind: DueKind = field(compare=False)
+    entry: ScheduledLogEntry = field(compare=False)
+
+    @property
+    def is_overdue(self) -> bool:
+        return self.remaining < 0
+
+    def get_formatted_info(self) -> str:
+        unit = 'days' if self.kind == DueKind.date else 'mileage'
+        return f"[{self.remaining} {unit}] {self.get_location()} | {self.entry.get_formatted_info()}"
+
+    def get_location(self) -> str:
+        component = self.entry.component
+
+        try:
+            return f"{component.parent.car.car_info.name}/{component.name}"
+        except AttributeError:
+            return component.name
+
+
+class DueQueue:
+    """Min-heap of scheduled entries with lazy deletion.\n
+    Changed entries are pushed again under a new sequence number, outdated heap items are dropped once they
+    surface at the top, so add, update and remove are all O(log n)."""
+    def __init__(self):
+        self._heap: list[tuple[int, int, ScheduledLogEntry]] = []
+        self._sequences: dict[int, int] = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._sequences)
+
+    def push(self, entry: ScheduledLogEntry, key: int):
+        sequence = next(self._counter)
+        self._sequences[id(entry)] = sequence
+        heapq.heappush(self._heap, (key, sequence, entry))
+
+        if len(self._heap) > 2 * len(self._sequences) + 16:
+            self._compact()
+
+    def remove(self, entry: ScheduledLogEntry):
+        self._sequences.pop(id(entry), None)
+
+    def __contains__(self, entry: ScheduledLogEntry) -> bool:
+        return id(entry) in self._sequences
+
+    def take(self, n: int = None, max_key: int = None) -> list[tuple[int, ScheduledLogEntry]]:
+        """Return up to n entries with the smallest keys in order, optionally only keys lower than 'max_key'.
+        Costs O(k log n) for k returned entries, the queue itself is left unchanged."""
+        taken = []
+
+        while self._heap and (n is None or len(taken) < n):
+            key, sequence, entry = self._heap[0]
+
+            if self._sequences.get(id(entry)) != sequence:
+                heapq.heappop(self._heap)
+                continue
+
+            if max_key is not None and key >= max_key:
+                break
+
+            taken.append(heapq.heappop(self._heap))
+
+        for heap_item in taken:
+            heapq.heappush(self._heap, heap_item)
+
+        return [(key, entry) for key, _, entry in taken]
+
+    def clear(self):
+        self._heap.clear()
+        self._sequences.clear()
+
+    def _compact(self):
+        self._heap = [heap_item for heap_item in self._heap if self._sequences.get(id(heap_item[2])) == heap_item[1]]
+        heapq.heapify(self._heap)
+
+
+class DueScheduler:
+    """Keeps scheduled entries of the whole fleet in two priority queues: date-ruled entries keyed by the ordinal
+    of their due date and mileage-ruled entries keyed by mileage left until their target mileage.\n
+    Mileage keys depend on component mileage, they are refreshed whenever a new entry or car update may have
+    moved it. The scheduler follows item events when constructed with an event bus."""
+    def __init__(self, event_bus: EventBus = None):
+        self.date_queue = DueQueue()
+        self.mileage_queue = DueQueue()
+
+        if event_bus:
+            event_bus.subscribe(self.on_item_event)
+
+    def __len__(self):
+        return len(self.date_queue) + len(self.mileage_queue)
+
+    def build(self, cars: list[Car]):
+        self.clear()
+
+        for car in cars:
+            self.add_tree(car)
+
+    def clear(self):
+        self.date_queue.clear()
+        self.mileage_queue.clear()
+
+    def add_tree(self, item: ITEM):
+        for entry in get_scheduled_entries(item):
+            self.add_entry(entry)
+
+    def remove_tree(self, item: ITEM):
+        for entry in get_scheduled_entries(item):
+            self.remove_entry(entry)
+
+    def add_entry(self, entry: ScheduledLogEntry):
+        """Add entry or move it to its current place in the queue."""
+        self.remove_entry(entry)
+
+        match entry.get_schedule_rule():
+            case DueKind.date:
+                self.date_queue.push(entry, date_string_to_ordinal(entry.date))
+            case DueKind.mileage:
+                self.mileage_queue.push(entry, entry.mileage - entry.component.current_mileage)
+
+    def remove_entry(self, entry: ScheduledLogEntry):
+        self.date_queue.remove(entry)
+        self.mileage_queue.remove(entry)
+
+    def refresh_mileage(self, item: ITEM):
+        """Re-key mileage-ruled entries of a car or component after its mileage changed."""
+        for entry in get_scheduled_entries(item):
+            if entry in self.mileage_queue:
+                self.add_entry(entry)
+
+    def on_item_event(self, event: ItemEvent, item: ITEM):
+        match event:
+            case ItemEvent.created | ItemEvent.updated if isinstance(item, ScheduledLogEntry):
+                self.add_entry(item)
+            case ItemEvent.created if isinstance(item, LogEntry):
+                self.refresh_mileage(item.component)
+            case ItemEvent.created:
+                self.add_tree(item)
+            case ItemEvent.updated if isinstance(item, (Car, CarComponent)):
+                self.refresh_mileage(item)
+            case ItemEvent.deleted:
+                self.remove_tree(item)
+
+    def get_next_due(self, n: int = 5, kind: DueKind = None) -> list[DueEntry]:
+        """Return n entries that are due the soonest, including overdue ones. Days left of date-ruled entries
+        and mileage left of mileage-ruled entries are compared directly, same as sorting by time remaining."""
+        due_entries = self._take(n, kind)
+        return sorted(due_entries)[:n]
+
+    def get_overdue(self, kind: DueKind = None) -> list[DueEntry]:
+        """Return entries whose due date or target mileage has already passed, most overdue first."""
+        return sorted(self._take(max_remaining=0, kind=kind))
+
+    def _take(self, n: int = None, kind: DueKind = None, max_remaining: int = None) -> list[DueEntry]:
+        due_entries = []
+        today = date_string_to_ordinal(TODAY)
+
+        if kind in (None, DueKind.date):
+            max_key = None if max_remaining is None else today + max_remaining
+            due_entries += [DueEntry(key - today, DueKind.date, entry)
+                            for key, entry in self.date_queue.take(n, max_key)]
+
+        if kind in (None, DueKind.mileage):
+            due_entries += [DueEntry(key, DueKind.mileage, entry)
+                            for key, entry in self.mileage_queue.take(n, max_remaining)]
+
+        return due_entries
+
+
+class MileageThresholds:
+    """Target mileages of mileage-ruled scheduled entries of a single car, kept sorted."""
+    def __init__(self):
+        self._thresholds: list[tuple[int, int, ScheduledLogEntry]] = []
+        self._targets: dict[int, int] = {}
+
+    def __len__(self):
+        return len(self._targets)
+
+    def add(self, entry: ScheduledLogEntry):
+        self.remove(entry)
+        bisect.insort(self._thresholds, (entry.mileage, id(entry), entry))
+        self._targets[id(entry)] = entry.mileage
+
+    def remove(self, entry: ScheduledLogEntry):
+        if (target := self._targets.pop(id(entry), None)) is None:
+            return
+
+        del self._thresholds[bisect.bisect_left(self._thresholds, (target, id(entry)))]
+
+    def get_crossed(self, old_mileage: int, new_mileage: int) -> list[ScheduledLogEntry]:
+        """Return entries whose target mileage falls in (old_mileage, new_mileage]."""
+        start = bisect.bisect_right(self._thresholds, (old_mileage, float('inf')))
+        end = bisect.bisect_right(self._thresholds, (new_mileage, float('inf')))
+        return [entry for _, _, entry in self._thresholds[start:end]]
+
+
+class MileageTriggerIndex:
+    """Per-car thresholds of mileage-ruled scheduled entries.\n
+    Lets an odometer update from M1 to M2 find the entries that just became due with a bisection instead of walking
+    every component. The index follows item events when constructed with an event bus."""
+    def __init__(self, event_bus: EventBus = None):
+        self._cars: dict[int, MileageThresholds] = {}
+        self._entry_cars: dict[int, int] = {}
+
+        if event_bus:
+            event_bus.subscribe(self.on_item_event)
+
+    def build(self, cars: list[Car]):
+        self.clear()
+
+        for car in cars:
+            self.add_tree(car)
+
+    def clear(self):
+        self._cars.clear()
+        self._entry_cars.clear()
+
+    def add_tree(self, item: ITEM):
+        for entry in get_scheduled_entries(item):
+            self.add_entry(entry)
+
+    def remove_tree(self, item: ITEM):
+        for entry in get_scheduled_entries(item):
+            self.remove_entry(entry)
+
+        if isinstance(item, Car):
+            self._cars.pop(id(item), None)
+
+    def add_entry(self, entry: ScheduledLogEntry):
+        """Add entry under its current target mileage, entries of other rules are dropped."""
+        self.remove_entry(entry)
+        car = get_entry_car(entry)
+
+        if car is None or entry.get_schedule_rule() != DueKind.mileage:
+            return
+
+        self._cars.setdefault(id(car), MileageThresholds()).add(entry)
+        self._entry_cars[id(entry)] = id(car)
+
+    def remove_entry(self, entry: ScheduledLogEntry):
+        if (car_id := self._entry_cars.pop(id(entry), None)) is not None:
+            self._cars[car_id].remove(entry)
+
+    def on_item_event(self, event: ItemEvent, item: ITEM):
+        match event:
+            case ItemEvent.created | ItemEvent.updated if isinstance(item, ScheduledLogEntry):
+                self.add_entry(item)
+            case ItemEvent.created if not isinstance(item, LogEntry):
+                self.add_tree(item)
+            case ItemEvent.deleted:
+                self.remove_tree(item)
+
+    def get_crossed(self, car: Car, old_mileage: int, new_mileage: int) -> list[ScheduledLogEntry]:
+        """Return scheduled entries of a car that became due when its mileage went from old to new value."""
+        if new_mileage <= old_mileage or id(car) not in self._cars:
+            return []
+        return self._cars[id(car)].get_crossed(old_mileage, new_mileage)
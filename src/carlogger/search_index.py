@@ -0,0 +1,261 @@
+"""Fleet-wide full text search over car, collection and component names, entry descriptions, tags and custom info."""
+
+import re
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from carlogger.const import ITEM
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.items.car import Car
+from carlogger.items.car_component import CarComponent
+from carlogger.items.component_collection import ComponentCollection
+from carlogger.items.log_entry import LogEntry
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Score multipliers for matched fields and for how well the query token matched
+FIELD_WEIGHTS = {'name': 3.0, 'desc': 2.0, 'tags': 1.5, 'custom_info': 1.0}
+MATCH_WEIGHTS = {'exact': 3.0, 'prefix': 2.0, 'substring': 1.0}
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def get_trigrams(token: str) -> set[str]:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def get_item_path(item: ITEM) -> list[ITEM]:
+    """Return chain of items from the parent car down to target item."""
+    path = []
+
+    while item is not None:
+        path.append(item)
+
+        if isinstance(item, Car):
+            break
+
+        if isinstance(item, ComponentCollection) and isinstance(item.parent_collection, ComponentCollection):
+            item = item.parent_collection
+        else:
+            item = item.parent
+
+    return list(reversed(path))
+
+
+@dataclass
+class SearchHit:
+    item: ITEM
+    score: float
+    field: str
+    text: str
+
+    def get_location(self) -> str:
+        """Return 'car/collection/component' path leading to the found item."""
+        names = [item.car_info.name if isinstance(item, Car) else item.name
+                 for item in get_item_path(self.item) if not isinstance(item, LogEntry)]
+        return '/'.join(names)
+
+    def get_formatted_info(self) -> str:
+        return f"[{self.score:.1f}] {self.item.__class__.__name__} {self.get_location()} | {self.field}: {self.text}"
+
+
+@dataclass
+class _Document:
+    item: ITEM
+    fields: dict[str, str]
+    tokens: dict[str, set[str]] = field(default_factory=dict)
+
+
+class SearchIndex:
+    """Inverted index with prefix and trigram postings.\n
+    Prefix postings answer as-you-type queries, trigram postings find tokens containing the query anywhere inside.
+    Every query token has to match for an item to be returned. The index is kept up to date through item events
+    when constructed with an event bus."""
+    def __init__(self, event_bus: EventBus = None):
+        self._documents: dict[int, _Document] = {}
+        self._prefix_postings: dict[str, set[int]] = defaultdict(set)
+        self._trigram_postings: dict[str, set[int]] = defaultdict(set)
+
+        if event_bus:
+            event_bus.subscribe(self.on_item_event)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def build(self, cars: list[Car]):
+        self.clear()
+
+        for car in cars:
+            self.add_tree(car)
+
+    def clear(self):
+        self._documents.clear()
+        self._prefix_postings.clear()
+        self._trigram_postings.clear()
+
+    def add_tree(self, item: ITEM):
+        """Index item along with all of its children."""
+        for child in self._iter_tree(item):
+            self.add_item(child)
+
+    def remove_tree(self, item: ITEM):
+        for child in self._iter_tree(item):
+            self.remove_item(child)
+
+    def add_item(self, item: ITEM):
+        self.remove_item(item)
+
+        doc_id = id(item)
+        document = _Document(item, self._get_fields(item))
+
+        for field_name, text in document.fields.items():
+            document.tokens[field_name] = set(tokenize(text))
+
+        for token in set().union(*document.tokens.values()):
+            for i in range(1, len(token) + 1):
+                self._prefix_postings[token[:i]].add(doc_id)
+
+            for trigram in get_trigrams(token):
+                self._trigram_postings[trigram].add(doc_id)
+
+        self._documents[doc_id] = document
+
+    def remove_item(self, item: ITEM):
+        doc_id = id(item)
+
+        if not (document := self._documents.pop(doc_id, None)):
+            return
+
+        for token in set().union(*document.tokens.values()):
+            for i in range(1, len(token) + 1):
+                self._discard_posting(self._prefix_postings, token[:i], doc_id)
+
+            for trigram in get_trigrams(token):
+                self._discard_posting(self._trigram_postings, trigram, doc_id)
+
+    def on_item_event(self, event: ItemEvent, item: ITEM):
+        match event:
+            case ItemEvent.created:
+                self.add_tree(item)
+            case ItemEvent.updated:
+                self.add_item(item)
+            case ItemEvent.deleted:
+                self.remove_tree(item)
+
+    def search(self, text: str, limit: int = 20) -> list[SearchHit]:
+        """Return items matching every word of the query, best matches first."""
+        query_tokens = tokenize(text)
+
+        if not query_tokens:
+            return []
+
+        candidates: set[int] | None = None
+
+        for token in query_tokens:
+            token_candidates = self._find_candidates(token)
+            candidates = token_candidates if candidates is None else candidates & token_candidates
+
+            if not candidates:
+                return []
+
+        hits = [self._score(self._documents[doc_id], query_tokens) for doc_id in candidates]
+        hits = [hit for hit in hits if hit]
+        hits.sort(key=lambda hit: (-hit.score, len(hit.text)))
+
+        return hits[:limit]
+
+    def _find_candidates(self, token: str) -> set[int]:
+        candidates = set(self._prefix_postings.get(token, ()))
+
+        if len(token) >= 3:
+            trigram_sets = [self._trigram_postings.get(trigram, set()) for trigram in get_trigrams(token)]
+            candidates |= set.intersection(*trigram_sets)
+
+        return candidates
+
+    def _score(self, document: _Document, query_tokens: list[str]) -> SearchHit | None:
+        """Score document by the best matching field of each query token, trigram candidates are verified here."""
+        score = 0.0
+        best_field, best_field_score = '', 0.0
+
+        for query_token in query_tokens:
+            token_score = 0.0
+
+            for field_name, tokens in document.tokens.items():
+                match_score = max((self._match(query_token, token) for token in tokens), default=0.0)
+                field_score = match_score * FIELD_WEIGHTS[field_name]
+
+                if field_score > token_score:
+                    token_score = field_score
+
+                if field_score > best_field_score:
+                    best_field, best_field_score = field_name, field_score
+
+            if token_score == 0:
+                return None
+
+            score += token_score
+
+        return SearchHit(document.item, score, best_field, document.fields[best_field])
+
+    def _match(self, query_token: str, token: str) -> float:
+        if token == query_token:
+            return MATCH_WEIGHTS['exact']
+        if token.startswith(query_token):
+            return MATCH_WEIGHTS['prefix']
+        if len(query_token) >= 3 and query_token in token:
+            return MATCH_WEIGHTS['substring']
+        return 0.0
+
+    def _get_fields(self, item: ITEM) -> dict[str, str]:
+        if isinstance(item, Car):
+            fields = {'name': item.car_info.name, 'desc': item.car_info.desc}
+            custom_info = item.car_info.custom_info
+        elif isinstance(item, LogEntry):
+            fields = {'desc': item.desc, 'tags': ' '.join(map(str, item.tags or []))}
+            custom_info = item.custom_info
+        else:
+            fields = {'name': item.name, 'desc': item.desc or ''}
+            custom_info = item.custom_info
+
+        fields['custom_info'] = ' '.join(f"{key} {value}" for key, value in (custom_info or {}).items())
+
+        return {key: value for key, value in fields.items() if value}
+
+    def _iter_tree(self, item: ITEM):
+        seen = set()
+        stack = [item]
+
+        while stack:
+            current = stack.pop()
+
+            if id(current) in seen:
+                continue
+
+            seen.add(id(current))
+            yield current
+
+            if isinstance(current, Car):
+                stack.extend(current.collections)
+            elif isinstance(current, ComponentCollection):
+                stack.extend(current.components)
+                stack.extend(self._get_nested_collections(current))
+            elif isinstance(current, CarComponent):
+                stack.extend(current.get_all_entry_logs())
+
+    def _get_nested_collections(self, collection: ComponentCollection) -> list[ComponentCollection]:
+        """Nested collections of a loaded car are copies built from references, the car holds the real ones."""
+        if not collection.car:
+            return collection.collections
+
+        return [coll for coll in collection.car.collections if coll.parent_collection is collection]
+
+    def _discard_posting(self, postings: dict[str, set[int]], key: str, doc_id: int):
+        if doc_ids := postings.get(key):
+            doc_ids.discard(doc_id)
+
+            if not doc_ids:
+                del postings[key]
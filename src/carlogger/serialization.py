@@ -0,0 +1,134 @@
+"""Codecs turning item dictionaries into save file contents and back."""
+
+import json
+import marshal
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from carlogger.util import date_string_to_ordinal, ordinal_to_date_string, is_date
+
+# Marshal-encoded files start with this header, the last byte is the version of the layout that follows
+MARSHAL_MAGIC = b'CLGM\x01'
+MARSHAL_VERSION = 4
+
+# Layout of save files, directories without a format record predate versioning and use the legacy layout:
+# 1 - entry dates as 'dd-mm-yyyy' strings
+# 2 - entry dates as proleptic Gregorian day ordinals
+# 3 - collection and component files named after stable item ids and referenced by them
+LEGACY_FORMAT_VERSION = 1
+FORMAT_VERSION = 3
+ENTRY_LISTS = ('log_entries', 'scheduled_log_entries')
+
+
+class Codec(ABC):
+    name = ""
+
+    @abstractmethod
+    def encode(self, data: dict) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, content: bytes) -> dict:
+        pass
+
+    @abstractmethod
+    def matches(self, content: bytes) -> bool:
+        """Whether content was written by this codec."""
+        pass
+
+
+class PrettyJSONCodec(Codec):
+    """Indented JSON, readable and editable by hand."""
+    name = "json-pretty"
+
+    def encode(self, data: dict) -> bytes:
+        return json.dumps(data, indent=3).encode()
+
+    def decode(self, content: bytes) -> dict:
+        return json.loads(content)
+
+    def matches(self, content: bytes) -> bool:
+        return not content.startswith(MARSHAL_MAGIC)
+
+
+class CompactJSONCodec(PrettyJSONCodec):
+    """JSON without any whitespace, about half the size of indented JSON."""
+    name = "json-compact"
+
+    def encode(self, data: dict) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode()
+
+
+class MarshalCodec(Codec):
+    """Python marshal format behind a magic header, the fastest to load but not human-readable.\n
+    Marshal data is not meant to be loaded from untrusted sources, use it only for your own save directories."""
+    name = "marshal"
+
+    def encode(self, data: dict) -> bytes:
+        return MARSHAL_MAGIC + marshal.dumps(data, MARSHAL_VERSION)
+
+    def decode(self, content: bytes) -> dict:
+        return marshal.loads(content[len(MARSHAL_MAGIC):])
+
+    def matches(self, content: bytes) -> bool:
+        return content.startswith(MARSHAL_MAGIC)
+
+
+CODECS: dict[str, Codec] = {codec.name: codec for codec in (PrettyJSONCodec(), CompactJSONCodec(), MarshalCodec())}
+DEFAULT_CODEC = PrettyJSONCodec.name
+
+
+def get_codec(name: str) -> Codec:
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown codec '{name}', choose from: {', '.join(CODECS)}") from None
+
+
+def detect_codec(content: bytes) -> Codec:
+    """Codec able to decode content, pretty and compact JSON decode the same way."""
+    if CODECS[MarshalCodec.name].matches(content):
+        return CODECS[MarshalCodec.name]
+    return CODECS[DEFAULT_CODEC]
+
+
+def encode_layout(data: dict, version: int) -> dict:
+    """Convert item dictionary to the file layout of given format version."""
+    if version < 2 or not isinstance(data, dict) or not any(key in data for key in ENTRY_LISTS):
+        return data
+
+    return {**data, **{key: [_encode_entry_date(entry) for entry in data[key]] for key in ENTRY_LISTS if key in data}}
+
+
+def _encode_entry_date(entry: dict) -> dict:
+    date = entry.get('date')
+
+    if isinstance(date, str) and is_date(date):
+        return {**entry, 'date': date_string_to_ordinal(date)}
+    return entry
+
+
+def decode_layout(data: dict) -> dict:
+    """Convert file data of any format version back to item dictionary in place, dates as 'dd-mm-yyyy' strings.\n
+    Both layouts are accepted regardless of the version recorded for the directory, so a directory interrupted
+    halfway through a migration still loads."""
+    if not isinstance(data, dict):
+        return data
+
+    for key in ENTRY_LISTS:
+        for entry in data.get(key) or ():
+            if type(entry.get('date')) is int:
+                entry['date'] = ordinal_to_date_string(entry['date'])
+
+    return data
+
+
+@dataclass
+class SaveFormat:
+    """Format record of a save directory, new files are written with its codec and in the layout of its version."""
+    codec: str = DEFAULT_CODEC
+    version: int = LEGACY_FORMAT_VERSION
+
+    def to_json(self) -> dict:
+        return {'codec': self.codec, 'version': self.version}
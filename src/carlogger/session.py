@@ -1,18 +1,39 @@
 """Class that combines everything together, the heart of the program"""
+import dataclasses
+import datetime
 import os
+import signal
 
 from pathlib import Path
+from typing import Callable, Iterator
 
 from carlogger.gui.root_window import RootWindow
 from carlogger.directory_manager import DirectoryManager
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.filedata_manager import FileData
+from carlogger.fleet_loader import FleetLoader
+from carlogger.forecast import MileageForecaster, Forecast
 from carlogger.items.car import Car
 from carlogger.items.car_info import CarInfo
 from carlogger.cli.arg_executor import ArgExecutor, AddArgExecutor, ReadArgExecutor, DeleteArgExecutor, \
-    UpdateArgExecutor, ExportArgExecutor, ImportArgExecutor
+    UpdateArgExecutor, ExportArgExecutor, ImportArgExecutor, SearchArgExecutor, IndexArgExecutor, DueArgExecutor, \
+    IngestArgExecutor, ForecastArgExecutor, CalendarArgExecutor, StatsArgExecutor, CodecArgExecutor, \
+    MigrateArgExecutor
 from carlogger.items.component_collection import ComponentCollection
 from carlogger.items.car_component import CarComponent
+from carlogger.items.custom_info_index import CustomInfoIndexes, IndexDefinition
+from carlogger.items.item_filter import ItemFilter
 from carlogger.items.log_entry import ScheduledLogEntry
+from carlogger.items.tag_index import FleetTagIndex
+from carlogger.metrics import SESSION_SECONDS, timed_operation
+from carlogger.migrations import Migrator, Migration, MigrationProgress
+from carlogger.printer import Printer
+from carlogger.tracing import traced
 from carlogger.rename_agent import RenameAgent
+from carlogger.save_queue import SaveQueue
+from carlogger.schedule_calendar import Occurrence, iter_calendar
+from carlogger.scheduler import DueScheduler, DueEntry, MileageTriggerIndex
+from carlogger.search_index import SearchIndex, SearchHit
 from carlogger.util import check_file_extension_validity, is_scheduled_entry
 
 
@@ -22,6 +43,15 @@ class AppSession:
         self.directory_manager = directory_manager
         self.arg_executor: ArgExecutor = ...
         self.gui = None
+        self.save_queue = SaveQueue(directory_manager)
+        self.event_bus = EventBus()
+        self.fleet_loader = FleetLoader(directory_manager)
+        directory_manager.load_save_format()
+        self.search_index = SearchIndex(self.event_bus)
+        self.custom_info_indexes = CustomInfoIndexes(directory_manager.load_index_definitions(), self.event_bus)
+        self.scheduler = DueScheduler(self.event_bus)
+        self.mileage_triggers = MileageTriggerIndex(self.event_bus)
+        self.forecaster = MileageForecaster(self.event_bus)
 
         self.cars: list[Car] = []
         self.selected_car: Car = ...
@@ -30,22 +60,158 @@ class AppSession:
         self.gui = gui
         self.gui.app_session = self
 
-        self.cars = self.directory_manager.load_all_car_dir()
-
+        # Cars are loaded in the background and handed over one by one through 'add_loaded_car'
+        self.cars = []
         self.gui.cars = self.cars
-        self.selected_car = self.cars[0]
 
+        self.save_queue.start()
+        signal.signal(signal.SIGTERM, self._on_terminate)
+
+        self.fleet_loader.start()
         self.gui.start_mainloop()
 
+    def add_loaded_car(self, car: Car) -> bool:
+        """Add car loaded by the fleet loader to the session, must be called from the GUI thread.
+        Return False if a car with the same name is already present."""
+        if car.car_info.name in [c.car_info.name for c in self.cars]:
+            return False
+
+        self.cars.append(car)
+        self._index_car(car)
+
+        if self.selected_car is ...:
+            self.selected_car = car
+
+        return True
+
+    def load_all_cars(self) -> list[Car]:
+        """Load the whole fleet from save directory and build search index over it."""
+        self.cars = self.directory_manager.load_all_car_dir()
+        self._build_indexes()
+
+        if self.cars:
+            self.selected_car = self.cars[0]
+
+        return self.cars
+
+    def convert_save_codec(self, codec: str) -> list[Car]:
+        """Record new codec of the save directory and rewrite every car directory with it."""
+        self.flush_saves()
+        cars = self.load_all_cars()
+
+        self.directory_manager.save_save_format(dataclasses.replace(self.directory_manager.save_format, codec=codec))
+
+        if self.directory_manager.get_index_definitions_path().exists():
+            self.directory_manager.save_index_definitions(self.custom_info_indexes)
+
+        for car in cars:
+            self.directory_manager.update_car_directory(car)
+
+        return cars
+
+    def migrate_save_directory(self, progress: Callable[[MigrationProgress], None] = None) -> list[Migration]:
+        """Upgrade the save directory to the current format version, see `Migrator`."""
+        self.flush_saves()
+        return Migrator(self.directory_manager).run(progress)
+
+    def _index_car(self, car: Car):
+        """Add car loaded from disk to search, custom info, due-date and mileage trigger indexes."""
+        self.search_index.add_tree(car)
+        self.custom_info_indexes.add_tree(car)
+        self.scheduler.add_tree(car)
+        self.mileage_triggers.add_tree(car)
+
+    def _build_indexes(self):
+        self.search_index.build(self.cars)
+        self.custom_info_indexes.build(self.cars)
+        self.scheduler.build(self.cars)
+        self.mileage_triggers.build(self.cars)
+        self.forecaster.clear()
+
+    def get_due_entries(self, count: int = 5, overdue_only=False) -> list[DueEntry]:
+        """Return scheduled entries of loaded cars that are due the soonest."""
+        if overdue_only:
+            return self.scheduler.get_overdue()[:count]
+        return self.scheduler.get_next_due(count)
+
+    def get_forecast(self, within_days: int = None) -> Forecast:
+        """Rank scheduled entries of loaded cars by projected due date."""
+        return self.forecaster.get_forecast(self.cars, within_days)
+
+    def iter_calendar(self, start: datetime.date, end: datetime.date) -> Iterator[Occurrence]:
+        """Lazily yield future occurrences of scheduled entries of loaded cars in date order."""
+        return iter_calendar(self.cars, start, end, self.forecaster)
+
+    def search(self, text: str, limit: int = 20) -> list[SearchHit]:
+        """Find items by names, descriptions, tags and custom info, best matches first."""
+        return self.search_index.search(text, limit)
+
+    def add_custom_info_index(self, item_type: str, key: str, numeric=False) -> bool:
+        """Declare a secondary index on custom info key of given item type and remember it in the save directory.
+        Return False if the same index already exists."""
+        if not self.custom_info_indexes.declare(IndexDefinition(item_type, key, numeric)):
+            return False
+
+        self.directory_manager.save_index_definitions(self.custom_info_indexes)
+        return True
+
+    def remove_custom_info_index(self, item_type: str, key: str) -> bool:
+        if not self.custom_info_indexes.drop(item_type, key):
+            return False
+
+        self.directory_manager.save_index_definitions(self.custom_info_indexes)
+        return True
+
+    def get_item_filter(self) -> ItemFilter:
+        """Return item filter that makes use of declared custom info indexes."""
+        return ItemFilter(self.custom_info_indexes)
+
+    def get_fleet_tag_index(self) -> FleetTagIndex:
+        """Return tag index spanning every loaded car."""
+        return FleetTagIndex(self.cars)
+
+    def close(self):
+        """Stop background saving and write all pending changes to disk."""
+        self.save_queue.stop()
+
+    def _on_terminate(self, *args):
+        self.close()
+
+        if self.gui:
+            self.gui.destroy()
+
     def request_item_update(self):
-        self.reload_cars()
+        """Re-sync GUI car list with the session.\n
+        Item changes themselves reach the GUI through the event bus, there is no need to reload from disk."""
         self.gui.cars = self.cars
 
     def reload_cars(self):
+        """Save all cars and load the whole fleet from disk again."""
         for car in self.cars:
             self.save_car(car.car_info.name)
 
+        self.save_queue.flush()
         self.cars = self.directory_manager.load_all_car_dir()
+        self._build_indexes()
+
+    def flush_saves(self):
+        """Synchronously write everything that is waiting in the save queue."""
+        if self.save_queue.is_running:
+            self.save_queue.flush()
+
+    def _save_car_directory(self, car: Car):
+        """Update car directory, deferred to the save queue while it is running."""
+        if self.save_queue.is_running:
+            self.save_queue.request_save(car)
+        else:
+            self.directory_manager.update_car_directory(car)
+
+    def _save_item_file(self, item, path):
+        """Update a single item file, deferred to the save queue while it is running."""
+        if self.save_queue.is_running:
+            self.save_queue.request_item_save(item, path)
+        else:
+            self.directory_manager.data_manager.save_file(item, path)
 
     def execute_console_args(self, subparser_type: str, parsed_args: dict, raw_args: list[str]):
         """Create ArgExecutor object based on subparser in use and execute console arguments."""
@@ -62,11 +228,31 @@ class AppSession:
                 self.arg_executor = ImportArgExecutor(parsed_args, self, raw_args)
             case 'export':
                 self.arg_executor = ExportArgExecutor(parsed_args, self, raw_args)
+            case 'search':
+                self.arg_executor = SearchArgExecutor(parsed_args, self, raw_args)
+            case 'index':
+                self.arg_executor = IndexArgExecutor(parsed_args, self, raw_args)
+            case 'due':
+                self.arg_executor = DueArgExecutor(parsed_args, self, raw_args)
+            case 'ingest':
+                self.arg_executor = IngestArgExecutor(parsed_args, self, raw_args)
+            case 'forecast':
+                self.arg_executor = ForecastArgExecutor(parsed_args, self, raw_args)
+            case 'calendar':
+                self.arg_executor = CalendarArgExecutor(parsed_args, self, raw_args)
+            case 'stats':
+                self.arg_executor = StatsArgExecutor(parsed_args, self, raw_args)
+            case 'codec':
+                self.arg_executor = CodecArgExecutor(parsed_args, self, raw_args)
+            case 'migrate':
+                self.arg_executor = MigrateArgExecutor(parsed_args, self, raw_args)
             case _:
                 return
 
         self.arg_executor.evaluate_args()
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def add_new_car(self, car_info: dict) -> Car:
         """Create a new car directory."""
         car_info = CarInfo(**car_info)
@@ -77,85 +263,128 @@ class AppSession:
         self.directory_manager.create_car_directory(new_car)
 
         self.selected_car = self.cars[0]
+        self.event_bus.emit(ItemEvent.created, new_car)
 
         return new_car
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_car(self, car_name: str):
         """Delete car directory by name."""
         car_to_remove = self.get_car_by_name(car_name)
+        self.save_queue.discard(car_to_remove)
+        self.flush_saves()
         self.directory_manager.remove_car_directory(car_to_remove)
         self.cars.remove(car_to_remove)
+        self.event_bus.emit(ItemEvent.deleted, car_to_remove)
 
     def save_car(self, car_name: str):
         """Update car directory."""
         car = self.get_car_by_name(car_name)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def add_new_collection(self, car_name: str, collection_name: str) -> ComponentCollection:
         """Add new collection to specified car and update save directory."""
         car = self.get_car_by_name(car_name)
         new_collection = car.create_collection(collection_name)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit(ItemEvent.created, new_collection)
 
         return new_collection
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def add_new_nested_collection(self, car_name: str, collection_name: str,
                                   parent_collection_name: str) -> ComponentCollection:
         """Add new nested collection to specified car and parent collection and update save directory."""
         car = self.get_car_by_name(car_name)
         new_nested_collection = car.create_nested_collection(collection_name, parent_collection_name)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit(ItemEvent.created, new_nested_collection)
 
         return new_nested_collection
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_collection(self, car_name: str, collection_name: str):
         """Delete collection from target car by name."""
         car = self.get_car_by_name(car_name)
-        coll = car.get_collection_by_name(collection_name)
-
-        if coll and len(coll.children) > 0:
-            self.delete_collection_children(car_name, coll)
 
-        self.directory_manager.remove_item(coll)
-        car.delete_collection(collection_name)
-        self.directory_manager.update_car_directory(car)
+        if car.get_collection_by_name(collection_name):
+            self._delete_collections(car, [collection_name])
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_collection_children(self, car_name: str, collection: ComponentCollection):
-        for ch in collection.children:
-            if type(ch) == ComponentCollection:
-                self.delete_collection(car_name, ch.name)
-            else:
-                self.delete_component(car_name, collection.name, ch.name)
+        """Delete all nested collections and components of a collection and save the car once."""
+        car = self.get_car_by_name(car_name)
+        self.flush_saves()
+
+        deleted_collections = car.delete_collections([coll.name for coll in collection.collections])
+        deleted_components = collection.delete_components([comp.name for comp in collection.components])
+
+        self._remove_deleted_items(car, deleted_components + [comp for coll in deleted_collections
+                                                              for comp in coll.components], deleted_collections)
+
+    def _delete_collections(self, car: Car, names: list[str]):
+        """Delete collections with everything nested in them, remove their files and save the car once."""
+        self.flush_saves()
+        deleted_collections = car.delete_collections(names)
+        self._remove_deleted_items(car, [comp for coll in deleted_collections for comp in coll.components],
+                                   deleted_collections)
+
+    def _remove_deleted_items(self, car: Car, components: list[CarComponent], collections: list[ComponentCollection]):
+        """Remove files of deleted items, save the car once and announce deleted entries, components and collections."""
+        entries = [entry for comp in components for entry in comp.get_all_entry_logs()]
 
+        self.directory_manager.remove_items(components + collections)
+        self._save_car_directory(car)
+        self.event_bus.emit_many(ItemEvent.deleted, entries + components + collections)
+
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_component_children(self, component: CarComponent, car: Car):
+        deleted_entries = component.get_all_entry_logs()
         component.delete_children(self)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit_many(ItemEvent.deleted, deleted_entries)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_car_children(self, car: Car):
-        for ch in car.collections:
-            if len(ch.children) > 0:
-                self.delete_collection_children(car.car_info.name, ch)
-            self.delete_collection(car.car_info.name, ch.name)
+        """Delete all collections of a car and save it once."""
+        self._delete_collections(car, [coll.name for coll in car.collections])
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def add_new_component(self, car_name: str, collection_name: str, component_name: str) -> CarComponent:
         """Add new collection to specified car and update save directory."""
         car = self.get_car_by_name(car_name)
         collection = car.get_collection_by_name(collection_name)
         new_comp = collection.create_component(component_name)
         new_comp.parent = collection
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit(ItemEvent.created, new_comp)
 
         return new_comp
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_component(self, car_name: str, collection_name: str, component_name: str):
         """Delete component by name from target collection from specified car."""
         car = self.get_car_by_name(car_name)
         coll = car.get_collection_by_name(collection_name)
         comp = coll.get_component_by_name(component_name)
+        self.flush_saves()
         self.directory_manager.remove_item(comp)
         coll.delete_component(component_name)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit(ItemEvent.deleted, comp)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def add_new_entry(self, car_name: str, collection_name: str, component_name: str, entry_data: dict):
         """Add new entry to specified car and update save directory."""
         car = self.get_car_by_name(car_name)
@@ -168,8 +397,11 @@ class AppSession:
         if component.car_mileage_needs_update(new_entry):
             self.update_car_info(car, {'mileage': new_entry.mileage})
 
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit(ItemEvent.created, new_entry)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def add_new_scheduled_entry(self, car_name: str, collection_name: str, component_name: str, entry_data: dict):
         """Add new collection to specified car and update save directory."""
         car = self.get_car_by_name(car_name)
@@ -182,15 +414,22 @@ class AppSession:
         if component.car_mileage_needs_update(new_entry):
             self.update_car_info(car, {'mileage': new_entry.mileage})
 
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit(ItemEvent.created, new_entry)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_entry_by_index(self, car_name: str, component_name: str, entry_index: int):
         """Delete entry via list index from target component."""
         car = self.get_car_by_name(car_name)
         comp = car.get_component_by_name(component_name)
+        entries_before = list(comp.log_entries)
         comp.delete_entry_by_index(entry_index)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit_many(ItemEvent.deleted, [e for e in entries_before if e not in comp.log_entries])
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_entry_by_id(self, car_name: str, entry_id: str, component: CarComponent = None):
         """Delete entry via their unique ID."""
         car = self.get_car_by_name(car_name)
@@ -198,9 +437,15 @@ class AppSession:
         if not component:
             component = car.get_component_of_entry_by_entry_id(entry_id)
 
+        entry = component.get_entry_by_id(entry_id)
         component.delete_entry_by_id(entry_id)
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+
+        if entry:
+            self.event_bus.emit(ItemEvent.deleted, entry)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def delete_entries_by_id(self, car_name: str, entry_ids: list[str], component: CarComponent = None):
         """Delete batch of entries from component via their unique ID."""
         car = self.get_car_by_name(car_name)
@@ -208,51 +453,78 @@ class AppSession:
         if not component:
             component = car.get_component_of_entry_by_entry_id(entry_ids[0])
 
-        for entry_id in entry_ids:
-            component.delete_entry_by_id(entry_id)
+        deleted_entries = component.delete_entries_by_id(entry_ids)
 
-        self.directory_manager.update_car_directory(car)
+        self._save_car_directory(car)
+        self.event_bus.emit_many(ItemEvent.deleted, deleted_entries)
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def update_car_info(self, car: Car, updated_data: dict[str, ...]):
-        """Update target car info values and update the save file."""
+        """Update target car info values and update the save file.\n
+        Scheduled entries whose target mileage was passed by the new car mileage are announced as 'due' events."""
 
         legacy_car_info_path = car.car_info.path
+        old_mileage = car.car_info.mileage
 
         for key, value in updated_data.items():
             setattr(car.car_info, key, value)
 
+        if 'mileage' in updated_data.keys():
+            car.propagate_mileage()
+
         # Create new directory and copy items over when changing name of the car
         if 'name' in updated_data.keys():
             car.name = updated_data['name']
+            self.flush_saves()
             self.directory_manager.rename_car_dir(car, legacy_car_info_path)
         else:
-            self.directory_manager.update_car_directory(car)
+            self._save_car_directory(car)
+
+        self.event_bus.emit(ItemEvent.updated, car)
 
+        if 'mileage' in updated_data.keys():
+            self.event_bus.emit_many(ItemEvent.due,
+                                     self.mileage_triggers.get_crossed(car, old_mileage, car.car_info.mileage))
+
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def update_component_or_collection(self, parent_car: Car, item, updated_data: dict[str, ...]):
-        self.directory_manager.remove_item(item)
+        """Update values of a collection or component and update the save files.\n
+        Files of items with an id don't depend on names, so a rename rewrites only the item file
+        and a reparent within the same car only the item file and both parent collection files."""
+        self.flush_saves()
+        suffix = self.directory_manager.data_manager.suffix
+        old_path = item.get_target_path(suffix)
 
         item = self._reparent_item(updated_data, item) or item
 
-        if 'name' in updated_data.keys():
-            r = RenameAgent(item, updated_data['name'], self.directory_manager.data_manager)
+        # Files of items saved before stable ids are named after the item and its parent collection
+        if 'name' in updated_data.keys() and not item.id:
+            RenameAgent(item, updated_data['name'], self.directory_manager.data_manager)
 
         for key, value in updated_data.items():
             setattr(item, key, value)
 
-        self.directory_manager.update_car_directory(parent_car)
+        if item.get_target_path(suffix) != old_path and os.path.exists(old_path):
+            self.directory_manager.data_manager.delete_file_raw(str(old_path))
+
+        self._save_car_directory(parent_car)
+        self.event_bus.emit(ItemEvent.updated, item)
 
     def _reparent_item(self, data: dict, item_ref):
         if 'parent' in data.keys():
             match item_ref.__class__.__name__:
                 case 'ComponentCollection':
                     new_parent = data.get('parent')
+                    old_parent = item_ref.parent
 
                     new_parent.collections.append(item_ref)
-                    item_ref.parent.collections.remove(item_ref)
+                    old_parent.collections.remove(item_ref)
                     item_ref.parent = new_parent
                     item_ref.path = Path(new_parent.path).joinpath('collections')
 
-                    self._reparent_child_elements(item_ref)
+                    self._reparent_child_elements(item_ref, old_parent)
 
                     data.pop('parent')
 
@@ -268,33 +540,41 @@ class AppSession:
 
                     if car := data.get('car'):
                         self.directory_manager.data_manager.save_file(item_ref)
-                        self.directory_manager.update_car_directory(car)
+                        self._save_car_directory(car)
                         data.pop('car')
 
                     return item_ref
 
-    def _reparent_child_elements(self, item_ref):
+    def _reparent_child_elements(self, item_ref, old_car: Car):
+        """Move children along with reparented collection, only files whose path changed are moved,
+        references by id in the parent files stay valid."""
+        suffix = self.directory_manager.data_manager.suffix
+        nested_collections = [coll for coll in old_car.collections if coll.parent_collection is item_ref]
+        children = [(comp, item_ref) for comp in item_ref.components] + \
+                   [(coll, item_ref.car) for coll in nested_collections]
         to_del = []
-        for comp in item_ref.components:
-            to_del.append(comp.get_target_path(self.directory_manager.data_manager.suffix))
-            self._reparent_item({'parent': item_ref}, comp)
 
-        for coll in item_ref.collections:
-            to_del.append(coll.get_target_path(self.directory_manager.data_manager.suffix))
-            self._reparent_item({'parent': item_ref.car}, coll)
+        for child, new_parent in children:
+            old_path = child.get_target_path(suffix)
+            self._reparent_item({'parent': new_parent}, child)
+
+            if child.get_target_path(suffix) != old_path:
+                to_del.append(old_path)
 
-        for pa in to_del:
-            os.remove(pa)
+        for path in to_del:
+            if os.path.exists(path):
+                self.directory_manager.data_manager.delete_file_raw(str(path))
 
-        self.directory_manager.update_car_directory(item_ref.car)
+        if to_del:
+            self._save_car_directory(item_ref.car)
 
         return item_ref
 
+    @timed_operation(SESSION_SECONDS)
+    @traced('session')
     def update_entry(self, parent_car: Car, entry, updated_data: dict[str, ...]):
         """Update values of target entry and update the save file."""
-        for key, value in updated_data.items():
-            setattr(entry, key, value)
-
+        entry.component.update_entry(entry.id, updated_data)
         entry.clamp_custom_info_keys()
 
         if is_scheduled_entry(entry):
@@ -306,17 +586,31 @@ class AppSession:
         entry.component.refresh_parts()
 
         path = entry.component.get_target_path(self.directory_manager.data_manager.suffix)
-        self.directory_manager.data_manager.save_file(entry.component, path)
+        self._save_item_file(entry.component, path)
+        self.event_bus.emit(ItemEvent.updated, entry)
 
     def set_scheduled_entry_as_done(self, parent_car: Car, entry: ScheduledLogEntry):
         """Update values of target entry and update the save file."""
-        repeated_entry = entry.component.mark_scheduled_entry_as_done(entry.id)
-        path = entry.component.get_target_path(self.directory_manager.data_manager.suffix)
-        self.directory_manager.data_manager.save_file(entry.component, path)
+        component = entry.component
+        repeated_entry = component.mark_scheduled_entry_as_done(entry.id)
+        path = component.get_target_path(self.directory_manager.data_manager.suffix)
+        self._save_item_file(component, path)
+
+        self.event_bus.emit(ItemEvent.created, component.latest_entry)
+
+        if repeated_entry:
+            self.event_bus.emit(ItemEvent.updated, repeated_entry)
+        else:
+            self.event_bus.emit(ItemEvent.deleted, entry)
+
         return repeated_entry
 
     def export_item_to_file(self, item, path, *values):
         check_file_extension_validity(path)
+
+        if isinstance(item, ComponentCollection):
+            item = FileData(item.to_portable_json())
+
         self.directory_manager.match_extension_to_filedata_manager(path).save_file(item, path, *values)
 
     def import_item_from_file(self, item_class_name: str, path, no_children=False, **parents):
@@ -331,13 +625,13 @@ class AppSession:
                     for coll in data['collections']:
                         new_car.create_collection(coll)
 
-                self.directory_manager.update_car_directory(new_car)
+                self._save_car_directory(new_car)
             case 'collection':
                 car_name = parents.get('car')
                 car = self.get_car_by_name(car_name)
                 data = self.directory_manager.data_manager.load_file(path)
-                self._collection_from_file(data, car, no_children=no_children)
-                self.directory_manager.update_car_directory(car)
+                self._collection_from_file(data, car, path, no_children=no_children)
+                self._save_car_directory(car)
             case 'component':
                 data = self.directory_manager.data_manager.load_file(path)
                 car_name = parents.get('car')
@@ -351,31 +645,59 @@ class AppSession:
                     return
 
                 if not no_children:
-                    for entry in data['log_entries']:
-                        new_comp.create_entry(entry)
+                    self._entries_from_file(data, new_comp)
+
+                self._save_car_directory(car)
 
-                    for entry in data['scheduled_log_entries']:
-                        new_comp.create_scheduled_entry(entry)
+    def _entries_from_file(self, data: dict, component: CarComponent):
+        for entry in data.get('log_entries', []):
+            component.create_entry(entry)
 
-                self.directory_manager.update_car_directory(car)
+        for entry in data.get('scheduled_log_entries', []):
+            component.create_scheduled_entry(entry)
+
+    def _collection_from_file(self, data: dict, car: Car, path, no_children=False,
+                              parent: ComponentCollection = None) -> ComponentCollection:
+        """Create collection from exported file data, with its components, their entries and nested collections
+        read from the files their references point to."""
+        if parent:
+            car.create_nested_collection(data['name'], parent.name)
+        else:
+            car.create_collection(data['name'])
 
-    def _collection_from_file(self, data: dict, car: Car, no_children=False):
-        car.create_collection(data['name'])
-        self.directory_manager.update_car_directory(car)
         collection = car.get_collection_by_name(data['name'])
+        collection.desc = data.get('desc', '')
+        collection.custom_info = data.get('custom_info', {})
 
-        for k in data.keys():
-            setattr(collection, k, data.get(k))
+        if no_children:
+            return collection
 
-        if not no_children:
-            comps = []
-            for comp in data['components']:
-                new_comp = CarComponent(**comp)
-                comps.append(new_comp)
-            setattr(collection, 'components', comps)
-        else:
-            setattr(collection, 'collections', [])
-            setattr(collection, 'components', [])
+        for ref in data.get('components', []):
+            if comp_data := self._load_referenced_file(ref, path, 'components'):
+                new_comp = collection.create_component(comp_data['name'], desc=comp_data.get('desc', ''),
+                                                       **comp_data.get('custom_info', {}))
+                if new_comp:
+                    self._entries_from_file(comp_data, new_comp)
+
+        for ref in data.get('collections', []):
+            if coll_data := self._load_referenced_file(ref, path, 'collections'):
+                self._collection_from_file(coll_data, car, ref.get('path') or path, parent=collection)
+
+        return collection
+
+    def _load_referenced_file(self, ref: dict, path, folder: str) -> dict | None:
+        """Load item referenced from an imported file. References by id alone are looked up in the car directory
+        holding the file, only the name is kept when the referenced file can't be read."""
+        ref_path = ref.get('path') or Path(path).parent.parent.joinpath(folder, f"{ref.get('id')}.json")
+
+        try:
+            return self.directory_manager.data_manager.load_file(ref_path)
+        except (OSError, ValueError):
+            if ref.get('name'):
+                return {'name': ref['name']}
+
+            Printer.print_msg(None, 'LOAD_FAIL', name=ref.get('id'), relation=path,
+                              reason="as the referenced file was not found")
 
     def get_car_by_name(self, car_name: str) -> Car:
         """Find car by name. If it's not found, attempt loading the car from save directory and check again."""
@@ -389,5 +711,6 @@ class AppSession:
         Loads directory only if the specified car wasn't requested prior, else find the car instance and return it"""
         car = self.directory_manager.load_car_dir(car_name)
         self.cars.append(car)
+        self._index_car(car)
         self.selected_car = car
         return car
@@ -0,0 +1,129 @@
+"""Lightweight tracing of nested operations, exportable as Chrome trace-event JSON."""
+
+import contextlib
+import functools
+import itertools
+import json
+import os
+import pathlib
+import threading
+import time
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    span_id: int
+    parent_id: int | None
+    thread_id: int
+    start: int
+    end: int = 0
+    args: dict = field(default_factory=dict)
+
+    @property
+    def duration(self) -> int:
+        """Duration in nanoseconds."""
+        return self.end - self.start
+
+    def to_trace_event(self, pid: int, origin: int) -> dict:
+        return {'name': self.name,
+                'cat': self.category,
+                'ph': 'X',
+                'ts': (self.start - origin) / 1000,
+                'dur': self.duration / 1000,
+                'pid': pid,
+                'tid': self.thread_id,
+                'args': {'span_id': self.span_id, 'parent_id': self.parent_id,
+                         **{key: str(value) for key, value in self.args.items()}}}
+
+
+class Tracer:
+    """Records spans of traced operations along with their parent span on the same thread.\n
+    Tracing is disabled by default, `span` and `traced` functions then cost a single attribute check."""
+    def __init__(self):
+        self.enabled = False
+        self.spans: list[Span] = []
+
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+    def span(self, name: str, category: str = '', **args):
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._record(name, category, args)
+
+    @contextlib.contextmanager
+    def _record(self, name: str, category: str, args: dict):
+        stack = self._get_stack()
+        span = Span(name, category, next(self._ids), stack[-1].span_id if stack else None, threading.get_ident(),
+                    time.perf_counter_ns(), args=args)
+        stack.append(span)
+
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter_ns()
+            stack.pop()
+
+            with self._lock:
+                self.spans.append(span)
+
+    def get_spans(self) -> list[Span]:
+        """Copy of recorded spans, the save worker thread may keep appending to them."""
+        with self._lock:
+            return list(self.spans)
+
+    def get_children(self, span: Span) -> list[Span]:
+        return [child for child in self.get_spans() if child.parent_id == span.span_id]
+
+    def to_chrome_trace(self) -> dict:
+        spans = sorted(self.get_spans(), key=lambda s: s.start)
+        origin = spans[0].start if spans else 0
+        pid = os.getpid()
+
+        return {'traceEvents': [span.to_trace_event(pid, origin) for span in spans], 'displayTimeUnit': 'ms'}
+
+    def dump(self, path: str | pathlib.Path):
+        """Write spans as Chrome trace-event JSON, viewable in chrome://tracing or Perfetto."""
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def _get_stack(self) -> list[Span]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+
+TRACER = Tracer()
+
+
+def traced(category: str):
+    """Decorator recording every call as a span named after the function's qualified name."""
+    def decorator(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+
+            with TRACER.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,8 @@
 """General utility functions"""
 import dataclasses
 import datetime
+import functools
+import math
 import os
 import pathlib
 import time
@@ -44,6 +46,11 @@ def get_all_required_fields(item_class) -> list[str]:
     return init_fields or []
 
 
+def create_item_id() -> str:
+    """Stable id of a collection or component, its save file is named after it so renaming never moves the file."""
+    return str(uuid.uuid4())
+
+
 def is_valid_entry_id(entry_id: str) -> bool:
     """Checks whether passed string is a valid entry id."""
     try:
@@ -111,6 +118,19 @@ def date_string_to_date(date: str) -> datetime.date:
     return datetime.date(year=date_tuple[2], month=date_tuple[1], day=date_tuple[0])
 
 
+@functools.lru_cache(maxsize=8192)
+def date_string_to_ordinal(date: str) -> int:
+    """Return proleptic Gregorian ordinal of a date string, results are memoized as the same dates repeat a lot."""
+    return date_string_to_date(date).toordinal()
+
+
+@functools.lru_cache(maxsize=8192)
+def ordinal_to_date_string(ordinal: int) -> str:
+    """Return 'dd-mm-yyyy' date string of a proleptic Gregorian ordinal."""
+    date = datetime.date.fromordinal(ordinal)
+    return format_tuple_to_date_string((date.day, date.month, date.year))
+
+
 def is_date(date: str) -> bool:
     """NOTE: this is a soft check, it only checks whether passed string is a date of 'xx-xx-xxxx' format,
     it does NOT check for validity of day, month and year numbers!"""
@@ -146,3 +166,11 @@ def date_n_days_from_now(days: int) -> str:
     new_date = date_today - datetime.timedelta(days=days * -1)
     new_date = (new_date.day, new_date.month, new_date.year)
     return format_tuple_to_date_string(new_date)
+
+
+def add_days_clamped(date: datetime.date, days: float) -> datetime.date:
+    """Return date 'days' (rounded up) after given date, clamped to date.max when it can't be represented."""
+    try:
+        return date + datetime.timedelta(days=math.ceil(days))
+    except OverflowError:
+        return datetime.date.max
@@ -1,7 +1,7 @@
 import pytest
 
 from carlogger.cli.arg_executor import ReadArgExecutor, AddArgExecutor
-from carlogger.cli.arg_parser import ArgParser
+from carlogger.cli.arg_parser import ArgParser, strip_global_options
 from carlogger.session import AppSession
 
 
@@ -18,13 +18,29 @@ def test_parses_args_to_parse():
 @pytest.mark.parametrize("args, expected", [
     (['read'], 'read'),
     (['add'], 'add'),
-    (['add', 'read'], 'add')
+    (['add', 'read'], 'add'),
+    (['carlogger', 'index', 'add', 'entry', 'cost'], 'index'),
+    (['carlogger', 'forecast', '--within', '30d'], 'forecast'),
+    (['carlogger', 'codec', 'marshal'], 'codec'),
+    (['carlogger', 'search', 'add'], 'search'),
+    (['carlogger', 'search', 'export', 'read'], 'search'),
+    (['carlogger', 'due', '--car', 'delete'], 'due')
 ])
 def test_get_subparser_type(args, expected):
     parser = ArgParser()
     assert parser.get_subparser_type(args) == expected
 
 
+@pytest.mark.parametrize("args, expected", [
+    (['carlogger', '--profile', 'read', 'car'], ['carlogger', 'read', 'car']),
+    (['carlogger', '--profile-output', 'out.prof', 'due'], ['carlogger', 'due']),
+    (['carlogger', '--profile-output=out.json', 'due'], ['carlogger', 'due']),
+    (['carlogger', '--trace', 'trace.json', '--timings', 'index', 'list'], ['carlogger', 'index', 'list'])
+])
+def test_strip_global_options(args, expected):
+    assert strip_global_options(args) == expected
+
+
 @pytest.mark.parametrize("args, expected", [
     (['', 'add', 'car', '--name', 'CarTestPytest', '--manufacturer', 'Skoda', '--model', 'Roomster', '--year', '2002',
       '--mileage', '198000'], AddArgExecutor)
@@ -0,0 +1,52 @@
+from carlogger.serialization import CODECS
+
+from benchmarks.codec_comparison import compare_codecs
+from benchmarks.fleet_generator import FleetSpec, generate_fleet
+from benchmarks.runner import Timing, compare_results, run_benchmarks
+
+SPEC = FleetSpec(cars=2, collections=2, collection_depth=2, components=2, entries=3)
+
+
+def test_generated_fleet_is_deterministic(tmp_path):
+    """Saved files hold absolute paths, so they are compared relative to their save directory."""
+    def read_files(save_dir):
+        generate_fleet(SPEC, save_dir)
+        return {path.relative_to(save_dir): path.read_text().replace(str(save_dir), '')
+                for path in save_dir.rglob('*.json')}
+
+    assert read_files(tmp_path / 'first') == read_files(tmp_path / 'second')
+
+
+def test_generated_fleet_loads_back(tmp_path, directory_manager):
+    generate_fleet(SPEC, tmp_path)
+    directory_manager.car_save_dir = tmp_path
+
+    cars = directory_manager.load_all_car_dir()
+
+    assert len(cars) == SPEC.cars
+    assert sum(len(car.get_all_entry_logs()) for car in cars) == SPEC.get_entry_count()
+
+
+def test_compare_flags_slower_cases():
+    baseline = {('small', 'load'): Timing('small', 'load', 0.01, 0.01, 0.01, 5),
+                ('small', 'sort'): Timing('small', 'sort', 0.01, 0.01, 0.01, 5)}
+    current = {('small', 'load'): Timing('small', 'load', 0.02, 0.02, 0.02, 5),
+               ('small', 'sort'): Timing('small', 'sort', 0.011, 0.011, 0.011, 5),
+               ('small', 'new'): Timing('small', 'new', 1, 1, 1, 5)}
+
+    regressions = compare_results(baseline, current, threshold=0.25)
+
+    assert [regression.current.case for regression in regressions] == ['load']
+
+
+def test_run_benchmarks_reports_every_case():
+    results = run_benchmarks({'tiny': SPEC}, ['load_all_car_dir', 'sort_entries_latest'], repeat=1)
+    assert [(r['scale'], r['case']) for r in results['results']] == [('tiny', 'load_all_car_dir'),
+                                                                       ('tiny', 'sort_entries_latest')]
+
+
+def test_codec_comparison_covers_every_codec():
+    results = compare_codecs(SPEC, repeat=1)
+
+    assert [result.codec for result in results] == list(CODECS)
+    assert all(result.size > 0 for result in results)
@@ -20,6 +20,16 @@ def test_log_entry_is_removed_successfully(mock_log_entry):
     assert len(c.log_entries) < 1
 
 
+def test_log_entries_are_removed_in_bulk(mock_log_entry):
+    c = CarComponent("Coolant")
+    entry_ids = [c.create_entry(mock_log_entry) for _ in range(3)]
+
+    deleted = c.delete_entries_by_id(entry_ids[:2])
+
+    assert [entry.id for entry in deleted] == entry_ids[:2]
+    assert [entry.id for entry in c.log_entries] == entry_ids[2:]
+
+
 def test_latest_mileage_is_updated_on_entry_add(mock_log_entry):
     c = CarComponent("Coolant")
     c.create_entry(mock_log_entry)
@@ -0,0 +1,78 @@
+import pytest
+
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.items.custom_info_index import CustomInfoIndexes, IndexDefinition
+from carlogger.items.item_filter import ItemFilter
+
+
+@pytest.fixture
+def priced_car(mock_car_full, mock_log_entry):
+    comp = mock_car_full.get_all_components()[0]
+
+    for cost, shop in [('120', 'AutoFix'), ('35.5', 'AutoFix'), ('480', 'Dealer'), ('n/a', 'Dealer')]:
+        comp.create_entry({**mock_log_entry, 'custom_info': {'cost': cost, 'shop': shop}})
+
+    return mock_car_full
+
+
+@pytest.fixture
+def indexes(priced_car) -> CustomInfoIndexes:
+    indexes = CustomInfoIndexes([IndexDefinition('entry', 'cost', numeric=True), IndexDefinition('entry', 'shop')])
+    indexes.build([priced_car])
+    return indexes
+
+
+@pytest.mark.parametrize('filters,expected',
+                         [(["cost=120"], ['120']),
+                          (["cost>100"], ['120', '480']),
+                          (["cost<=120"], ['120', '35.5']),
+                          (["cost=100 500"], ['120', '480']),
+                          (["cost in (35.5, 480)"], ['35.5', '480']),
+                          (["shop=Dealer", "cost>=0"], ['480']),
+                          (["shop in (AutoFix)"], ['120', '35.5'])])
+def test_indexed_filters(priced_car, indexes, filters, expected):
+    items = ItemFilter(indexes).filter_items(priced_car.get_all_entry_logs(), filters)
+    assert sorted(item.custom_info['cost'] for item in items) == sorted(expected)
+
+
+def test_indexed_and_scanned_filters_are_combined(priced_car, indexes):
+    items = ItemFilter(indexes).filter_items(priced_car.get_all_entry_logs(), ["cost>100", "mileage=1404"])
+    assert len(items) == 2
+
+
+def test_unregistered_items_fall_back_to_scan(priced_car, mock_component, indexes):
+    items = ItemFilter(indexes).filter_items(mock_component.log_entries, ["cost>100"])
+    assert items == []
+
+
+def test_declared_index_is_filled_with_registered_items(priced_car):
+    indexes = CustomInfoIndexes()
+    indexes.build([priced_car])
+
+    assert indexes.find('entry', 'cost', '>', '100') is None
+
+    indexes.declare(IndexDefinition('entry', 'Cost', numeric=True))
+    assert len(indexes.find('entry', 'cost', '>', '100')) == 2
+
+
+def test_index_follows_item_events(priced_car):
+    event_bus = EventBus()
+    indexes = CustomInfoIndexes([IndexDefinition('entry', 'cost', numeric=True)], event_bus)
+    indexes.build([priced_car])
+    entry = ItemFilter(indexes).filter_items(priced_car.get_all_entry_logs(), ["cost=480"])[0]
+
+    entry.custom_info['cost'] = '10'
+    event_bus.emit(ItemEvent.updated, entry)
+    assert indexes.find('entry', 'cost', '<', '20') == {id(entry)}
+
+    event_bus.emit(ItemEvent.deleted, entry)
+    assert indexes.find('entry', 'cost', '<', '20') == set()
+
+
+def test_index_definitions_are_saved(tmp_path, directory_manager):
+    directory_manager.car_save_dir = tmp_path
+    indexes = CustomInfoIndexes([IndexDefinition('entry', 'cost', numeric=True)])
+
+    directory_manager.save_index_definitions(indexes)
+
+    assert directory_manager.load_index_definitions() == [IndexDefinition('entry', 'cost', numeric=True)]
@@ -1,6 +1,8 @@
 import pathlib
 import shutil
 
+from carlogger.metrics import FILE_WRITES
+
 
 def test_new_directory_on_car_added(mock_car_directory):
     assert pathlib.Path(mock_car_directory['car_dir']).exists()
@@ -13,3 +15,34 @@ def test_car_directory_removed(mock_car_directory, directory_manager):
 
 def test_car_directory_info_file_is_created(mock_car_directory):
     assert pathlib.Path(mock_car_directory['info_path']).exists()
+
+
+def test_unchanged_car_save_skips_all_files(mock_car, tmp_path, directory_manager):
+    directory_manager.car_save_dir = tmp_path
+    mock_car.path = tmp_path.joinpath(mock_car.car_info.name)
+    directory_manager.create_car_directory(mock_car)
+    directory_manager.update_car_directory(mock_car)
+
+    directory_manager.update_car_directory(mock_car)
+
+    assert directory_manager.last_save_report.written == 0
+    assert directory_manager.last_save_report.skipped > 0
+    assert directory_manager.save_report.saves == 2
+
+
+def test_save_report_ignores_writes_of_other_threads(mock_car, tmp_path, directory_manager, monkeypatch):
+    directory_manager.car_save_dir = tmp_path
+    mock_car.path = tmp_path.joinpath(mock_car.car_info.name)
+    directory_manager.create_car_directory(mock_car)
+    directory_manager.update_car_directory(mock_car)
+
+    save_file = directory_manager.data_manager.save_file
+
+    def save_file_while_another_thread_writes(*args):
+        FILE_WRITES.inc(format='json')
+        return save_file(*args)
+
+    monkeypatch.setattr(directory_manager.data_manager, 'save_file', save_file_while_another_thread_writes)
+    directory_manager.update_car_directory(mock_car)
+
+    assert directory_manager.last_save_report.written == 0
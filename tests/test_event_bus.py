@@ -0,0 +1,63 @@
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.session import AppSession
+
+
+def test_subscriber_receives_only_chosen_events():
+    received = []
+    event_bus = EventBus()
+    event_bus.subscribe(lambda event, item: received.append((event, item)), ItemEvent.deleted)
+
+    event_bus.emit(ItemEvent.created, 'a')
+    event_bus.emit(ItemEvent.deleted, 'b')
+
+    assert received == [(ItemEvent.deleted, 'b')]
+
+
+def test_unsubscribed_callback_is_not_called():
+    received = []
+    event_bus = EventBus()
+
+    def callback(event, item):
+        received.append(item)
+
+    event_bus.subscribe(callback)
+    event_bus.unsubscribe(callback)
+    event_bus.emit(ItemEvent.updated, 'a')
+
+    assert received == []
+
+
+def test_batch_subscriber_receives_items_at_once():
+    received = []
+    batches = []
+    event_bus = EventBus()
+    event_bus.subscribe(lambda event, item: received.append(item), ItemEvent.deleted)
+    event_bus.subscribe_batch(lambda event, items: batches.append(items), ItemEvent.deleted)
+
+    event_bus.emit_many(ItemEvent.deleted, ['a', 'b', 'c'])
+    event_bus.emit(ItemEvent.deleted, 'd')
+    event_bus.emit_many(ItemEvent.deleted, [])
+
+    assert received == ['a', 'b', 'c', 'd']
+    assert batches == [['a', 'b', 'c'], ['d']]
+
+
+def test_session_emits_entry_events(directory_manager, mock_car_directory, tmp_path, mock_log_entry):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    received = []
+    session.event_bus.subscribe(lambda event, item: received.append((event, item)))
+
+    session.add_new_collection(car_name, 'Engine')
+    session.add_new_component(car_name, 'Engine', 'SparkPlug')
+    session.add_new_entry(car_name, 'Engine', 'SparkPlug', mock_log_entry)
+
+    entry = session.selected_car.get_component_by_name('SparkPlug').log_entries[0]
+    session.delete_entry_by_id(car_name, entry.id)
+
+    assert (ItemEvent.created, entry) in received
+    assert received[-1] == (ItemEvent.deleted, entry)
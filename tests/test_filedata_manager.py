@@ -1,6 +1,9 @@
 import os
 
-from carlogger.filedata_manager import JSONFiledataManager
+import pytest
+
+from carlogger import filedata_manager
+from carlogger.filedata_manager import JSONFiledataManager, Durability, is_temp_file
 
 
 def test_saves_entry_data_as_json(mock_component, tmp_path):
@@ -45,3 +48,69 @@ def test_save_and_load_collection_json(mock_component_collection, tmp_path):
     loaded_data = saver.load_file(f"{tmp_path}/{filename}")
 
     assert data == loaded_data
+
+
+def test_failed_save_keeps_previous_file(mock_component_clean, tmp_path, monkeypatch):
+    filename = mock_component_clean.name + ".json"
+    saver = JSONFiledataManager()
+    saver.save_file(mock_component_clean, f"{tmp_path}/{filename}")
+    content = (tmp_path / filename).read_text()
+
+    def fail_write(file):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(saver, '_count_write', fail_write)
+    mock_component_clean.desc = "changed"
+
+    with pytest.raises(OSError):
+        saver.save_file(mock_component_clean, f"{tmp_path}/{filename}")
+
+    assert (tmp_path / filename).read_text() == content
+    assert os.listdir(tmp_path) == [filename]
+
+
+@pytest.mark.parametrize("durability, file_syncs, dir_syncs", [
+    (Durability.NONE, 0, 0),
+    (Durability.BATCH, 2, 1),
+    (Durability.FILE, 2, 2)
+])
+def test_durability_levels(durability, file_syncs, dir_syncs, mock_component_collection, mock_component_clean,
+                           tmp_path, monkeypatch):
+    synced_dirs = []
+    fsync = os.fsync
+    fsync_calls = []
+    monkeypatch.setattr(filedata_manager, 'fsync_directory', synced_dirs.append)
+    monkeypatch.setattr(os, 'fsync', lambda fd: fsync_calls.append(fd) or fsync(fd))
+
+    saver = JSONFiledataManager(durability)
+
+    with saver.batch():
+        saver.save_file(mock_component_collection, tmp_path / "collection.json")
+        saver.save_file(mock_component_clean, tmp_path / "component.json")
+
+    assert len(fsync_calls) == file_syncs
+    assert len(synced_dirs) == dir_syncs
+    assert sorted(os.listdir(tmp_path)) == ["collection.json", "component.json"]
+
+
+@pytest.mark.parametrize("path, expected", [
+    (".Engine.json.123.456.tmp", True),
+    ("Engine.json", False),
+    ("Engine.tmp", False)
+])
+def test_is_temp_file(path, expected):
+    assert is_temp_file(path) == expected
+
+
+def test_unchanged_content_is_not_rewritten(mock_component_clean, tmp_path):
+    path = tmp_path / (mock_component_clean.name + ".json")
+    saver = JSONFiledataManager()
+    saver.save_file(mock_component_clean, path)
+    modified = path.stat().st_mtime_ns
+
+    saver.save_file(mock_component_clean, path)
+    assert path.stat().st_mtime_ns == modified
+
+    path.write_text("{}")
+    saver.save_file(mock_component_clean, path)
+    assert saver.load_file(path) == mock_component_clean.to_json()
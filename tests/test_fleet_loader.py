@@ -0,0 +1,28 @@
+from carlogger.fleet_loader import FleetLoader, LoadEvent
+
+
+def test_catalog_is_loaded_without_details(directory_manager, mock_car_directory):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    car.create_collection('Engine')
+    directory_manager.update_car_directory(car)
+
+    catalog = directory_manager.load_car_catalog()
+
+    assert [c.car_info.name for c in catalog] == [car.car_info.name]
+    assert catalog[0].collections == []
+
+    directory_manager.load_car_details(catalog[0])
+
+    assert catalog[0].get_collection_by_name('Engine')
+
+
+def test_loader_reports_catalog_then_each_car(directory_manager, mock_car_directory):
+    fleet_loader = FleetLoader(directory_manager)
+    fleet_loader.start()
+    fleet_loader.join()
+
+    events = [event for event, payload in fleet_loader.poll()]
+
+    assert events == [LoadEvent.CATALOG, LoadEvent.CAR_LOADED, LoadEvent.FINISHED]
+    assert fleet_loader.loaded == fleet_loader.total == 1
+    assert fleet_loader.poll() == []
@@ -0,0 +1,101 @@
+import datetime
+
+import pytest
+
+from carlogger.const import TODAY
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.forecast import MileageForecaster, fit_mileage_velocity, parse_duration
+from carlogger.util import date_n_days_from_now, date_string_to_date
+
+
+def create_reading(component, days_ago: int, mileage: int):
+    entry_data = {'desc': 'refuel', 'date': date_n_days_from_now(-days_ago), 'mileage': mileage,
+                  'category': 'check', 'tags': []}
+    return component.get_entry_by_id(component.create_entry(entry_data))
+
+
+def create_scheduled_entry(component, desc: str, rule: str, frequency: int):
+    entry_data = {'desc': desc, 'date': '', 'mileage': 0, 'category': 'check', 'tags': [],
+                  'repeating': False, 'rule': rule, 'frequency': frequency}
+    return component.get_entry_by_id(component.create_scheduled_entry(entry_data))
+
+
+@pytest.fixture
+def component(mock_car_full):
+    component = mock_car_full.get_all_components()[0]
+    component.log_entries.clear()
+    component.scheduled_log_entries.clear()
+    component.current_mileage = 10000
+    return component
+
+
+@pytest.fixture
+def driven_car(mock_car_full, component):
+    """Car driving 50 km a day for the past 20 days."""
+    for days_ago in (20, 10, 0):
+        create_reading(component, days_ago, 10000 - days_ago * 50)
+    return mock_car_full
+
+
+def test_fit_mileage_velocity():
+    assert fit_mileage_velocity([(0, 100), (10, 600), (20, 1100)]) == 50
+    assert fit_mileage_velocity([(0, 100)]) is None
+    assert fit_mileage_velocity([(5, 100), (5, 200)]) is None
+    assert fit_mileage_velocity([(0, 500), (10, 100)]) is None
+
+
+@pytest.mark.parametrize('duration,expected', [('30d', 30), ('30', 30), ('2w', 14), ('1y', 365)])
+def test_parse_duration(duration, expected):
+    assert parse_duration(duration) == expected
+
+
+def test_parse_invalid_duration():
+    with pytest.raises(ValueError):
+        parse_duration('soon')
+
+
+def test_projected_due_date_of_mileage_entry(driven_car, component):
+    entry = create_scheduled_entry(component, 'oil', 'mileage', 500)
+    today = date_string_to_date(TODAY)
+
+    assert entry.get_projected_due_date(50) == today + datetime.timedelta(days=10)
+    assert entry.get_projected_due_date(None) is None
+    assert MileageForecaster().get_projected_due_date(entry) == today + datetime.timedelta(days=10)
+
+
+@pytest.mark.parametrize('velocity', [1e-5, 1e-300, 5e-324])
+def test_projected_due_date_with_near_zero_velocity(component, velocity):
+    entry = create_scheduled_entry(component, 'oil', 'mileage', 500)
+
+    assert entry.get_projected_due_date(velocity) == datetime.date.max
+
+
+def test_forecast_ranks_entries_by_projected_date(driven_car, component):
+    create_scheduled_entry(component, 'oil', 'mileage', 500)
+    create_scheduled_entry(component, 'wipers', 'date', 5)
+    create_scheduled_entry(component, 'belt', 'mileage', 5000)
+
+    forecast = MileageForecaster().get_forecast([driven_car], within_days=30)
+
+    assert [(f.entry.desc, f.days) for f in forecast.entries] == [('wipers', 5), ('oil', 10)]
+    assert forecast.unknown == []
+
+
+def test_entries_of_car_without_history_are_unknown(mock_car_full, component):
+    entry = create_scheduled_entry(component, 'oil', 'mileage', 500)
+    forecast = MileageForecaster().get_forecast([mock_car_full])
+
+    assert forecast.entries == []
+    assert forecast.unknown == [entry]
+
+
+def test_velocity_is_cached_until_new_entries_arrive(driven_car, component):
+    event_bus = EventBus()
+    forecaster = MileageForecaster(event_bus)
+    assert forecaster.get_velocity(driven_car) == 50
+
+    entry = create_reading(component, -10, 12000)
+    assert forecaster.get_velocity(driven_car) == 50
+
+    event_bus.emit(ItemEvent.created, entry)
+    assert forecaster.get_velocity(driven_car) > 50
@@ -0,0 +1,51 @@
+import os
+
+from PIL import Image
+
+from carlogger.gui.image_cache import ImageCache
+
+
+def create_image(path, size=(800, 600)):
+    Image.new('RGB', size, 'red').save(path)
+    return path
+
+
+def test_image_is_decoded_once_and_thumbnailed(tmp_path):
+    path = create_image(tmp_path.joinpath('car.png'))
+    image_cache = ImageCache(thumbnail_dir=tmp_path.joinpath('thumbnails'))
+
+    first = image_cache.get(path)
+    second = image_cache.get(path)
+
+    assert first is second
+    assert image_cache.hits == 1 and image_cache.misses == 1
+    assert max(first.cget('light_image').size) <= 165
+    assert len(os.listdir(tmp_path.joinpath('thumbnails'))) == 1
+
+
+def test_changed_file_is_not_served_from_cache(tmp_path):
+    path = create_image(tmp_path.joinpath('car.png'))
+    image_cache = ImageCache(thumbnail_dir=tmp_path.joinpath('thumbnails'))
+
+    first = image_cache.get(path)
+    create_image(path, size=(400, 400))
+    os.utime(path, ns=(0, 0))
+
+    assert image_cache.get(path) is not first
+
+
+def test_least_recently_used_images_are_evicted(tmp_path):
+    paths = [create_image(tmp_path.joinpath(f'{i}.png')) for i in range(3)]
+    image_cache = ImageCache(memory_budget=165 * 124 * 3 * 2, thumbnail_dir=tmp_path.joinpath('thumbnails'))
+
+    for path in paths:
+        image_cache.get(path)
+
+    assert len(image_cache) == 2
+    assert image_cache.memory_used <= image_cache.memory_budget
+
+
+def test_unreadable_image_returns_none(tmp_path):
+    image_cache = ImageCache(thumbnail_dir=tmp_path.joinpath('thumbnails'))
+
+    assert image_cache.get(tmp_path.joinpath('missing.png')) is None
@@ -1,5 +1,6 @@
 from carlogger.items.car import Car
 from carlogger.items.item_sorter import ItemSorter
+from carlogger.items.log_entry import get_time_remaining_batch
 from carlogger.items.car_info import CarInfo
 
 
@@ -65,3 +66,17 @@ def test_returns_valid_sort_method(mock_car_dict_list):
     item_sorter = ItemSorter(cars, sort_method='latest')
 
     assert item_sorter._get_sort_method() == item_sorter.sort_by_latest_entry
+
+
+def test_scheduled_entries_are_sorted_by_time_remaining(mock_car_full):
+    component = mock_car_full.get_all_components()[0]
+    entry_data = {'desc': '', 'date': '', 'mileage': 0, 'category': 'check', 'tags': [], 'repeating': False}
+    component.create_scheduled_entry({**entry_data, 'rule': 'date', 'frequency': 30})
+    component.create_scheduled_entry({**entry_data, 'rule': 'mileage', 'frequency': 5})
+    component.create_scheduled_entry({**entry_data, 'rule': 'date', 'frequency': 10})
+    entries = component.scheduled_log_entries
+
+    sorted_entries = ItemSorter(entries, 'time_remaining').get_sorted_list()
+
+    assert get_time_remaining_batch(entries) == [entry.get_time_remaining() for entry in entries]
+    assert [entry.get_time_remaining() for entry in sorted_entries] == sorted(get_time_remaining_batch(entries))
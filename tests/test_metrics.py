@@ -0,0 +1,58 @@
+import threading
+
+from carlogger.metrics import MetricsRegistry, METRICS, FILE_READS, FILE_WRITES, FILES_PER_CAR_SAVE
+
+
+def test_counter_and_histogram_are_exported():
+    registry = MetricsRegistry()
+    reads = registry.counter('reads_total', "Files read.")
+    decode = registry.histogram('decode_seconds', "Decode time.", buckets=(0.1, 1.0))
+
+    reads.inc(format='json')
+    reads.inc(2, format='json')
+    decode.observe(0.05, format='json')
+    decode.observe(0.5, format='json')
+
+    prometheus = registry.to_prometheus()
+
+    assert 'reads_total{format="json"} 3' in prometheus
+    assert 'decode_seconds_bucket{format="json",le="0.1"} 1' in prometheus
+    assert 'decode_seconds_bucket{format="json",le="+Inf"} 2' in prometheus
+    assert 'decode_seconds_count{format="json"} 2' in prometheus
+
+
+def test_file_io_is_counted(mock_car, tmp_path, directory_manager):
+    directory_manager.car_save_dir = tmp_path
+    mock_car.path = tmp_path.joinpath(mock_car.car_info.name)
+    METRICS.reset()
+
+    directory_manager.create_car_directory(mock_car)
+    directory_manager.update_car_directory(mock_car)
+    directory_manager.load_car_dir(mock_car.car_info.name)
+
+    assert FILE_WRITES.get(format='json') == 2
+    assert FILE_READS.get(format='json') == 1
+    assert FILES_PER_CAR_SAVE.get().count == 1
+    assert 'carlogger_file_read_bytes_total' in METRICS.get_summary()
+
+
+def test_metrics_updated_from_several_threads_lose_nothing():
+    registry = MetricsRegistry()
+    writes = registry.counter('writes_total', "Files written.")
+    encode = registry.histogram('encode_seconds', "Encode time.")
+
+    def record():
+        for _ in range(2000):
+            writes.inc(format='json')
+            encode.observe(0.001, format='json')
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert writes.get(format='json') == 8000
+    assert encode.get(format='json').count == 8000
@@ -0,0 +1,128 @@
+import datetime
+import json
+import shutil
+
+import pytest
+
+from carlogger.directory_manager import DirectoryManager
+from carlogger.filedata_manager import JSONFiledataManager
+from carlogger.migrations import Migrator, OrdinalDatesMigration, StableIdsMigration
+from carlogger.serialization import FORMAT_VERSION, LEGACY_FORMAT_VERSION, encode_layout, decode_layout
+
+from benchmarks.fleet_generator import FleetSpec, generate_fleet
+
+SPEC = FleetSpec(cars=3, collections=1, components=2, entries=3)
+
+
+@pytest.fixture
+def save_dir(tmp_path):
+    """Fleet saved the way it was before stable ids, with files named after items."""
+    generate_fleet(SPEC, tmp_path)
+    directory_manager = DirectoryManager(JSONFiledataManager(), tmp_path)
+
+    for car in directory_manager.load_all_car_dir():
+        for path in car.path.glob('c*/*'):
+            path.unlink()
+
+        for collection in car.collections:
+            for item in collection.collections + collection.components + [collection]:
+                item.id = ''
+
+        directory_manager.update_car_directory(car)
+
+    return tmp_path
+
+
+def get_entry_dates(save_dir) -> list[str]:
+    cars = DirectoryManager(JSONFiledataManager(), save_dir).load_all_car_dir()
+    return sorted(entry.date for car in cars for entry in car.get_all_entry_logs(include_scheduled=True))
+
+
+def test_layout_round_trip():
+    data = {'log_entries': [{'date': '05-03-2024'}], 'scheduled_log_entries': [{'date': ''}]}
+    encoded = encode_layout(data, 2)
+
+    assert encoded['log_entries'][0]['date'] == datetime.date(2024, 3, 5).toordinal()
+    assert encoded['scheduled_log_entries'][0]['date'] == ''
+    assert decode_layout(encoded) == data
+    assert encode_layout(data, LEGACY_FORMAT_VERSION) is data
+
+
+def test_migration_stores_ordinal_dates(save_dir):
+    dates = get_entry_dates(save_dir)
+    directory_manager = DirectoryManager(JSONFiledataManager(), save_dir)
+
+    migrated = Migrator(directory_manager).run()
+
+    assert [migration.version for migration in migrated] == [OrdinalDatesMigration.version, FORMAT_VERSION]
+    assert DirectoryManager(JSONFiledataManager(), save_dir).load_save_format().version == FORMAT_VERSION
+    assert not (save_dir / 'migration.json').exists()
+    assert all(type(entry['date']) is int
+               for path in save_dir.glob('*/components/*.json')
+               for entry in json.loads(path.read_text())['log_entries'])
+    assert get_entry_dates(save_dir) == dates
+    assert Migrator(directory_manager).get_pending() == []
+
+
+def test_interrupted_migration_resumes(save_dir):
+    class FailingMigration(OrdinalDatesMigration):
+        def __init__(self):
+            self.migrated = []
+
+        def migrate_car(self, car_dir, data_manager):
+            if len(self.migrated) == 1:
+                raise OSError("Disk unplugged")
+
+            self.migrated.append(car_dir.name)
+            super().migrate_car(car_dir, data_manager)
+
+    failing = FailingMigration()
+    directory_manager = DirectoryManager(JSONFiledataManager(), save_dir)
+
+    with pytest.raises(OSError):
+        Migrator(directory_manager, [failing]).run()
+
+    assert directory_manager.load_save_format().version == LEGACY_FORMAT_VERSION
+    assert Migrator(directory_manager).load_state()['done'] == failing.migrated
+
+    resumed = []
+    Migrator(directory_manager, [OrdinalDatesMigration()]).run(lambda progress: resumed.append(progress.car_name))
+
+    assert sorted(failing.migrated + resumed) == sorted(car.car_info.name for car in
+                                                        directory_manager.load_all_car_dir())
+    assert directory_manager.load_save_format().version == OrdinalDatesMigration.version
+
+
+def get_structure(save_dir) -> list[tuple]:
+    cars = DirectoryManager(JSONFiledataManager(), save_dir).load_all_car_dir()
+    return sorted((car.car_info.name, coll.name, getattr(coll.parent_collection, 'name', ''),
+                   tuple(sorted(comp.name for comp in coll.components)),
+                   tuple(sorted(nested.name for nested in coll.collections)))
+                  for car in cars for coll in car.collections)
+
+
+def test_migration_names_files_after_ids(save_dir):
+    structure = get_structure(save_dir)
+    dates = get_entry_dates(save_dir)
+
+    Migrator(DirectoryManager(JSONFiledataManager(), save_dir)).run()
+
+    for path in save_dir.glob('*/c*/*.json'):
+        assert json.loads(path.read_text())['id'] == path.stem
+
+    assert get_structure(save_dir) == structure
+    assert get_entry_dates(save_dir) == dates
+
+
+def test_stable_ids_migration_can_run_again(save_dir, tmp_path_factory):
+    car_dir = next(path for path in save_dir.iterdir() if path.is_dir())
+    legacy_dir = shutil.copytree(car_dir, tmp_path_factory.mktemp('legacy') / car_dir.name)
+
+    StableIdsMigration().migrate_car(car_dir, JSONFiledataManager())
+    migrated = {path: path.read_bytes() for path in car_dir.glob('c*/*.json')}
+
+    # Interrupted before any legacy file was removed
+    shutil.copytree(legacy_dir, car_dir, dirs_exist_ok=True)
+    StableIdsMigration().migrate_car(car_dir, JSONFiledataManager())
+
+    assert {path: path.read_bytes() for path in car_dir.glob('c*/*.json')} == migrated
@@ -0,0 +1,72 @@
+import io
+
+import pytest
+
+from carlogger.odometer_ingest import OdometerIngest, OdometerReading, is_header, parse_reading
+from carlogger.session import AppSession
+
+
+@pytest.mark.parametrize('line,expected',
+                         [("ProjectCar,206000\n", OdometerReading('ProjectCar', 206000)),
+                          ('"Project, Car",206000.0,2024-01-01', OdometerReading('Project, Car', 206000)),
+                          ('{"car": "ProjectCar", "odometer": 206000}', OdometerReading('ProjectCar', 206000)),
+                          ("car,mileage", None),
+                          ('{"car": "ProjectCar"}', None),
+                          ("", None)])
+def test_parse_reading(line, expected):
+    assert parse_reading(line) == expected
+
+
+@pytest.mark.parametrize('line,expected', [("car,mileage", True), ('"Vehicle","Odometer",date\n', True),
+                                           ("ProjectCar,206000", False), ("broken", False), ("", False)])
+def test_is_header(line, expected):
+    assert is_header(line) == expected
+
+
+@pytest.fixture
+def session(directory_manager, mock_car_directory, tmp_path) -> AppSession:
+    directory_manager.car_save_dir = tmp_path
+    session = AppSession(directory_manager)
+    session.load_all_cars()
+    return session
+
+
+def test_readings_are_coalesced_into_one_update_per_car(session, monkeypatch):
+    saved_cars = []
+    monkeypatch.setattr(session, '_save_car_directory', saved_cars.append)
+    car = session.cars[0]
+    car.create_collection('Engine').create_component('Belt')
+
+    lines = ["car,mileage", "ProjectCar,205500", "ProjectCar,206000", "ProjectCar,205800", "Unknown,10", "broken"]
+    stats = OdometerIngest(session, window=60).run(io.StringIO('\n'.join(lines)))
+
+    assert car.car_info.mileage == 206000
+    assert car.get_all_components()[0].current_mileage == 206000
+    assert saved_cars == [car]
+    assert (stats.readings, stats.updated_cars, stats.unknown_cars, stats.malformed) == (4, 1, 1, 1)
+
+
+def test_lower_readings_are_ignored(session):
+    car = session.cars[0]
+    stats = OdometerIngest(session).run(io.StringIO(f"ProjectCar,{car.car_info.mileage - 100}\n"))
+
+    assert car.car_info.mileage == 205000
+    assert stats.ignored == 1
+
+
+def test_each_window_is_applied_separately(session, monkeypatch):
+    ingest = OdometerIngest(session, window=0)
+    updates = []
+    monkeypatch.setattr(session, 'update_car_info', lambda car, data: updates.append(data['mileage']))
+
+    for line in ["ProjectCar,205100", "ProjectCar,205200"]:
+        ingest.feed_line(line)
+
+    assert updates == [205100, 205200]
+
+
+def test_csv_header_is_not_counted_as_malformed(session):
+    lines = ["vehicle,odometer,date", "ProjectCar,206000,2024-01-01", "ProjectCar,oops,2024-01-02"]
+    stats = OdometerIngest(session).run(io.StringIO('\n'.join(lines)))
+
+    assert (stats.readings, stats.malformed) == (1, 1)
@@ -0,0 +1,72 @@
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.gui.c_pagecache import PageCache
+
+
+class FakePage:
+    def __init__(self):
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def test_page_is_reused_until_item_changes(mock_component):
+    event_bus = EventBus()
+    page_cache = PageCache(event_bus)
+    page = FakePage()
+    page_cache.put(mock_component, page)
+
+    assert page_cache.get(mock_component) is page
+
+    event_bus.emit(ItemEvent.updated, mock_component)
+
+    assert page_cache.get(mock_component) is None
+    assert page.destroyed
+
+
+def test_entry_change_invalidates_ancestor_pages(mock_component):
+    event_bus = EventBus()
+    page_cache = PageCache(event_bus)
+    collection = mock_component.parent
+    car = collection.car
+
+    for item in (mock_component, collection, car):
+        page_cache.put(item, FakePage())
+
+    event_bus.emit(ItemEvent.created, mock_component.log_entries[0])
+
+    assert all(page_cache.get(item) is None for item in (mock_component, collection, car))
+
+
+def test_least_recently_used_page_is_destroyed(mock_car_full):
+    page_cache = PageCache(max_pages=2)
+    collection = mock_car_full.collections[0]
+    component = collection.components[0]
+    pages = [FakePage() for _ in range(3)]
+
+    page_cache.put(mock_car_full, pages[0])
+    page_cache.put(collection, pages[1])
+    page_cache.get(mock_car_full)
+    page_cache.put(component, pages[2])
+
+    assert len(page_cache) == 2
+    assert pages[1].destroyed and not pages[0].destroyed
+
+
+def test_only_cached_pages_are_tracked(mock_car_full):
+    event_bus = EventBus()
+    page_cache = PageCache(event_bus, max_pages=1)
+    collection = mock_car_full.collections[0]
+    component = collection.components[0]
+
+    for entry in component.log_entries:
+        event_bus.emit(ItemEvent.deleted, entry)
+
+    assert page_cache._stale == set()
+
+    page_cache.put(component, FakePage())
+    event_bus.emit(ItemEvent.updated, component)
+    page_cache.put(collection, FakePage())
+
+    assert page_cache._stale == set()
+    assert page_cache.get(collection) is not None
@@ -0,0 +1,51 @@
+import json
+import pstats
+import time
+
+from carlogger.profiling import CommandProfiler, PhaseTimer
+
+
+def test_nested_phases_are_exclusive():
+    timer = PhaseTimer()
+
+    with timer.phase('execute'):
+        time.sleep(0.01)
+
+        with timer.phase('load'):
+            time.sleep(0.02)
+
+    assert timer.phases['load'] >= 0.02
+    assert 0.01 <= timer.phases['execute'] < 0.02
+
+
+def test_wrapped_method_runs_inside_phase():
+    class Loader:
+        def load(self, value):
+            return value * 2
+
+    loader = Loader()
+    timer = PhaseTimer()
+    timer.wrap(loader, 'load', 'load')
+
+    assert loader.load(2) == 4
+    assert 'load' in timer.phases
+
+
+def test_profiler_reports_and_dumps(tmp_path, directory_manager):
+    profiler = CommandProfiler()
+    profiler.instrument(directory_manager)
+    profiler.start()
+
+    with profiler.phase('execute'):
+        directory_manager.load_all_car_dir()
+
+    profiler.stop()
+
+    assert 'load' in profiler.timer.phases
+    assert 'peak memory' in profiler.get_report()
+
+    profiler.dump(tmp_path / 'profile.json')
+    profiler.dump(tmp_path / 'profile.prof')
+
+    assert set(json.loads((tmp_path / 'profile.json').read_text())['phases']) == {'execute', 'load'}
+    assert pstats.Stats(str(tmp_path / 'profile.prof')).total_calls > 0
@@ -0,0 +1,158 @@
+from carlogger import filedata_manager
+from carlogger.metrics import FILE_WRITES, FILE_WRITES_SKIPPED
+from carlogger.save_queue import SaveQueue, SaveStatus
+
+
+def test_pending_saves_are_written_on_flush(directory_manager, mock_car_directory, tmp_path):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    collection = car.create_collection('Engine')
+
+    save_queue = SaveQueue(directory_manager)
+    save_queue.request_save(car)
+    save_queue.request_save(car)
+
+    assert save_queue.status == SaveStatus.SAVING
+
+    save_queue.flush()
+
+    assert not save_queue.has_pending()
+    assert save_queue.status == SaveStatus.SAVED
+    assert collection.get_target_path('json').exists()
+
+
+def test_worker_writes_in_background_and_stop_flushes(directory_manager, mock_car_directory):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+
+    save_queue = SaveQueue(directory_manager, delay=0)
+    save_queue.start()
+
+    assert save_queue.is_running
+
+    collection = car.create_collection('Wheels')
+    save_queue.request_save(car)
+    save_queue.stop()
+
+    assert not save_queue.is_running
+    assert not save_queue.has_pending()
+    assert collection.get_target_path('json').exists()
+
+
+def test_discarded_car_is_not_written(directory_manager, mock_car_directory):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    car.create_collection('Body')
+
+    save_queue = SaveQueue(directory_manager)
+    save_queue.request_save(car)
+    save_queue.discard(car)
+    save_queue.flush()
+
+    assert not mock_car_directory['car_dir'].joinpath('collections', 'Body.json').exists()
+
+
+def test_failed_sync_is_reported(directory_manager, mock_car_directory, monkeypatch):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    car.create_collection('Brakes')
+
+    def fail_fsync(path):
+        raise OSError("Disk unplugged")
+
+    monkeypatch.setattr(filedata_manager, 'fsync_file', fail_fsync)
+
+    save_queue = SaveQueue(directory_manager)
+    save_queue.request_save(car)
+    save_queue.flush()
+
+    assert save_queue.status == SaveStatus.FAILED
+    assert str(save_queue.last_error) == "Disk unplugged"
+    assert directory_manager.data_manager._batch.written
+
+
+def test_failed_write_stays_pending_until_retried(directory_manager, mock_car_directory, monkeypatch):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    collection = car.create_collection('Brakes')
+
+    save_file = directory_manager.data_manager.save_file
+
+    def fail_once(*args):
+        monkeypatch.setattr(directory_manager.data_manager, 'save_file', save_file)
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(directory_manager.data_manager, 'save_file', fail_once)
+
+    save_queue = SaveQueue(directory_manager)
+    save_queue.request_save(car)
+    save_queue.flush()
+
+    assert save_queue.status == SaveStatus.FAILED
+    assert save_queue.has_pending()
+
+    save_queue.flush()
+
+    assert save_queue.status == SaveStatus.SAVED
+    assert collection.get_target_path('json').exists()
+
+
+def test_failed_write_does_not_replace_newer_request(directory_manager, mock_car_directory, monkeypatch):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    collection = car.create_collection('Brakes')
+    save_queue = SaveQueue(directory_manager)
+
+    save_file = directory_manager.data_manager.save_file
+
+    def fail_and_request_newer(*args):
+        monkeypatch.setattr(directory_manager.data_manager, 'save_file', save_file)
+        collection.desc = "Newer"
+        save_queue.request_save(car)
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(directory_manager.data_manager, 'save_file', fail_and_request_newer)
+
+    save_queue.request_save(car)
+    save_queue.flush()
+    save_queue.flush()
+
+    assert directory_manager.data_manager.load_file(collection.get_target_path('json'))['desc'] == "Newer"
+
+
+def test_saves_write_snapshot_taken_on_request(directory_manager, mock_car_directory):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    save_queue = SaveQueue(directory_manager)
+
+    save_queue.request_save(car)
+    later = car.create_collection('Later')
+    save_queue.flush()
+
+    assert not later.get_target_path('json').exists()
+
+
+def test_only_changed_files_are_snapshotted(directory_manager, mock_car_directory):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    car.create_collection('Engine').create_component('Belt')
+    collection = car.create_collection('Body')
+    save_queue = SaveQueue(directory_manager)
+
+    save_queue.request_save(car)
+    save_queue.flush()
+    save_queue.request_save(car)
+
+    assert not save_queue.has_pending()
+
+    collection.desc = "Doors"
+    writes, skipped = FILE_WRITES.get_total(), FILE_WRITES_SKIPPED.get_total()
+    save_queue.request_save(car)
+    save_queue.flush()
+
+    assert (FILE_WRITES.get_total() - writes, FILE_WRITES_SKIPPED.get_total() - skipped) == (1, 0)
+
+
+def test_discarded_car_is_snapshotted_again(directory_manager, mock_car_directory):
+    car = directory_manager.load_car_dir(mock_car_directory['car_dir'].name)
+    collection = car.create_collection('Body')
+    save_queue = SaveQueue(directory_manager)
+
+    save_queue.request_save(car)
+    save_queue.discard(car)
+    save_queue.request_save(car)
+    save_queue.flush()
+
+    assert collection.get_target_path('json').exists()
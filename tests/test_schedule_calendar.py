@@ -0,0 +1,90 @@
+import datetime
+import io
+
+import pytest
+
+from carlogger.const import TODAY
+from carlogger.schedule_calendar import iter_calendar, iter_date_occurrences, iter_mileage_occurrences, write_ical, fold_ical_line
+from carlogger.util import date_n_days_from_now, date_string_to_date
+
+START = date_string_to_date(TODAY)
+
+
+def create_scheduled_entry(component, desc: str, rule: str, frequency: int, repeating=True):
+    entry_data = {'desc': desc, 'date': '', 'mileage': 0, 'category': 'check', 'tags': [],
+                  'repeating': repeating, 'rule': rule, 'frequency': frequency}
+    return component.get_entry_by_id(component.create_scheduled_entry(entry_data))
+
+
+@pytest.fixture
+def component(mock_car_full):
+    component = mock_car_full.get_all_components()[0]
+    component.log_entries.clear()
+    component.scheduled_log_entries.clear()
+    component.current_mileage = 10000
+    return component
+
+
+def test_repeating_date_entry_occurrences(component):
+    entry = create_scheduled_entry(component, 'wash', 'date', 10)
+    occurrences = list(iter_date_occurrences(entry, START, START + datetime.timedelta(days=35)))
+
+    assert [(o.date - START).days for o in occurrences] == [10, 20, 30]
+
+
+def test_occurrences_before_range_are_skipped(component):
+    entry = create_scheduled_entry(component, 'wash', 'date', 10)
+    start = START + datetime.timedelta(days=15)
+    occurrences = list(iter_date_occurrences(entry, start, start + datetime.timedelta(days=10)))
+
+    assert [(o.date - START).days for o in occurrences] == [20]
+    assert occurrences[0].index == 1
+
+
+def test_calendar_is_lazy(component, mock_car_full):
+    create_scheduled_entry(component, 'wash', 'date', 1)
+    calendar = iter_calendar([mock_car_full], START, datetime.date.max - datetime.timedelta(days=1))
+
+    assert (next(calendar).date - START).days == 1
+
+
+def test_calendar_merges_entries_in_date_order(component, mock_car_full):
+    for days_ago, mileage in ((20, 9000), (0, 10000)):
+        component.create_entry({'desc': 'refuel', 'date': date_n_days_from_now(-days_ago), 'mileage': mileage,
+                                'category': 'check', 'tags': []})
+
+    create_scheduled_entry(component, 'wash', 'date', 7)
+    create_scheduled_entry(component, 'oil', 'mileage', 500)
+    create_scheduled_entry(component, 'tyres', 'date', 1, repeating=False).date = date_n_days_from_now(12)
+
+    occurrences = list(iter_calendar([mock_car_full], START, START + datetime.timedelta(days=21)))
+
+    assert [(o.entry.desc, (o.date - START).days) for o in occurrences] == \
+           [('wash', 7), ('oil', 10), ('tyres', 12), ('wash', 14), ('oil', 20), ('wash', 21)]
+    assert [o.projected for o in occurrences if o.entry.desc == 'oil'] == [True, True]
+
+
+def test_write_ical(component, mock_car_full):
+    create_scheduled_entry(component, 'wash, rinse', 'date', 7)
+    file = io.StringIO()
+
+    count = write_ical(iter_calendar([mock_car_full], START, START + datetime.timedelta(days=14)), file)
+    lines = file.getvalue().split('\r\n')
+
+    assert count == 2
+    assert lines[0] == 'BEGIN:VCALENDAR'
+    assert lines[-2] == 'END:VCALENDAR'
+    assert any(line.startswith('SUMMARY:') and line.endswith('wash\\, rinse') for line in lines)
+
+
+def test_fold_ical_line():
+    folded = fold_ical_line('X' * 200)
+    assert all(len(line) <= 75 for line in folded.split('\r\n'))
+    assert folded.replace('\r\n ', '').rstrip('\r\n') == 'X' * 200
+
+
+@pytest.mark.parametrize('end', [START + datetime.timedelta(days=365), datetime.date.max])
+def test_mileage_occurrences_with_near_zero_velocity(component, end):
+    entry = create_scheduled_entry(component, 'oil', 'mileage', 500)
+
+    assert list(iter_mileage_occurrences(entry, START, end, 1e-300)) == []
@@ -0,0 +1,111 @@
+import pytest
+
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.scheduler import DueScheduler, DueKind, MileageTriggerIndex
+from carlogger.session import AppSession
+from carlogger.util import date_n_days_from_now
+
+
+def create_scheduled_entry(component, desc: str, rule: str, remaining: int):
+    """Create scheduled entry that is due in 'remaining' days or mileage."""
+    entry_data = {'desc': desc, 'date': date_n_days_from_now(remaining - 1), 'mileage': 0, 'category': 'check',
+                  'tags': [], 'repeating': True, 'rule': rule, 'frequency': 1 if rule == 'date' else remaining}
+    return component.get_entry_by_id(component.create_scheduled_entry(entry_data))
+
+
+@pytest.fixture
+def component(mock_car_full):
+    return mock_car_full.get_all_components()[0]
+
+
+@pytest.fixture
+def scheduler(mock_car_full, component) -> DueScheduler:
+    create_scheduled_entry(component, 'oil', 'date', 30)
+    create_scheduled_entry(component, 'brakes', 'date', -3)
+    create_scheduled_entry(component, 'belt', 'mileage', 5)
+    create_scheduled_entry(component, 'plugs', 'mileage', 1000)
+
+    scheduler = DueScheduler()
+    scheduler.build([mock_car_full])
+    return scheduler
+
+
+def test_next_due_entries_are_ordered_by_time_remaining(scheduler):
+    assert [due.entry.desc for due in scheduler.get_next_due(3)] == ['brakes', 'belt', 'oil']
+    assert [due.remaining for due in scheduler.get_next_due(3)] == [-3, 5, 30]
+
+
+def test_next_due_of_single_kind(scheduler):
+    assert [due.entry.desc for due in scheduler.get_next_due(5, DueKind.mileage)] == ['belt', 'plugs']
+
+
+def test_overdue_entries(scheduler, component):
+    assert [due.entry.desc for due in scheduler.get_overdue()] == ['brakes']
+
+    component.current_mileage += 10
+    scheduler.refresh_mileage(component)
+
+    assert [(due.entry.desc, due.remaining) for due in scheduler.get_overdue()] == [('belt', -5), ('brakes', -3)]
+
+
+def test_scheduler_follows_item_events(mock_car_full, component):
+    event_bus = EventBus()
+    scheduler = DueScheduler(event_bus)
+    scheduler.build([mock_car_full])
+
+    entry = create_scheduled_entry(component, 'coolant', 'date', 10)
+    event_bus.emit(ItemEvent.created, entry)
+    assert scheduler.get_next_due(1)[0].entry is entry
+
+    entry.date = date_n_days_from_now(2)
+    event_bus.emit(ItemEvent.updated, entry)
+    assert scheduler.get_next_due(1)[0].remaining == 2
+
+    event_bus.emit(ItemEvent.deleted, component)
+    assert len(scheduler) == 0
+
+
+def test_removed_entries_are_skipped(scheduler, component):
+    for entry in component.scheduled_log_entries[:3]:
+        scheduler.remove_entry(entry)
+
+    assert [due.entry.desc for due in scheduler.get_next_due(5)] == ['plugs']
+
+
+def test_mileage_update_yields_crossed_thresholds(mock_car_full, component):
+    belt = create_scheduled_entry(component, 'belt', 'mileage', 5)
+    plugs = create_scheduled_entry(component, 'plugs', 'mileage', 1000)
+    create_scheduled_entry(component, 'oil', 'date', 5)
+
+    triggers = MileageTriggerIndex()
+    triggers.build([mock_car_full])
+    mileage = component.current_mileage
+
+    assert triggers.get_crossed(mock_car_full, mileage, mileage + 4) == []
+    assert triggers.get_crossed(mock_car_full, mileage, mileage + 5) == [belt]
+    assert triggers.get_crossed(mock_car_full, mileage + 5, mileage + 2000) == [plugs]
+    assert triggers.get_crossed(mock_car_full, mileage + 2000, mileage) == []
+
+
+def test_car_mileage_update_emits_due_events(directory_manager, mock_car_directory, tmp_path):
+    directory_manager.car_save_dir = tmp_path
+    session = AppSession(directory_manager)
+    car = session.load_car_dir(mock_car_directory['car_dir'].name)
+
+    session.add_new_collection(car.car_info.name, 'Engine')
+    component = session.add_new_component(car.car_info.name, 'Engine', 'Belt')
+    session.add_new_scheduled_entry(car.car_info.name, 'Engine', 'Belt',
+                                    {'desc': 'belt', 'date': '', 'mileage': 0, 'category': 'swap', 'tags': [],
+                                     'repeating': False, 'rule': 'mileage', 'frequency': 100})
+
+    # Adding the entry raised the car mileage to its target, start below it again
+    assert car.car_info.mileage == component.scheduled_log_entries[0].mileage
+    session.update_car_info(car, {'mileage': component.scheduled_log_entries[0].mileage - 100})
+
+    due_entries = []
+    session.event_bus.subscribe(lambda event, item: due_entries.append(item), ItemEvent.due)
+    session.update_car_info(car, {'mileage': car.car_info.mileage + 50})
+    assert due_entries == []
+
+    session.update_car_info(car, {'mileage': car.car_info.mileage + 50})
+    assert due_entries == component.scheduled_log_entries
@@ -0,0 +1,73 @@
+from carlogger.event_bus import EventBus, ItemEvent
+from carlogger.search_index import SearchIndex
+from carlogger.session import AppSession
+
+
+def test_prefix_and_substring_queries_find_entry(mock_car_full):
+    search_index = SearchIndex()
+    search_index.build([mock_car_full])
+    entry = mock_car_full.get_all_entry_logs()[0]
+
+    assert search_index.search('eng')[0].item is entry
+    assert search_index.search('heck')[0].item is entry
+    assert search_index.search('xyz') == []
+
+
+def test_all_query_words_have_to_match(mock_car_full):
+    search_index = SearchIndex()
+    search_index.build([mock_car_full])
+
+    hits = search_index.search('testcomp')
+    assert [hit.item.name for hit in hits] == ['TestComponent']
+    assert hits[0].get_location() == 'ProjectCar/TestCollection/TestComponent'
+
+    assert search_index.search('engine missing') == []
+
+
+def test_exact_name_match_ranks_first(mock_car_full):
+    search_index = SearchIndex()
+    search_index.build([mock_car_full])
+    component = mock_car_full.collections[0].components[0]
+    component.create_entry({'desc': 'Tires swapped', 'date': '01-01-2020', 'mileage': 2000,
+                            'category': 'swap', 'tags': ['tires'], 'custom_info': {'brand': 'Michelin'}})
+    search_index.add_tree(mock_car_full)
+
+    assert search_index.search('tires')[0].field == 'desc'
+    assert search_index.search('michelin')[0].field == 'custom_info'
+
+
+def test_index_follows_item_events(mock_car_full):
+    event_bus = EventBus()
+    search_index = SearchIndex(event_bus)
+    search_index.build([mock_car_full])
+    component = mock_car_full.collections[0].components[0]
+    entry = component.log_entries[0]
+
+    entry.desc = 'Oil change'
+    event_bus.emit(ItemEvent.updated, entry)
+
+    assert search_index.search('oil')[0].item is entry
+    assert search_index.search('checkup') == []
+
+    event_bus.emit(ItemEvent.deleted, component)
+
+    assert search_index.search('oil') == []
+    assert search_index.search('testcomponent') == []
+
+
+def test_nested_collections_of_loaded_car_are_indexed_once(directory_manager, mock_car_directory, tmp_path):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+    session.add_new_collection(car_name, 'Engine Sector')
+    session.add_new_nested_collection(car_name, 'Turbocharger', 'Engine Sector')
+    session.add_new_nested_collection(car_name, 'Intake', 'Turbocharger')
+    session.flush_saves()
+
+    loaded_session = AppSession(directory_manager)
+    loaded_session.load_car_dir(car_name)
+    hits = loaded_session.search('intake')
+
+    assert [hit.get_location() for hit in hits] == [f'{car_name}/Engine Sector/Turbocharger/Intake']
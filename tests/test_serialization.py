@@ -0,0 +1,42 @@
+import pytest
+
+from carlogger.filedata_manager import JSONFiledataManager
+from carlogger.serialization import CODECS, MARSHAL_MAGIC, detect_codec, get_codec
+from carlogger.session import AppSession
+
+
+@pytest.mark.parametrize("codec", list(CODECS))
+def test_codec_round_trip(codec, mock_component_clean, tmp_path):
+    path = tmp_path / "component.json"
+    saver = JSONFiledataManager(codec=codec)
+    saver.save_file(mock_component_clean, path)
+
+    assert JSONFiledataManager().load_file(path) == mock_component_clean.to_json()
+    assert detect_codec(path.read_bytes()).decode(path.read_bytes()) == mock_component_clean.to_json()
+
+
+def test_compact_and_marshal_are_smaller(mock_component_clean):
+    data = mock_component_clean.to_json()
+    sizes = {name: len(codec.encode(data)) for name, codec in CODECS.items()}
+
+    assert sizes['marshal'] < sizes['json-pretty']
+    assert sizes['json-compact'] < sizes['json-pretty']
+    assert get_codec('marshal').encode(data).startswith(MARSHAL_MAGIC)
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        get_codec('yaml')
+
+
+def test_save_directory_codec_conversion(directory_manager, mock_car_directory):
+    session = AppSession(directory_manager)
+    car = session.load_car_dir(mock_car_directory['car_dir'].name)
+    session.add_new_collection(car.car_info.name, 'Engine')
+
+    session.convert_save_codec('marshal')
+
+    assert directory_manager.create_car_info_path(car).read_bytes().startswith(MARSHAL_MAGIC)
+    assert AppSession(directory_manager).directory_manager.save_format.codec == 'marshal'
+    assert directory_manager.data_manager.codec is CODECS['marshal']
+    assert directory_manager.load_car_dir(car.car_info.name).collections[0].name == 'Engine'
@@ -1,5 +1,9 @@
 import os
 
+from carlogger.event_bus import ItemEvent
+from carlogger.items.car import Car
+from carlogger.items.car_info import CarInfo
+from carlogger.metrics import FILE_DELETES, FILE_WRITES
 from carlogger.session import AppSession
 
 
@@ -119,6 +123,31 @@ def test_car_children_are_cleared(directory_manager, mock_car_directory, tmp_pat
     assert sum([len(session.selected_car.collections), len(session.selected_car.get_all_entry_logs())]) == 0
 
 
+def test_car_children_are_deleted_with_a_single_save(directory_manager, mock_car_directory, tmp_path):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    for collection_name in ('Engine', 'Body'):
+        session.add_new_collection(car_name, collection_name)
+
+        for component_name in ('SparkPlug', 'Belt', 'Filter'):
+            session.add_new_component(car_name, collection_name, component_name)
+
+    session.add_new_nested_collection(car_name, 'Turbocharger', 'Engine')
+    saves = directory_manager.save_report.saves
+
+    assert len(list(mock_car_directory['car_dir'].glob('c*/*'))) == 9
+
+    session.delete_car_children(session.selected_car)
+
+    assert directory_manager.save_report.saves - saves == 1
+    assert session.selected_car.collections == []
+    assert list(mock_car_directory['car_dir'].glob('c*/*')) == []
+
+
 def test_collection_children_are_cleared(directory_manager, mock_car_directory, tmp_path, mock_log_entry):
     car_name = mock_car_directory['car_dir'].name
     directory_manager.car_save_dir = tmp_path
@@ -136,6 +165,61 @@ def test_collection_children_are_cleared(directory_manager, mock_car_directory,
     assert len(parent_coll.children) == 0
 
 
+def test_nested_collection_components_are_deleted_with_collection_children(directory_manager, mock_car_directory,
+                                                                           tmp_path, mock_log_entry):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    engine = session.add_new_collection(car_name, 'Engine')
+    session.add_new_nested_collection(car_name, 'Turbo', 'Engine')
+    wastegate = session.add_new_component(car_name, 'Turbo', 'Wastegate')
+    session.add_new_entry(car_name, 'Turbo', 'Wastegate', mock_log_entry)
+    entry = wastegate.log_entries[0]
+
+    deleted = []
+    session.event_bus.subscribe(lambda event, item: deleted.append(item), ItemEvent.deleted)
+
+    session.delete_collection_children(car_name, engine)
+
+    assert not wastegate.get_target_path('json').exists()
+    assert entry in deleted and wastegate in deleted
+    assert list(mock_car_directory['car_dir'].glob('components/*')) == []
+
+
+def test_bulk_deletes_notify_batch_subscribers_once(directory_manager, mock_car_directory, tmp_path, mock_log_entry):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    session.add_new_collection(car_name, 'Engine')
+    session.add_new_nested_collection(car_name, 'Turbo', 'Engine')
+    spark_plug = session.add_new_component(car_name, 'Engine', 'SparkPlug')
+    session.add_new_component(car_name, 'Turbo', 'Wastegate')
+
+    for _ in range(3):
+        session.add_new_entry(car_name, 'Engine', 'SparkPlug', mock_log_entry)
+
+    batches = []
+    session.event_bus.subscribe_batch(lambda event, items: batches.append(items), ItemEvent.deleted)
+
+    entries = list(spark_plug.log_entries)
+    session.delete_entries_by_id(car_name, [entry.id for entry in entries[:2]], spark_plug)
+
+    assert batches == [entries[:2]]
+
+    session.delete_collection(car_name, 'Engine')
+
+    engine, turbo = batches[1][-2:]
+    assert len(batches) == 2
+    assert entries[2] in batches[1] and spark_plug in batches[1]
+    assert {engine.name, turbo.name} == {'Engine', 'Turbo'}
+
+
 def test_component_children_are_cleared(directory_manager, mock_car_directory, tmp_path, mock_log_entry):
     car_name = mock_car_directory['car_dir'].name
     directory_manager.car_save_dir = tmp_path
@@ -151,3 +235,134 @@ def test_component_children_are_cleared(directory_manager, mock_car_directory, t
     session.delete_component_children(comp, session.selected_car)
 
     assert len(comp.log_entries) == 0
+
+
+def test_renamed_collection_rewrites_only_its_file(directory_manager, mock_car_directory, tmp_path):
+    car_name = mock_car_directory['car_dir'].name
+
+    directory_manager.car_save_dir = tmp_path
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    collection = session.add_new_collection(car_name, 'Test')
+    session.add_new_component(car_name, 'Test', 'SparkPlug')
+    path = collection.get_target_path('json')
+
+    session.update_component_or_collection(session.selected_car, collection, {'name': 'Renamed'})
+
+    assert directory_manager.last_save_report.written == 1
+    assert collection.get_target_path('json') == path
+
+    car = directory_manager.load_car_dir(car_name)
+    assert [comp.name for comp in car.get_collection_by_name('Renamed').components] == ['SparkPlug']
+
+
+def test_reparented_component_rewrites_both_parents(directory_manager, mock_car_directory, tmp_path):
+    car_name = mock_car_directory['car_dir'].name
+
+    directory_manager.car_save_dir = tmp_path
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    session.add_new_collection(car_name, 'Test')
+    target = session.add_new_collection(car_name, 'Target')
+    component = session.add_new_component(car_name, 'Test', 'SparkPlug')
+
+    session.update_component_or_collection(session.selected_car, component, {'parent': target})
+
+    assert directory_manager.last_save_report.written == 2
+
+    car = directory_manager.load_car_dir(car_name)
+    assert [comp.name for comp in car.get_collection_by_name('Target').components] == ['SparkPlug']
+    assert car.get_collection_by_name('Test').components == []
+
+
+def test_reparented_collection_moves_only_files_with_changed_paths(directory_manager, mock_car_directory, tmp_path,
+                                                                   mock_car_info):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+    session.add_new_collection(car_name, 'Engine')
+    session.add_new_component(car_name, 'Engine', 'SparkPlug')
+    session.add_new_nested_collection(car_name, 'Turbo', 'Engine')
+    session.add_new_component(car_name, 'Turbo', 'Wastegate')
+    session.flush_saves()
+
+    directory_manager.create_car_directory(Car(CarInfo(**{**mock_car_info, 'name': 'OtherCar'}),
+                                               path=tmp_path / 'OtherCar'))
+    session = AppSession(directory_manager)
+    car = session.load_car_dir(car_name)
+    other_car = session.load_car_dir('OtherCar')
+    engine = car.get_collection_by_name('Engine')
+    session.save_car('OtherCar')
+    session.flush_saves()
+
+    writes, deletes = FILE_WRITES.get_total(), FILE_DELETES.get_total()
+    session.update_component_or_collection(car, engine, {'parent': car})
+    session.flush_saves()
+
+    assert (FILE_WRITES.get_total() - writes, FILE_DELETES.get_total() - deletes) == (0, 0)
+
+    writes, deletes = FILE_WRITES.get_total(), FILE_DELETES.get_total()
+    session.update_component_or_collection(car, engine, {'parent': other_car})
+    session.flush_saves()
+
+    assert (FILE_WRITES.get_total() - writes, FILE_DELETES.get_total() - deletes) == (4, 4)
+
+    loaded_car = directory_manager.load_car_dir('OtherCar')
+    assert [comp.name for comp in loaded_car.get_collection_by_name('Engine').components] == ['SparkPlug']
+    assert [comp.name for comp in loaded_car.get_collection_by_name('Turbo').components] == ['Wastegate']
+    assert directory_manager.load_car_dir(car_name).collections == []
+
+
+def test_exported_collection_is_imported_with_children(directory_manager, mock_car_directory, tmp_path,
+                                                       mock_car_info, mock_log_entry):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    session.add_new_collection(car_name, 'Engine')
+    session.add_new_component(car_name, 'Engine', 'SparkPlug')
+    session.add_new_entry(car_name, 'Engine', 'SparkPlug', mock_log_entry)
+    session.add_new_nested_collection(car_name, 'Turbo', 'Engine')
+    session.add_new_component(car_name, 'Turbo', 'Wastegate')
+
+    export_path = tmp_path / 'engine.json'
+    session.export_item_to_file(session.selected_car.get_collection_by_name('Engine'), export_path)
+
+    directory_manager.create_car_directory(Car(CarInfo(**{**mock_car_info, 'name': 'OtherCar'}),
+                                               path=tmp_path / 'OtherCar'))
+    session.import_item_from_file('collection', export_path, car='OtherCar')
+
+    other_car = directory_manager.load_car_dir('OtherCar')
+    engine = other_car.get_collection_by_name('Engine')
+    turbo = other_car.get_collection_by_name('Turbo')
+
+    assert [(comp.name, len(comp.log_entries)) for comp in engine.components] == [('SparkPlug', 1)]
+    assert [comp.name for comp in turbo.components] == ['Wastegate']
+    assert turbo.parent_collection is engine
+
+
+def test_collection_file_of_save_directory_is_imported_with_children(directory_manager, mock_car_directory,
+                                                                     tmp_path, mock_car_info):
+    car_name = mock_car_directory['car_dir'].name
+    directory_manager.car_save_dir = tmp_path
+
+    session = AppSession(directory_manager)
+    session.load_car_dir(car_name)
+
+    engine = session.add_new_collection(car_name, 'Engine')
+    session.add_new_component(car_name, 'Engine', 'SparkPlug')
+
+    directory_manager.create_car_directory(Car(CarInfo(**{**mock_car_info, 'name': 'OtherCar'}),
+                                               path=tmp_path / 'OtherCar'))
+    session.import_item_from_file('collection', engine.get_target_path('json'), car='OtherCar')
+
+    other_engine = directory_manager.load_car_dir('OtherCar').get_collection_by_name('Engine')
+
+    assert [comp.name for comp in other_engine.components] == ['SparkPlug']
+    assert other_engine.id != engine.id
@@ -0,0 +1,82 @@
+import pytest
+
+from carlogger.items.item_filter import ItemFilter
+from carlogger.items.tag_index import FleetTagIndex
+
+
+@pytest.fixture
+def tagged_component(mock_car_full, mock_log_entry):
+    comp = mock_car_full.get_all_components()[0]
+    comp.create_entry({**mock_log_entry, 'tags': ['Warranty', 'oil']})
+    comp.create_entry({**mock_log_entry, 'tags': ['recall']})
+    return comp
+
+
+def test_created_entries_are_indexed(mock_car_full, tagged_component):
+    assert len(mock_car_full.tag_index.get_entries('warranty')) == 1
+    assert mock_car_full.tag_index.get_tag_counts() == {'warranty': 1, 'oil': 1, 'recall': 1}
+
+
+def test_updated_entry_is_reindexed(mock_car_full, tagged_component):
+    entry = mock_car_full.tag_index.get_entries('recall')[0]
+    tagged_component.update_entry(entry.id, {'tags': ['oil']})
+
+    assert mock_car_full.tag_index.get_entries('recall') == []
+    assert mock_car_full.tag_index.get_tag_counts()['oil'] == 2
+
+
+def test_deleted_entry_is_removed_from_index(mock_car_full, tagged_component):
+    entry = mock_car_full.tag_index.get_entries('recall')[0]
+    tagged_component.delete_entry_by_id(entry.id)
+
+    assert 'recall' not in mock_car_full.tag_index.tags
+
+
+def test_deleted_component_entries_are_removed_from_index(mock_car_full, tagged_component):
+    tagged_component.parent.delete_component(tagged_component.name)
+    assert mock_car_full.tag_index.tags == []
+
+
+def test_bulk_deleted_entries_are_removed_from_index(mock_car_full, tagged_component):
+    oil_entry = mock_car_full.tag_index.get_entries('oil')[0]
+    deleted = tagged_component.delete_entries_by_id([oil_entry.id, 'missing'])
+
+    assert deleted == [oil_entry]
+    assert mock_car_full.tag_index.get_tag_counts() == {'recall': 1}
+
+
+def test_deleted_collection_entries_are_removed_from_index(mock_car_full, tagged_component):
+    mock_car_full.delete_collections([tagged_component.parent.name])
+    assert mock_car_full.tag_index.tags == []
+
+
+def test_get_entries_with_any_tag(mock_car_full, tagged_component):
+    assert len(mock_car_full.tag_index.get_entries_with_any(['warranty', 'recall', 'missing'])) == 2
+
+
+@pytest.mark.parametrize('filters,expected',
+                         [(["tag=oil"], 1),
+                          (["tags=OIL"], 1),
+                          (["tag in (warranty, recall)"], 2),
+                          (["tag in (missing)"], 0)])
+def test_filter_entries_by_tag(mock_car_full, tagged_component, filters, expected):
+    items = ItemFilter().filter_items(mock_car_full.get_all_entry_logs(), filters)
+    assert len(items) == expected
+
+
+@pytest.mark.parametrize('filter_str,expected',
+                         [("tag=oil", ('oil',)),
+                          ("tag in (a,b)", ('a', 'b')),
+                          ("mileage>100", None)])
+def test_get_filter_tags(filter_str, expected):
+    assert ItemFilter().get_filter_tags(filter_str) == expected
+
+
+def test_fleet_tag_counts(mock_car_full, tagged_component, mock_cars_full, mock_log_entry):
+    other_car = mock_cars_full[0]
+    other_car.create_collection('Body').create_component('Door').create_entry({**mock_log_entry, 'tags': ['oil']})
+
+    fleet_index = FleetTagIndex([mock_car_full, other_car])
+
+    assert fleet_index.get_tag_counts()['oil'] == 2
+    assert len(fleet_index.get_entries('oil')) == 2
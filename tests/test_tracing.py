@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from carlogger.session import AppSession
+from carlogger.tracing import Tracer, TRACER
+
+
+@pytest.fixture
+def tracer():
+    TRACER.clear()
+    TRACER.enable()
+    yield TRACER
+    TRACER.disable()
+    TRACER.clear()
+
+
+def test_nested_spans_record_parent():
+    tracer = Tracer()
+    tracer.enable()
+
+    with tracer.span('outer', 'test') as outer:
+        with tracer.span('inner', 'test', item='Engine') as inner:
+            pass
+
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert tracer.get_children(outer) == [inner]
+    assert outer.duration >= inner.duration
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+
+    with tracer.span('outer'):
+        pass
+
+    assert tracer.spans == []
+
+
+def test_chrome_trace_export(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+
+    with tracer.span('outer', 'test'):
+        with tracer.span('inner', 'test', item='Engine'):
+            pass
+
+    tracer.dump(tmp_path / 'trace.json')
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+
+    assert [event['name'] for event in events] == ['outer', 'inner']
+    assert all(event['ph'] == 'X' for event in events)
+    assert events[0]['ts'] == 0
+    assert events[1]['args']['item'] == 'Engine'
+
+
+def test_deleting_collection_traces_single_save(tracer, directory_manager, mock_car_directory):
+    session = AppSession(directory_manager)
+    car = session.load_car_dir(mock_car_directory['car_dir'].name)
+    session.add_new_collection(car.car_info.name, 'Engine')
+    session.add_new_component(car.car_info.name, 'Engine', 'Belt')
+    tracer.clear()
+
+    session.delete_collection(car.car_info.name, 'Engine')
+
+    root = next(span for span in tracer.spans if span.parent_id is None)
+    children = [span.name for span in tracer.get_children(root)]
+
+    assert root.name == 'AppSession.delete_collection'
+    assert children.count('DirectoryManager.update_car_directory') == 1
+    assert [span.name for span in tracer.spans].count('DirectoryManager.update_car_directory') == 1